@@ -1,15 +1,8 @@
 #!/bin/bash
 set -e
 
-echo "🧹 Cleaning previous builds..."
-rm -rf src/build 2>/dev/null || true
+echo "🔨 Building trimmed web bundle..."
+python src/build_web.py build
 
-echo "📁 Creating build directory..."
-mkdir -p src/build/web
-
-echo "🔨 Building with pygbag..."
-python -m pygbag --build src/main.py
-
-echo "🌐 Starting server on port 3496..."
-cd src/build/web
-python -m http.server 3496
\ No newline at end of file
+echo "🌐 Starting compressed server on port 3496..."
+python src/build_web.py serve --port 3496
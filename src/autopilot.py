@@ -0,0 +1,201 @@
+"""
+Emoji Flappy - Autopilot
+REQ-015: Autopilot for soak testing
+
+A bot that plays the game through Player.flap. It keeps a per-tick flap plan
+for the next few hundred milliseconds and re-validates it every tick; when the
+plan no longer survives, a depth-first lookahead over the headless physics
+branches on flap/no-flap every few ticks and prunes any branch that hits an
+obstacle or the screen edge. A node budget keeps every decision well inside
+the 16 ms frame.
+"""
+
+import time
+from config import (
+	PHYSICS_TICK_RATE, AUTOPILOT_HORIZON, AUTOPILOT_BRANCH_TICKS,
+	AUTOPILOT_NODE_BUDGET, AUTOPILOT_MARGIN, SOAK_REPORT_INTERVAL
+)
+from reachability import stepPhysics
+
+
+class Autopilot:
+	"""
+	Lookahead search bot (REQ-015).
+	decide() returns True when the player should flap this tick.
+	"""
+
+	def __init__(self, game, horizon=AUTOPILOT_HORIZON, branch_ticks=AUTOPILOT_BRANCH_TICKS,
+				 node_budget=AUTOPILOT_NODE_BUDGET):
+		self.game = game
+		self.horizon = horizon
+		self.branch_ticks = branch_ticks
+		self.node_budget = node_budget
+		self.dt = 1.0 / PHYSICS_TICK_RATE
+		self.tuning = game.tuning
+		self.scroll_step = self.tuning.scroll_speed * self.dt
+
+		# Per-decision search state
+		self.obstacles = []
+		self.target = 0.0
+		self.nodes = 0
+		self.plan = [False] * horizon
+		self.path = []
+		self.best_ticks = -1
+		self.best_path = []
+
+		# Soak stats
+		self.decisions = 0
+		self.decide_total = 0.0
+		self.decide_max = 0.0
+		self.runs = 0
+		self.resetReport()
+
+	def resetReport(self):
+		self.report_time = 0.0
+		self.report_frames = 0
+		self.report_frame_max = 0.0
+
+	def decide(self):
+		"""
+		Return whether to flap this tick.
+		The previous plan is kept while it still survives the full horizon;
+		otherwise a new plan is searched for.
+		"""
+		start = time.perf_counter()
+		self.prepare()
+		player = self.game.player
+
+		self.plan = self.plan[1:] + [False]
+		if self.simulatePlan(player.y, player.velocity, self.plan) < self.horizon:
+			self.plan = self.findPlan(player.y, player.velocity)
+
+		elapsed = time.perf_counter() - start
+		self.decisions += 1
+		self.decide_total += elapsed
+		self.decide_max = max(self.decide_max, elapsed)
+		return self.plan[0]
+
+	def prepare(self):
+		"""Snapshot player bounds and the obstacles still ahead for this decision."""
+		player = self.game.player
+		rect = player.getRect()
+		self.half_height = max(rect.height, player.size) / 2
+		self.player_left = rect.left
+		self.player_right = rect.right
+		self.screen_height = self.game.screen_height
+
+		# REQ-020, REQ-021: Follow live tuning reloads and difficulty tiers
+		if self.game.tuning is not self.tuning:
+			self.tuning = self.game.tuning
+			self.scroll_step = self.tuning.scroll_speed * self.dt
+
+		# Only obstacles the player has not cleared yet can be hit
+		self.obstacles = [
+			(o.x, o.emoji_width, o.gap_top + AUTOPILOT_MARGIN, o.gap_bottom - AUTOPILOT_MARGIN)
+			for o in self.game.obstacles if o.x + o.emoji_width > self.player_left
+		]
+		# Steer towards the next gap not yet entered; the search keeps the
+		# player clear of any obstacle it is currently flying through
+		ahead = [o for o in self.obstacles if o[0] >= self.player_right]
+		if ahead:
+			nearest = min(ahead, key=lambda o: o[0])
+			self.target = (nearest[2] + nearest[3]) / 2
+		elif self.obstacles:
+			self.target = (self.obstacles[0][2] + self.obstacles[0][3]) / 2
+		else:
+			self.target = self.screen_height / 2
+
+	def simulatePlan(self, y, velocity, plan):
+		"""Ticks survived when following a per-tick flap plan."""
+		for tick, flap in enumerate(plan):
+			y, velocity = stepPhysics(y, velocity, flap, self.dt, self.tuning)
+			if self.collides(y, tick + 1):
+				return tick
+		return len(plan)
+
+	def findPlan(self, y, velocity):
+		"""Depth-first search for a plan surviving the horizon (or the longest-lived one)."""
+		self.nodes = 0
+		self.path = []
+		self.best_ticks = -1
+		self.best_path = []
+		preferred = y > self.target
+		for action in (preferred, not preferred):
+			if self.search(y, velocity, 0, action) >= self.horizon:
+				break
+
+		plan = [False] * self.horizon
+		for tick in self.best_path:
+			plan[tick] = True
+		return plan
+
+	def search(self, y, velocity, tick, flap):
+		"""
+		Ticks survived (capped at the horizon) when taking `flap` now and
+		playing the best continuation afterwards. Flap ticks of the longest
+		surviving branch are kept in best_path.
+		"""
+		self.nodes += 1
+		if flap:
+			self.path.append(tick)
+		try:
+			for i in range(self.branch_ticks):
+				y, velocity = stepPhysics(y, velocity, flap and i == 0, self.dt, self.tuning)
+				if self.collides(y, tick + i + 1):
+					return self.finishBranch(tick + i)
+			tick += self.branch_ticks
+			if tick >= self.horizon or self.nodes >= self.node_budget:
+				return self.finishBranch(tick)
+
+			preferred = y > self.target
+			best = tick
+			for action in (preferred, not preferred):
+				ticks = self.search(y, velocity, tick, action)
+				if ticks >= self.horizon:
+					return ticks
+				best = max(best, ticks)
+			return best
+		finally:
+			if flap:
+				self.path.pop()
+
+	def finishBranch(self, ticks):
+		"""Remember the branch if it lived longest so far."""
+		if ticks > self.best_ticks:
+			self.best_ticks = ticks
+			self.best_path = list(self.path)
+		return ticks
+
+	def collides(self, y, tick):
+		"""Check a predicted player centre against the screen and obstacles at a future tick."""
+		top = y - self.half_height
+		bottom = y + self.half_height
+		if top <= 0 or bottom >= self.screen_height:
+			return True
+
+		shift = self.scroll_step * tick
+		for x, width, gap_top, gap_bottom in self.obstacles:
+			left = x - shift
+			if left < self.player_right and left + width > self.player_left:
+				if top < gap_top or bottom > gap_bottom:
+					return True
+		return False
+
+	def recordFrame(self, dt):
+		"""Accumulate frame timing and print a soak report every SOAK_REPORT_INTERVAL."""
+		self.report_time += dt
+		self.report_frames += 1
+		self.report_frame_max = max(self.report_frame_max, dt)
+		if self.report_time >= SOAK_REPORT_INTERVAL:
+			print(self.getReport())
+			self.resetReport()
+
+	def getReport(self):
+		"""One-line summary of frame-time drift and search cost."""
+		frame_mean = self.report_time / self.report_frames * 1000.0 if self.report_frames else 0.0
+		decide_mean = self.decide_total / self.decisions * 1000.0 if self.decisions else 0.0
+		return (
+			f"[SOAK] runs={self.runs} decisions={self.decisions} "
+			f"frame_mean={frame_mean:.2f}ms frame_max={self.report_frame_max * 1000.0:.2f}ms "
+			f"decide_mean={decide_mean:.3f}ms decide_max={self.decide_max * 1000.0:.3f}ms"
+		)
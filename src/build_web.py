@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Emoji Flappy - Web Bundle Build
+REQ-023: Trimmed web bundle and compressed static server
+
+Builds the pygbag bundle from a staged copy of the app instead of the whole
+src/ folder. Only modules reachable from main.py are staged, so the headless
+server, verifier and tools such as this one stay out of the bundle. When the
+local interpreter matches the pygbag runtime, modules other than main.py are
+staged as optimised, sourceless bytecode; asset folders are packed alongside.
+After the build every compressible file gets a precompressed .gz copy and a
+size and load-time report is written.
+
+The optional static server sends the .gz bodies to browsers that accept gzip,
+with Cache-Control and ETag headers so reloads revalidate instead of
+downloading the bundle again.
+
+Usage:
+	python src/build_web.py build [--source-only]
+	python src/build_web.py serve [--port PORT]
+	python src/build_web.py report
+"""
+
+import argparse
+import ast
+import functools
+import gzip
+import http.server
+import json
+import os
+import py_compile
+import shutil
+import subprocess
+import sys
+from http import HTTPStatus
+from config import (
+	WEB_APP_NAME, WEB_PYTHON_VERSION, WEB_OPTIMIZE, WEB_ASSET_DIRS, WEB_COMPRESS_SUFFIXES,
+	WEB_COMPRESS_MIN_BYTES, WEB_CACHE_MAX_AGE, WEB_PORT, WEB_LOAD_PROFILES
+)
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+BUILD_DIR = os.path.join(os.path.dirname(SRC_DIR), "build")
+STAGE_DIR = os.path.join(BUILD_DIR, "stage", WEB_APP_NAME)
+WEB_DIR = os.path.join(BUILD_DIR, "web")
+REPORT_PATH = os.path.join(BUILD_DIR, "web_report.json")
+
+
+def findImports(path):
+	"""Top-level names a module imports, including imports deferred into functions."""
+	with open(path, "r", encoding="utf-8") as f:
+		tree = ast.parse(f.read(), path)
+	names = set()
+	for node in ast.walk(tree):
+		if isinstance(node, ast.Import):
+			names.update(alias.name.split(".")[0] for alias in node.names)
+		elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+			names.add(node.module.split(".")[0])
+	return names
+
+
+def collectModules(entry="main", src_dir=SRC_DIR):
+	"""Names of the local modules reachable from entry, sorted."""
+	found = set()
+	pending = [entry]
+	while pending:
+		name = pending.pop()
+		path = os.path.join(src_dir, name + ".py")
+		if name in found or not os.path.isfile(path):
+			continue
+		found.add(name)
+		pending.extend(findImports(path))
+	return sorted(found)
+
+
+def stageApp(stage_dir=STAGE_DIR, src_dir=SRC_DIR, bytecode=True,
+			 python_version=WEB_PYTHON_VERSION):
+	"""
+	Copy the trimmed app into stage_dir.
+
+	Args:
+		bytecode: Stage modules as sourceless .pyc files when the local interpreter
+			matches python_version; main.py always stays source for pygbag to run
+
+	Returns:
+		dict with the staged "modules", the "skipped" ones, whether "bytecode" was
+		written and the packed "assets" folders
+	"""
+	shutil.rmtree(stage_dir, ignore_errors=True)
+	os.makedirs(stage_dir)
+
+	modules = collectModules("main", src_dir)
+	skipped = sorted(
+		name[:-3] for name in os.listdir(src_dir)
+		if name.endswith(".py") and name[:-3] not in modules
+	)
+
+	compiled = bytecode and tuple(sys.version_info[:2]) == tuple(python_version)
+	if bytecode and not compiled:
+		print(f"[WARNING] Python {sys.version_info[0]}.{sys.version_info[1]} cannot write "
+			  f"bytecode for the {python_version[0]}.{python_version[1]} web runtime; "
+			  "staging sources")
+
+	for name in modules:
+		source = os.path.join(src_dir, name + ".py")
+		if compiled and name != "main":
+			py_compile.compile(source, cfile=os.path.join(stage_dir, name + ".pyc"),
+							   dfile=name + ".py", doraise=True, optimize=WEB_OPTIMIZE)
+		else:
+			shutil.copy2(source, stage_dir)
+
+	assets = []
+	for folder in WEB_ASSET_DIRS:
+		path = os.path.join(src_dir, folder)
+		if os.path.isdir(path):
+			shutil.copytree(path, os.path.join(stage_dir, folder))
+			assets.append(folder)
+
+	return {"modules": modules, "skipped": skipped, "bytecode": compiled, "assets": assets}
+
+
+def runPygbag(stage_dir=STAGE_DIR):
+	"""Build the staged app with pygbag; returns the folder pygbag wrote the bundle to."""
+	try:
+		import pygbag  # noqa: F401 - only needed for this step
+	except ImportError:
+		raise RuntimeError("pygbag is not installed (pip install pygbag)") from None
+	subprocess.run([sys.executable, "-m", "pygbag", "--build", stage_dir], check=True)
+	return os.path.join(stage_dir, "build", "web")
+
+
+def iterFiles(web_dir):
+	"""Relative paths of the bundle files, excluding precompressed copies."""
+	for root, _, names in os.walk(web_dir):
+		for name in sorted(names):
+			if not name.endswith(".gz"):
+				yield os.path.relpath(os.path.join(root, name), web_dir)
+
+
+def compressBundle(web_dir=WEB_DIR):
+	"""
+	Write a gzip copy next to every compressible file where it saves space.
+	Returns the relative paths that got one.
+	"""
+	compressed = []
+	for name in iterFiles(web_dir):
+		path = os.path.join(web_dir, name)
+		if os.path.exists(path + ".gz"):
+			os.remove(path + ".gz")
+		if (not name.endswith(WEB_COMPRESS_SUFFIXES)
+				or os.path.getsize(path) < WEB_COMPRESS_MIN_BYTES):
+			continue
+		with open(path, "rb") as f:
+			data = f.read()
+		packed = gzip.compress(data, compresslevel=9, mtime=0)
+		if len(packed) < len(data):
+			with open(path + ".gz", "wb") as f:
+				f.write(packed)
+			compressed.append(name)
+	return compressed
+
+
+def estimateLoadSeconds(size, requests, mbps, rtt_ms):
+	"""Transfer time plus a connection round trip and one round trip per request."""
+	return size * 8 / (mbps * 1e6) + (requests + 1) * rtt_ms / 1000.0
+
+
+def getBundleReport(web_dir=WEB_DIR):
+	"""Per-file raw and served sizes and estimated first-load times per connection profile."""
+	files = []
+	for name in iterFiles(web_dir):
+		path = os.path.join(web_dir, name)
+		raw = os.path.getsize(path)
+		served = os.path.getsize(path + ".gz") if os.path.exists(path + ".gz") else raw
+		files.append({"file": name, "bytes": raw, "served_bytes": served})
+
+	raw_total = sum(f["bytes"] for f in files)
+	served_total = sum(f["served_bytes"] for f in files)
+	loads = [
+		{
+			"profile": profile,
+			"raw_s": round(estimateLoadSeconds(raw_total, len(files), mbps, rtt), 3),
+			"served_s": round(estimateLoadSeconds(served_total, len(files), mbps, rtt), 3),
+		}
+		for profile, mbps, rtt in WEB_LOAD_PROFILES
+	]
+	return {"files": files, "bytes": raw_total, "served_bytes": served_total, "loads": loads}
+
+
+def formatBundleReport(report):
+	lines = [f"[BUNDLE] {len(report['files'])} files, {report['bytes'] / 1024:,.1f} KiB, "
+			 f"{report['served_bytes'] / 1024:,.1f} KiB compressed"]
+	for f in report["files"]:
+		lines.append(f"  {f['file']:<32} {f['bytes'] / 1024:>9,.1f} KiB "
+					 f"{f['served_bytes'] / 1024:>9,.1f} KiB")
+	for load in report["loads"]:
+		lines.append(f"[BUNDLE] Estimated first load on {load['profile']}: "
+					 f"{load['raw_s']:.2f}s plain, {load['served_s']:.2f}s compressed")
+	lines.append("[BUNDLE] The pygbag runtime loads from its CDN and is not included; "
+				 "the browser console reports the measured time to first frame")
+	return "\n".join(lines)
+
+
+def build(bytecode=True):
+	"""Stage, build with pygbag, copy to build/web, precompress and report."""
+	stage = stageApp(bytecode=bytecode)
+	print(f"[INFO] Staged {len(stage['modules'])} modules, left out: "
+		  f"{', '.join(stage['skipped']) or 'none'}")
+
+	output = runPygbag()
+	shutil.rmtree(WEB_DIR, ignore_errors=True)
+	shutil.copytree(output, WEB_DIR)
+	compressBundle(WEB_DIR)
+
+	report = dict(getBundleReport(WEB_DIR), stage=stage)
+	with open(REPORT_PATH, "w", encoding="utf-8") as f:
+		json.dump(report, f, indent=2)
+	print(formatBundleReport(report))
+	print(f"[INFO] Report written to {REPORT_PATH}")
+	return report
+
+
+class BundleRequestHandler(http.server.SimpleHTTPRequestHandler):
+	"""
+	Static file handler for the bundle (REQ-023).
+	Serves precompressed bodies when accepted and answers matching ETags with 304.
+	"""
+
+	def send_head(self):
+		path = self.translate_path(self.path)
+		if os.path.isdir(path):
+			path = os.path.join(path, "index.html")
+		if not os.path.isfile(path):
+			self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+			return None
+
+		stat = os.stat(path)
+		etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+		# The page is revalidated on every load so a rebuild is picked up at once
+		cache_control = ("no-cache" if path.endswith(".html")
+						 else f"public, max-age={WEB_CACHE_MAX_AGE}")
+
+		if self.headers.get("If-None-Match") == etag:
+			self.send_response(HTTPStatus.NOT_MODIFIED)
+			self.send_header("ETag", etag)
+			self.send_header("Cache-Control", cache_control)
+			self.end_headers()
+			return None
+
+		body_path = path
+		encoding = None
+		if "gzip" in self.headers.get("Accept-Encoding", "") and os.path.isfile(path + ".gz"):
+			body_path = path + ".gz"
+			encoding = "gzip"
+
+		f = open(body_path, "rb")
+		self.send_response(HTTPStatus.OK)
+		self.send_header("Content-Type", self.guess_type(path))
+		if encoding is not None:
+			self.send_header("Content-Encoding", encoding)
+		self.send_header("Content-Length", str(os.fstat(f.fileno()).st_size))
+		self.send_header("Vary", "Accept-Encoding")
+		self.send_header("ETag", etag)
+		self.send_header("Cache-Control", cache_control)
+		self.end_headers()
+		return f
+
+
+def createServer(web_dir=WEB_DIR, host="", port=WEB_PORT):
+	"""Threaded static server for the built bundle."""
+	handler = functools.partial(BundleRequestHandler, directory=web_dir)
+	return http.server.ThreadingHTTPServer((host, port), handler)
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Build and serve the Emoji Flappy web bundle")
+	commands = parser.add_subparsers(dest="command", required=True)
+	build_parser = commands.add_parser("build", help="stage, build, compress and report")
+	build_parser.add_argument("--source-only", action="store_true",
+							  help="stage sources instead of precompiled bytecode")
+	serve_parser = commands.add_parser("serve", help="serve build/web with compression")
+	serve_parser.add_argument("--port", type=int, default=WEB_PORT)
+	commands.add_parser("report", help="report on the existing build/web")
+	args = parser.parse_args()
+
+	if args.command == "build":
+		try:
+			build(bytecode=not args.source_only)
+		except (RuntimeError, subprocess.CalledProcessError) as e:
+			print(f"[ERROR] Web build failed: {e}")
+			return 1
+	elif args.command == "report":
+		print(formatBundleReport(getBundleReport(WEB_DIR)))
+	else:
+		server = createServer(WEB_DIR, port=args.port)
+		print(f"[INFO] Serving {WEB_DIR} on port {args.port}")
+		try:
+			server.serve_forever()
+		except KeyboardInterrupt:
+			pass
+		finally:
+			server.server_close()
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -10,6 +10,21 @@ SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 BG_COLOR = (255, 255, 255)
 
+
+def get_env_float(name, default):
+	"""Read a float override from the environment, ignoring invalid values."""
+	try:
+		return float(os.environ.get(name, default))
+	except ValueError:
+		print(f"[WARNING] Ignoring invalid {name}={os.environ[name]!r}")
+		return default
+
+
+# Resolution scaling (REQ-014)
+# Gameplay always uses SCREEN_WIDTH x SCREEN_HEIGHT coordinates; only rendering is scaled
+RENDER_SCALE = get_env_float("EMOJI_FLAPPY_RENDER_SCALE", 1.0)  # internal render target size
+WINDOW_SCALE = get_env_float("EMOJI_FLAPPY_WINDOW_SCALE", 1.0)  # window size
+
 # Physics
 G = 1800.0
 V_FLAP = -520.0
@@ -21,6 +36,133 @@ SCROLL_SPEED = 320.0  # px/s
 GAP_SIZE_RANGE = (140, 220)     # min/max gap size px
 SPAWN_INTERVAL_RANGE = (1000, 1800)  # ms between obstacles
 
+# Reachability (REQ-011)
+PHYSICS_TICK_RATE = 60          # ticks/s used for precomputed physics tables
+REACH_MARGIN = 0.85             # fraction of the reachable envelope the spawner may use
+
+# Score persistence (REQ-012)
+SCORE_FILE = os.path.join(os.path.expanduser("~"), ".emoji_flappy_scores.jsonl")
+SCORE_FILE_ENV = "EMOJI_FLAPPY_SCORES"   # overrides SCORE_FILE when set
+SCORE_STORAGE_KEY = "emoji_flappy_scores"  # localStorage key under pygbag
+SCORE_COMPACT_LINES = 500       # rewrite the append-only file beyond this many records
+
+# Telemetry (REQ-013)
+TELEMETRY_ENV = "EMOJI_FLAPPY_TELEMETRY"  # export target: NDJSON file path or http(s) URL
+TELEMETRY_CAPACITY = 256        # events held in the ring buffer
+TELEMETRY_BATCH_SIZE = 32       # events per export batch
+SLOW_FRAME_MS = 1000.0 / 30     # frames slower than this count as slow
+
+# Autopilot (REQ-015)
+AUTOPILOT_ENV = "EMOJI_FLAPPY_AUTOPILOT"  # set to 1 to start with the bot playing
+AUTOPILOT_HORIZON = 36          # lookahead ticks
+AUTOPILOT_BRANCH_TICKS = 4      # ticks between flap decisions in the search tree
+AUTOPILOT_NODE_BUDGET = 2000    # max search nodes per decision (keeps it inside a frame)
+AUTOPILOT_MARGIN = 1            # px safety margin inside gaps
+SOAK_REPORT_INTERVAL = 60.0     # seconds of play between autopilot soak reports
+
+# Memory tracking (REQ-016)
+MEMTRACK_ENV = "EMOJI_FLAPPY_MEMTRACK"  # set to 1 to trace allocations during Game.run
+MEMTRACK_TOP_SITES = 10         # allocation sites listed in the report
+MEMTRACK_WARMUP_RESTARTS = 3    # restarts ignored before checking for growth
+MEMTRACK_GROWTH_BYTES = 16384   # traced bytes per restart treated as steady growth
+
+# Racing (REQ-017)
+RACERS_ENV = "EMOJI_FLAPPY_RACERS"   # number of local racers sharing one obstacle stream
+RACER_KEYS = (pg.K_SPACE, pg.K_UP)   # flap key per local racer; racer 1 is the main player
+RACER_TINTS = (None, (120, 170, 255, 255))
+GHOST_ALPHA = 110               # opacity of the replayed previous run
+
+# Headless game server (REQ-018)
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 8765
+SERVER_WORKERS = 0              # worker processes; 0 steps sessions on the event loop
+SERVER_BATCH_SIZE = 1024        # queued sessions taken per batch
+SERVER_SLICE_TICKS = 60         # ticks per session between event-loop yields
+SERVER_MAX_TICKS = 10 * 60 * PHYSICS_TICK_RATE  # longest run a session will simulate
+
+# Score verification (REQ-019)
+MAX_FRAME_STEPS = 5             # fixed physics ticks a single slow frame may catch up
+VERIFY_WORKERS = 4              # processes for batch verification; <= 1 verifies inline
+VERIFY_CHUNK_SIZE = 8           # submissions handed to a worker at a time
+
+# Live tuning (REQ-020)
+TUNING_ENV = "EMOJI_FLAPPY_TUNING"  # JSON file of overrides, watched for changes
+TUNING_STORAGE_KEY = "emoji_flappy_tuning"  # localStorage key under pygbag
+TUNING_POLL_INTERVAL = 0.5      # seconds between tuning file checks
+TUNING_RELOAD_KEY = pg.K_t      # re-reads the overrides; F5 would reload the browser page
+TUNING_MAX_SPEED = 20000.0      # largest |G|, |V_*| and SCROLL_SPEED override (px/s, px/s^2)
+TUNING_MAX_SPAWN_INTERVAL = 10 * 60 * 1000  # ms; reach tables hold a row per tick of it
+
+# Difficulty progression (REQ-021)
+DIFFICULTY_ENV = "EMOJI_FLAPPY_DIFFICULTY"  # set to 1 to start with progression on
+DIFFICULTY_MAX_SCORE = 50       # score at which the curves reach their hardest values
+DIFFICULTY_TIER_SIZE = 10       # points per difficulty tier
+DIFFICULTY_SPEED_SCALE = 1.4    # scroll speed multiplier at the hardest tier
+DIFFICULTY_GAP_SCALE = 0.8      # gap size multiplier at the hardest tier
+DIFFICULTY_SPAWN_SCALE = 0.85   # spawn interval multiplier at the hardest tier
+DIFFICULTY_REPORT_RUNS = 200    # simulated runs in the survival report
+
+# Startup (REQ-022)
+BOOT_BENCH_ENV = "EMOJI_FLAPPY_BOOTBENCH"  # set to 1 to quit after the first frame
+
+# Frame pacing (REQ-024)
+PACING_ENV = "EMOJI_FLAPPY_PACING"  # sleep, vsync, precise, uncapped or powersaver
+PACING_MODES = ("sleep", "vsync", "precise", "uncapped", "powersaver")
+PACING_DEFAULT_MODE = "sleep"
+TARGET_FPS = 60                 # NFR-001 frame rate for the capped modes
+POWER_SAVER_FPS = 10            # frame rate on the idle game-over screen in powersaver mode
+PACING_SAMPLE_FRAMES = 600      # recent frame times kept for the jitter percentile
+
+# Particle effects (REQ-025)
+PARTICLE_CAPACITY = 4096        # particles held by the preallocated pool
+PARTICLE_FADE_STEPS = 4         # pre-rendered opacity steps per effect
+PARTICLE_EFFECTS = {
+	# name: (burst size, colour, size px, speed px/s, direction deg, spread deg,
+	#        gravity px/s^2, lifetime s); 0 deg points right, 90 deg points down
+	"feather": (6, (255, 250, 230), 6, 140, 180, 50, 250, 0.5),
+	"sparkle": (16, (255, 215, 0), 4, 220, 0, 180, 0, 0.45),
+	"debris": (48, (190, 110, 40), 8, 380, -90, 120, 1400, 1.2),
+}
+
+# Training environment (REQ-027)
+GYM_OBSERVATION_SIZE = 5        # player y, velocity, next gap top, gap bottom, distance
+GYM_REWARD_ALIVE = 0.01         # reward per tick survived
+GYM_REWARD_SCORE = 1.0          # reward per obstacle passed
+GYM_REWARD_CRASH = -1.0         # reward on the tick the bird crashes
+GYM_MAX_TICKS = 2 * 60 * PHYSICS_TICK_RATE  # episodes are truncated after two minutes
+GYM_PIXEL_SIZE = (80, 60)       # off-screen pixel observation size
+GYM_PLAYER_COLOR = (255, 220, 0)
+GYM_OBSTACLE_COLOR = (34, 139, 34)
+
+# Snapshots and rewind (REQ-028)
+SNAPSHOT_INTERVAL_TICKS = 30    # ticks between snapshots in the rewind ring
+SNAPSHOT_RING_SIZE = 20         # snapshots kept; 10 s of rewind at 60 ticks/s
+REWIND_KEY = pg.K_r             # practice rewind; a rewound run is not recorded
+SAVE_STATE_KEY = pg.K_F6        # debug save state to SAVE_STATE_FILE
+LOAD_STATE_KEY = pg.K_F7        # debug load state from SAVE_STATE_FILE
+SAVE_STATE_FILE = os.path.join(os.path.expanduser("~"), ".emoji_flappy_savestate.json")
+SAVE_STATE_ENV = "EMOJI_FLAPPY_SAVESTATE"  # overrides SAVE_STATE_FILE when set
+
+# Fixed-point physics (REQ-029)
+FIXED_POINT_ENV = "EMOJI_FLAPPY_FIXEDPOINT"  # set to 1 for integer player and obstacle motion
+FIXED_SHIFT = 16                # fractional bits; positions are in 1/65536 px
+FIXED_ONE = 1 << FIXED_SHIFT
+
+# Web bundle (REQ-023)
+WEB_APP_NAME = "emoji_flappy"   # staged app folder; pygbag names the bundle after it
+WEB_PYTHON_VERSION = (3, 12)    # CPython of the pygbag runtime; bytecode is only precompiled for it
+WEB_OPTIMIZE = 2                # bytecode optimisation level (2 strips docstrings and asserts)
+WEB_ASSET_DIRS = ("assets",)    # folders under src/ packed into the bundle when present
+WEB_COMPRESS_SUFFIXES = (".html", ".js", ".css", ".json", ".apk", ".tar", ".wasm", ".data")
+WEB_COMPRESS_MIN_BYTES = 512    # smaller files are served uncompressed
+WEB_CACHE_MAX_AGE = 3600        # seconds browsers may reuse bundle files without revalidating
+WEB_PORT = 3496
+WEB_LOAD_PROFILES = (           # (name, Mbit/s, round trip ms) for load time estimates
+	("3G", 1.6, 300),
+	("4G", 9.0, 100),
+	("Broadband", 50.0, 20),
+)
+
 # Emoji rendering
 EMOJI_SIZE = 64
 PLAYER_EMOJI = "🐤"
@@ -43,9 +185,30 @@ SOUND_ENABLED_DEFAULT = True
 # SOUND_CRASH = "assets/sounds/crash.wav"
 
 # Window setup
-def get_screen():
-	"""Create pygame screen with fixed resolution for web compatibility."""
-	return pg.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+def init_subsystems():
+	"""
+	Initialise only the pygame subsystems the first frame needs.
+	REQ-022: Lazy subsystem initialisation.
+	
+	pg.init() would also open the audio device and scan for joysticks; the game
+	plays no sound yet and has no joystick controls, so neither is started.
+	"""
+	pg.display.init()
+	pg.font.init()
+
+
+def get_screen(size=None, vsync=False):
+	"""
+	Create pygame screen with fixed resolution for web compatibility.
+	REQ-014: size overrides the window size for resolution scaling.
+	REQ-024: vsync requests a display synchronised to the monitor refresh; SDL
+	only offers that through a renderer, so it raises pygame.error when the
+	driver has none.
+	"""
+	size = size or (SCREEN_WIDTH, SCREEN_HEIGHT)
+	if vsync:
+		return pg.display.set_mode(size, pg.SCALED, vsync=1)
+	return pg.display.set_mode(size)
 
 
 def get_emoji_font(size):
@@ -0,0 +1,111 @@
+"""
+Emoji Flappy - Difficulty Progression
+REQ-021: Score-driven difficulty progression
+
+Scroll speed, gap sizes and spawn intervals tighten as the score rises. The
+curves are evaluated once, when a curve is built, into one Tuning snapshot and
+reach envelope per difficulty tier plus a lookup table indexed by score; the
+game only indexes the table when the score changes.
+
+A curve with max_score=0 has a single tier equal to its base tuning, which is
+what the game uses with progression off.
+"""
+
+from config import (
+	DIFFICULTY_MAX_SCORE, DIFFICULTY_TIER_SIZE, DIFFICULTY_SPEED_SCALE,
+	DIFFICULTY_GAP_SCALE, DIFFICULTY_SPAWN_SCALE, TUNING_MAX_SPEED
+)
+from reachability import ReachabilityEnvelope
+from tuning import DEFAULT_TUNING, Tuning
+
+# Curves built for the headless sessions, per (tuning, progressive); see getCurve
+_curves = {}
+
+
+def ease(t):
+	"""Smoothstep: gentle start, steady middle, gentle approach to the hardest tier."""
+	return t * t * (3.0 - 2.0 * t)
+
+
+def lerp(start, end, t):
+	return start + (end - start) * t
+
+
+class DifficultyLevel:
+	"""Gameplay parameters in effect for one tier (REQ-021)."""
+
+	__slots__ = ("tier", "first_score", "tuning", "_envelope")
+
+	def __init__(self, tier, first_score, tuning):
+		self.tier = tier
+		self.first_score = first_score
+		self.tuning = tuning
+		self._envelope = None
+
+	@property
+	def envelope(self):
+		"""REQ-011: Reach tables for this tier's speed and spawn spacing, built on first use."""
+		if self._envelope is None:
+			self._envelope = ReachabilityEnvelope(tuning=self.tuning)
+		return self._envelope
+
+
+class DifficultyCurve:
+	"""
+	Precomputed difficulty progression (REQ-021).
+	getLevel(score) is a table lookup; scores past max_score stay on the last tier.
+	"""
+
+	def __init__(self, base=DEFAULT_TUNING, max_score=DIFFICULTY_MAX_SCORE,
+				 tier_size=DIFFICULTY_TIER_SIZE):
+		self.base = base
+		self.max_score = max_score
+		self.tier_size = tier_size
+
+		last_tier = max_score // tier_size
+		tiers = []
+		for tier in range(last_tier + 1):
+			t = ease(tier / last_tier) if last_tier else 0.0
+			tiers.append(DifficultyLevel(tier, tier * tier_size, self.getTuning(t)))
+		self.tiers = tuple(tiers)
+		self.levels = tuple(self.tiers[score // tier_size] for score in range(max_score + 1))
+
+	@property
+	def progressive(self):
+		return len(self.tiers) > 1
+
+	def getTuning(self, t):
+		"""Tuning snapshot at curve position t (0 = base, 1 = hardest)."""
+		if t == 0.0:
+			return self.base
+		base = self.base
+		speed = lerp(1.0, DIFFICULTY_SPEED_SCALE, t)
+		gap = lerp(1.0, DIFFICULTY_GAP_SCALE, t)
+		spawn = lerp(1.0, DIFFICULTY_SPAWN_SCALE, t)
+		return Tuning(dict(
+			base.overrides,
+			# Capped so a base tuned at the limit still builds every tier
+			SCROLL_SPEED=min(base.scroll_speed * speed, TUNING_MAX_SPEED),
+			GAP_SIZE_RANGE=[round(size * gap) for size in base.gap_size_range],
+			SPAWN_INTERVAL_RANGE=[round(ms * spawn) for ms in base.spawn_interval_range],
+		))
+
+	def getLevel(self, score):
+		"""DifficultyLevel in effect at score."""
+		levels = self.levels
+		return levels[score] if score < len(levels) else levels[-1]
+
+	def getTier(self, score):
+		return self.getLevel(score).tier
+
+
+def getCurve(tuning=DEFAULT_TUNING, progressive=False):
+	"""
+	Shared curve for re-simulated runs, built once per process, tuning and mode.
+	A flat curve reproduces the game with progression off.
+	"""
+	key = (tuning, progressive)
+	curve = _curves.get(key)
+	if curve is None:
+		curve = _curves[key] = DifficultyCurve(tuning, DIFFICULTY_MAX_SCORE if progressive else 0)
+	return curve
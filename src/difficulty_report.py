@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Emoji Flappy - Difficulty Survival Report
+REQ-021: Score-driven difficulty progression
+
+Plays many headless runs with the autopilot and difficulty progression on, and
+reports for every tier how many runs reached it, how many crashed in it and
+how long the crashed runs lasted there. The autopilot plays every run to its
+end, so the numbers describe the curves rather than any particular player.
+
+Usage:
+	python src/difficulty_report.py [--runs N] [--seed S] [--flat]
+"""
+
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # no window needed
+
+import argparse
+import random
+import statistics
+from config import PHYSICS_TICK_RATE, SERVER_MAX_TICKS, DIFFICULTY_REPORT_RUNS
+from game import Game
+from autopilot import Autopilot
+
+
+class RunResult:
+	"""Outcome of one simulated run (REQ-021)."""
+
+	__slots__ = ("score", "ticks", "tier", "cause", "tier_ticks")
+
+	def __init__(self, score, ticks, tier, cause, tier_ticks):
+		self.score = score
+		self.ticks = ticks
+		self.tier = tier              # tier the run ended in
+		self.cause = cause            # None when the run hit max_ticks
+		self.tier_ticks = tier_ticks  # ticks spent in each tier
+
+
+def simulateRuns(runs, seed=0, progression=True, max_ticks=SERVER_MAX_TICKS):
+	"""
+	Let the autopilot play runs runs on one reused Game.
+	Returns (RunResult list, DifficultyCurve the runs were played on).
+	"""
+	random.seed(seed)  # fixes every run's obstacle seed
+	game = Game()
+	game.progression = progression
+	dt = 1.0 / PHYSICS_TICK_RATE
+	results = []
+	for _ in range(runs):
+		game.restart()
+		game.autopilot = Autopilot(game)
+		difficulty = game.difficulty
+		tier_ticks = [0] * len(difficulty.tiers)
+		while not game.game_over and game.tick < max_ticks:
+			game.update(dt)
+			tier_ticks[difficulty.getTier(game.getLeadScore())] += 1
+		tier = difficulty.getTier(game.getLeadScore())
+		cause = game.player.death_cause if game.game_over else None
+		results.append(RunResult(game.score, game.tick, tier, cause, tier_ticks))
+	return results, game.difficulty
+
+
+def buildReport(results, difficulty):
+	"""One row per tier: reach, crash and clear counts and crash-time percentiles."""
+	rows = []
+	for level in difficulty.tiers:
+		tier = level.tier
+		entered = [r for r in results if r.tier >= tier]
+		crashed = [r for r in entered if r.tier == tier and r.cause is not None]
+		seconds = sorted(r.tier_ticks[tier] / PHYSICS_TICK_RATE for r in crashed)
+		last = tier == len(difficulty.tiers) - 1
+		rows.append({
+			"tier": tier,
+			"scores": (level.first_score,
+					   None if last else level.first_score + difficulty.tier_size - 1),
+			"speed": level.tuning.scroll_speed,
+			"gaps": level.tuning.gap_size_range,
+			"entered": len(entered),
+			"crashed": len(crashed),
+			"survival": (len(entered) - len(crashed)) / len(entered) if entered else None,
+			"crash_seconds": percentiles(seconds),
+		})
+	return rows
+
+
+def percentiles(values):
+	"""(p10, p50, p90) of sorted values, or None when there are none."""
+	if not values:
+		return None
+	if len(values) == 1:
+		return (values[0],) * 3
+	deciles = statistics.quantiles(values, n=10, method="inclusive")
+	return (deciles[0], statistics.median(values), deciles[-1])
+
+
+def formatReport(rows, results):
+	lines = [f"[DIFFICULTY] {len(results)} runs, "
+			 f"median score {statistics.median(r.score for r in results):g}, "
+			 f"best {max(r.score for r in results)}"]
+	lines.append(f"{'tier':>4} {'scores':>7} {'speed':>6} {'gaps':>8} {'entered':>8} "
+				 f"{'crashed':>8} {'survived':>9}  crash time p10/p50/p90 (s)")
+	for row in rows:
+		low, high = row["scores"]
+		scores = f"{low}+" if high is None else f"{low}-{high}"
+		gaps = "{}-{}".format(*row["gaps"])
+		survival = "-" if row["survival"] is None else f"{row['survival']:.0%}"
+		crash = "-"
+		if row["crash_seconds"] is not None:
+			crash = "/".join(f"{s:.1f}" for s in row["crash_seconds"])
+		lines.append(f"{row['tier']:>4} {scores:>7} {row['speed']:>6.0f} {gaps:>8} "
+					 f"{row['entered']:>8} {row['crashed']:>8} {survival:>9}  {crash}")
+	return "\n".join(lines)
+
+
+def main():
+	"""Simulate runs and print the per-tier survival report."""
+	parser = argparse.ArgumentParser(description="Emoji Flappy difficulty survival report")
+	parser.add_argument("--runs", type=int, default=DIFFICULTY_REPORT_RUNS)
+	parser.add_argument("--seed", type=int, default=0)
+	parser.add_argument("--flat", action="store_true",
+						help="play with progression off, for comparison")
+	args = parser.parse_args()
+
+	results, difficulty = simulateRuns(args.runs, args.seed, progression=not args.flat)
+	print(formatReport(buildReport(results, difficulty), results))
+
+
+if __name__ == "__main__":
+	main()
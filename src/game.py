@@ -9,33 +9,91 @@ REQ-006: Restart after game over
 REQ-007: Mute toggle
 REQ-008: Quit shortcut
 REQ-009: Async compatibility
+REQ-011: Solvable obstacle layouts
+REQ-012: Persistent high score
+REQ-013: Gameplay telemetry
+REQ-014: Resolution scaling
+REQ-015: Autopilot for soak testing
+REQ-016: Memory growth tracking
+REQ-017: Local racing and ghost replays
+REQ-019: Verifiable score submissions
+REQ-020: Hot-reloadable tuning
+REQ-021: Score-driven difficulty progression
+REQ-022: Lazy subsystem initialisation
+REQ-024: Frame pacing modes
+REQ-025: Particle effects
+REQ-026: Batched draw list
+REQ-028: Snapshots, practice rewind and save states
+REQ-029: Fixed-point physics
 """
 
 import asyncio
+import os
 import pygame as pg
 import random
 import sys
+import time
+from array import array
 from config import (
-	SCREEN_WIDTH, SCREEN_HEIGHT, BG_COLOR, G, V_FLAP, V_MAX_UP, V_MAX_DOWN,
-	SCROLL_SPEED, GAP_SIZE_RANGE, SPAWN_INTERVAL_RANGE,
+	SCREEN_WIDTH, SCREEN_HEIGHT, BG_COLOR,
 	EMOJI_SIZE, PLAYER_EMOJI, OBSTACLE_EMOJI,
 	SCORE_FONT_SIZE, GAME_OVER_FONT_SIZE, INSTRUCTION_FONT_SIZE,
 	TEXT_COLOR, GAME_OVER_COLOR, SCORE_POSITION,
-	SOUND_ENABLED_DEFAULT, get_screen, get_emoji_font
+	SOUND_ENABLED_DEFAULT, RENDER_SCALE, WINDOW_SCALE, AUTOPILOT_ENV, MEMTRACK_ENV,
+	RACERS_ENV, RACER_KEYS, RACER_TINTS, PHYSICS_TICK_RATE, MAX_FRAME_STEPS,
+	TUNING_ENV, TUNING_RELOAD_KEY, DIFFICULTY_ENV, DIFFICULTY_MAX_SCORE,
+	RUNNING_IN_PYGBAG, BOOT_BENCH_ENV, REWIND_KEY, SAVE_STATE_KEY, LOAD_STATE_KEY,
+	SAVE_STATE_FILE, SAVE_STATE_ENV, SNAPSHOT_INTERVAL_TICKS, FIXED_POINT_ENV, FIXED_SHIFT,
+	FIXED_ONE, get_emoji_font
 )
+from autopilot import Autopilot
+from difficulty import DifficultyCurve
+from racing import Ghost, findCollisions
+from reachability import generateGap
+from pacing import FramePacer
+from particles import ParticleSystem
+from render import (
+	RenderTarget, RenderQueue, LAYER_OBSTACLES, LAYER_PLAYERS, LAYER_HUD, LAYER_OVERLAY,
+	LAYER_MENU
+)
+from snapshot import SnapshotRing, takeSnapshot, restoreSnapshot, saveSnapshot, loadSnapshot
+from storage import ScoreStore
+from telemetry import (
+	Telemetry, CAUSE_CEILING, CAUSE_FLOOR, CAUSE_TOP_PIPE, CAUSE_BOTTOM_PIPE
+)
+from tuning import DEFAULT_TUNING, createTuningWatcher
 
 
 class Player:
 	"""
 	Player entity with flap physics.
 	REQ-002: Flap and gravity physics
+	REQ-017: Each racer tracks its own score and state
+	REQ-020: Physics parameters come from the live tuning
+	REQ-025: Flaps shed feathers into the game's particle system, if given
+	REQ-029: With fixed_point, motion is integrated on integers; y and velocity
+		are exact views of y_fx (1/FIXED_ONE px) and velocity_fx (per tick)
 	"""
 	
-	def __init__(self, x, y):
+	def __init__(self, x, y, tint=None, tuning=DEFAULT_TUNING, particles=None,
+				 fixed_point=False):
 		self.x = x
 		self.y = y
 		self.velocity = 0.0
 		self.size = EMOJI_SIZE
+		self.tuning = tuning
+		self.particles = particles
+		self.fixed_point = fixed_point
+		self.y_fx = round(y * FIXED_ONE)
+		self.velocity_fx = 0
+		
+		# REQ-017: Per-racer state
+		self.alive = True
+		self.score = 0
+		self.death_cause = None
+		
+		# REQ-019: Set by flap() until the game logs it against the current tick
+		self.flapped = False
 		
 		# Render emoji with emoji-compatible font (REQ-010)
 		self.font = get_emoji_font(self.size)
@@ -50,30 +108,95 @@ class Player:
 			# Add a simple eye
 			pg.draw.circle(self.surface, (0, 0, 0), (self.size // 2 + 5, self.size // 2 - 5), 3)
 		
-		self.rect = self.surface.get_rect(center=(self.x, self.y))
+		# REQ-017: Tint extra racers so they can be told apart
+		if tint is not None:
+			self.surface = self.surface.copy()
+			self.surface.fill(tint, special_flags=pg.BLEND_RGBA_MULT)
+		
+		# REQ-004: The hitbox is EMOJI_SIZE square whatever the font renders, matching
+		# the headless session (server.py); the sprite is centred on it
+		self.rect = pg.Rect(0, 0, self.size, self.size)
+		self.rect.center = (self.x, self.y)
+		self.sprite_offset = (self.size // 2 - self.surface.get_width() // 2,
+							  self.size // 2 - self.surface.get_height() // 2)
 	
 	def flap(self):
 		"""Apply upward impulse (REQ-002)."""
-		self.velocity = V_FLAP
+		self.velocity = self.tuning.v_flap
+		self.velocity_fx = self.tuning.fixed_v_flap
+		if self.fixed_point:
+			self.syncFixed()
+		self.flapped = True
+		if self.particles is not None:
+			self.particles.emit("feather", self.x - self.size // 2, self.y)
+	
+	def reset(self, y):
+		"""Start a new run at height y, keeping the rendered sprite (REQ-006, REQ-028)."""
+		self.restoreState((y, 0.0, True, 0, None, False))
+	
+	def restoreState(self, state):
+		"""Apply a snapshot tuple (y, velocity, alive, score, death_cause, flapped) (REQ-028)."""
+		self.y, self.velocity, self.alive, self.score, self.death_cause, self.flapped = state
+		# REQ-029: The float views are exact, so the integers come back unchanged
+		self.y_fx = round(self.y * FIXED_ONE)
+		self.velocity_fx = round(self.velocity * FIXED_ONE / PHYSICS_TICK_RATE)
+		if self.fixed_point:
+			self.syncFixed()
+		else:
+			self.rect.center = (self.x, self.y)
 	
 	def update(self, dt):
 		"""
 		Update player position with gravity (REQ-002).
-		dt: delta time in seconds
+		dt: delta time in seconds; fixed-point motion always advances one tick (REQ-029)
 		"""
+		tuning = self.tuning
+		
+		if self.fixed_point:
+			# REQ-029: The same steps on integers
+			velocity = self.velocity_fx + tuning.fixed_gravity_step
+			if velocity < tuning.fixed_v_max_up:
+				velocity = tuning.fixed_v_max_up
+			elif velocity > tuning.fixed_v_max_down:
+				velocity = tuning.fixed_v_max_down
+			self.velocity_fx = velocity
+			self.y_fx = y = self.y_fx + velocity
+			# Inlined syncFixed(); this runs for every racer every tick
+			self.y = y / FIXED_ONE
+			self.velocity = velocity * PHYSICS_TICK_RATE / FIXED_ONE
+			self.rect.center = (self.x, (y + FIXED_ONE // 2) >> FIXED_SHIFT)
+			return
+		
 		# Apply gravity
-		self.velocity += G * dt
+		velocity = self.velocity + tuning.g * dt
 		
 		# Clamp velocity
-		self.velocity = max(V_MAX_UP, min(V_MAX_DOWN, self.velocity))
+		if velocity < tuning.v_max_up:
+			velocity = tuning.v_max_up
+		elif velocity > tuning.v_max_down:
+			velocity = tuning.v_max_down
+		self.velocity = velocity
 		
 		# Update position
-		self.y += self.velocity * dt
+		self.y += velocity * dt
 		self.rect.center = (self.x, self.y)
 	
-	def draw(self, screen):
-		"""Render player emoji."""
-		screen.blit(self.surface, self.rect)
+	def syncFixed(self):
+		"""Refresh the float views and the rect, rounding the centre half up (REQ-029)."""
+		self.y = self.y_fx / FIXED_ONE
+		self.velocity = self.velocity_fx * PHYSICS_TICK_RATE / FIXED_ONE
+		self.rect.center = (self.x, (self.y_fx + FIXED_ONE // 2) >> FIXED_SHIFT)
+	
+	def draw(self, queue, target=None):
+		"""
+		Queue the player emoji on the players layer (REQ-026).
+		target: optional RenderTarget when drawing at a scaled resolution (REQ-014)
+		"""
+		position = (self.rect.left + self.sprite_offset[0], self.rect.top + self.sprite_offset[1])
+		if target is None:
+			queue.submit(LAYER_PLAYERS, self.surface, position)
+		else:
+			queue.submit(LAYER_PLAYERS, target.sprite(self.surface), target.toRender(position))
 	
 	def getRect(self):
 		"""Get collision rect."""
@@ -84,23 +207,61 @@ class Obstacle:
 	"""
 	Obstacle pair (top and bottom).
 	REQ-003: Randomised obstacle generation
+	REQ-011: Solvable obstacle layouts
+	REQ-020: Scroll speed, gap sizes and tile offsets come from the live tuning
+	REQ-029: With fixed_point, x is an exact view of x_fx (1/FIXED_ONE px)
 	"""
 	
-	def __init__(self, x, screen_height):
+	def __init__(self, x, screen_height, reach=None, rng=random, tuning=DEFAULT_TUNING,
+				 fixed_point=False):
+		"""
+		Args:
+			x: Left edge of the obstacle in px
+			screen_height: Height of the play area in px
+			reach: Optional (top, bottom) range of reachable player centres;
+				the gap is placed so part of it lies inside (REQ-011)
+			rng: Random source; a seeded stream is shared by racers (REQ-017)
+			tuning: Live gameplay parameters (REQ-020)
+			fixed_point: Scroll in integer steps (REQ-029)
+		"""
 		self.x = x
+		self.x_fx = x * FIXED_ONE
+		self.fixed_point = fixed_point
 		self.screen_height = screen_height
+		self.tuning = tuning
 		
-		# Random gap size and position (REQ-003)
-		gap_size = random.randint(GAP_SIZE_RANGE[0], GAP_SIZE_RANGE[1])
-		gap_center = random.randint(
-			gap_size // 2 + 50,
-			screen_height - gap_size // 2 - 50
-		)
+		# Random gap size and position (REQ-003, REQ-011)
+		self.gap_top, self.gap_bottom = generateGap(screen_height, reach, rng, tuning)
 		
-		self.gap_top = gap_center - gap_size // 2
-		self.gap_bottom = gap_center + gap_size // 2
+		self.loadSprite()
 		
-		# Render obstacles with emoji-compatible font (REQ-010)
+		# Track if player passed this obstacle
+		self.passed = False
+	
+	@classmethod
+	def fromState(cls, state, screen_height, tuning=DEFAULT_TUNING, like=None,
+				  fixed_point=False):
+		"""
+		Rebuild an obstacle from snapshot state (x, gap_top, gap_bottom, passed) (REQ-028).
+		The sprite is shared with like when given instead of being rendered again.
+		"""
+		obstacle = cls.__new__(cls)
+		obstacle.x, obstacle.gap_top, obstacle.gap_bottom, obstacle.passed = state
+		obstacle.x_fx = round(obstacle.x * FIXED_ONE)
+		obstacle.fixed_point = fixed_point
+		obstacle.screen_height = screen_height
+		obstacle.tuning = tuning
+		if like is None:
+			obstacle.loadSprite()
+		else:
+			obstacle.font = like.font
+			obstacle.emoji_surface = like.emoji_surface
+			obstacle.emoji_width = like.emoji_width
+			obstacle.sprite_offset = like.sprite_offset
+		return obstacle
+	
+	def loadSprite(self):
+		"""Render obstacles with emoji-compatible font (REQ-010)."""
 		self.font = get_emoji_font(EMOJI_SIZE)
 		self.emoji_surface = self.font.render(OBSTACLE_EMOJI, True, (0, 0, 0))
 		
@@ -112,24 +273,42 @@ class Obstacle:
 			# Add darker border
 			pg.draw.rect(self.emoji_surface, (0, 100, 0), (0, 0, EMOJI_SIZE, EMOJI_SIZE), 2)
 		
-		self.emoji_width = self.emoji_surface.get_width()
-		
-		# Track if player passed this obstacle
-		self.passed = False
+		# REQ-004: Collide on an EMOJI_SIZE column like the headless session (server.py),
+		# with the sprite centred on it
+		self.emoji_width = EMOJI_SIZE
+		self.sprite_offset = EMOJI_SIZE // 2 - self.emoji_surface.get_width() // 2
 	
 	def update(self, dt):
-		"""Move obstacle left."""
-		self.x -= SCROLL_SPEED * dt
+		"""Move obstacle left at the current tier's scroll speed (REQ-020, REQ-021)."""
+		if self.fixed_point:
+			# REQ-029: One tick in integer steps
+			self.x_fx -= self.tuning.fixed_scroll_step
+			self.x = self.x_fx / FIXED_ONE
+		else:
+			self.x -= self.tuning.scroll_speed * dt
 	
-	def draw(self, screen):
-		"""Render obstacle emojis."""
-		# Top obstacle (repeated emojis)
-		for y in range(0, int(self.gap_top), EMOJI_SIZE):
-			screen.blit(self.emoji_surface, (self.x, y))
+	def draw(self, queue, target=None):
+		"""
+		Queue the obstacle's emoji tiles on the obstacles layer (REQ-026).
+		target: optional RenderTarget when drawing at a scaled resolution (REQ-014)
+		"""
+		# REQ-020: Tile offsets for SCREEN_HEIGHT are precomputed once per tuning
+		offsets = self.tuning.getTileOffsets(self.screen_height)
+		gap_top = int(self.gap_top)
+		gap_bottom = int(self.gap_bottom)
+		
+		x = self.x + self.sprite_offset
+		bottom_limit = self.screen_height - gap_bottom
 		
-		# Bottom obstacle (repeated emojis)
-		for y in range(int(self.gap_bottom), self.screen_height, EMOJI_SIZE):
-			screen.blit(self.emoji_surface, (self.x, y))
+		# Top obstacle, then bottom obstacle (repeated emojis)
+		positions = [(x, y) for y in offsets if y < gap_top]
+		positions += [(x, gap_bottom + offset) for offset in offsets if offset < bottom_limit]
+		
+		surface = self.emoji_surface
+		if target is not None:
+			surface = target.sprite(surface)
+			positions = [target.toRender(pos) for pos in positions]
+		queue.extend(LAYER_OBSTACLES, [(surface, pos) for pos in positions])
 	
 	def isOffScreen(self):
 		"""Check if obstacle has moved off screen."""
@@ -140,12 +319,29 @@ class Obstacle:
 		Check collision with player (REQ-004).
 		Returns True if collision detected.
 		"""
+		return self.getCollisionCause(player_rect) is not None
+	
+	def getCollisionCause(self, player_rect):
+		"""
+		Identify which half of the obstacle the player hit (REQ-004, REQ-013).
+		Returns CAUSE_TOP_PIPE, CAUSE_BOTTOM_PIPE or None.
+		"""
 		# Create rects for top and bottom obstacles
 		top_rect = pg.Rect(self.x, 0, self.emoji_width, self.gap_top)
 		bottom_rect = pg.Rect(self.x, self.gap_bottom, self.emoji_width, 
 							  self.screen_height - self.gap_bottom)
 		
-		return player_rect.colliderect(top_rect) or player_rect.colliderect(bottom_rect)
+		if player_rect.colliderect(top_rect):
+			return CAUSE_TOP_PIPE
+		if player_rect.colliderect(bottom_rect):
+			return CAUSE_BOTTOM_PIPE
+		return None
+	
+	def overlapsColumn(self, left, right):
+		"""Check horizontal overlap with the x-range [left, right) (REQ-017)."""
+		# Truncate like pg.Rect so this never disagrees with checkCollision
+		x = int(self.x)
+		return x < right and x + self.emoji_width > left
 	
 	def checkPassed(self, player_x):
 		"""Check if player has passed this obstacle."""
@@ -163,33 +359,121 @@ class Game:
 	REQ-003: Randomised obstacle generation
 	REQ-004: Collision detection
 	REQ-009: Async compatibility
+	REQ-014: Resolution scaling
+	REQ-017: Local racing and ghost replays
+	REQ-019: Fixed-step runs with a flap log for score verification
+	REQ-020: Hot-reloadable tuning
+	REQ-021: Score-driven difficulty progression
+	REQ-022: Time-to-first-frame report
+	REQ-029: Optional fixed-point physics
 	"""
 	
-	def __init__(self):
+	def __init__(self, boot_start=None):
+		"""
+		Args:
+			boot_start: perf_counter() at process start, for the first-frame report (REQ-022)
+		"""
+		self.boot_start = time.perf_counter() if boot_start is None else boot_start
+		self.first_frame_ms = None
+		
 		# REQ-001: Web-based display with fixed resolution
-		self.screen = get_screen()
 		self.screen_width = SCREEN_WIDTH
 		self.screen_height = SCREEN_HEIGHT
+		# REQ-024: The pacing mode decides how the display is opened
+		self.pacer = FramePacer()
+		self.screen = self.pacer.openDisplay((round(SCREEN_WIDTH * WINDOW_SCALE),
+											  round(SCREEN_HEIGHT * WINDOW_SCALE)))
 		pg.display.set_caption("Emoji Flappy")
 		
-		self.clock = pg.time.Clock()
+		# REQ-014: Internal render target, scaled to the window once per frame
+		self.render_target = RenderTarget(
+			self.screen, (self.screen_width, self.screen_height), RENDER_SCALE
+		)
+		
+		# REQ-026: Per-layer draw list, plus the game-over dimming built on first use;
+		# a full-screen fill at startup would delay the first frame (REQ-022)
+		self.render_queue = RenderQueue()
+		self.overlay = None
+		
 		self.running = True
 		self.game_over = False
 		
+		# REQ-020: Live tuning, swapped in between frames when the overrides change
+		self.tuning_watcher = createTuningWatcher()
+		self.base_tuning = DEFAULT_TUNING
+		if self.tuning_watcher is not None:
+			self.base_tuning = self.tuning_watcher.poll() or DEFAULT_TUNING
+		
+		# REQ-021: Per-tier tuning looked up by score; a flat curve with progression off
+		self.progression = bool(os.environ.get(DIFFICULTY_ENV))
+		self.difficulty = self.createDifficulty()
+		level = self.difficulty.getLevel(0)
+		self.tuning = level.tuning
+		
+		# REQ-029: Integer player and obstacle motion, bit-identical on every platform
+		self.fixed_point = bool(os.environ.get(FIXED_POINT_ENV))
+		
+		# REQ-017: Local racers share one seeded obstacle stream; racer 1 is the main player
+		try:
+			racers = int(os.environ.get(RACERS_ENV, 1))
+		except ValueError:
+			racers = 1
+		self.racer_count = max(1, min(len(RACER_KEYS), racers))
+		self.ghost_racing = False
+		self.ghosts = []
+		self.trajectory = array("f")
+		self.obstacle_seed = random.randrange(2 ** 32)
+		self.rng = random.Random(self.obstacle_seed)
+		
+		# REQ-025: Cosmetic particles, advanced per frame outside the fixed-step simulation
+		self.particles = ParticleSystem()
+		
 		# Initialize player
-		self.player = Player(self.screen_width // 4, self.screen_height // 2)
+		self.players = self.createRacers()
+		self.player = self.players[0]
 		
 		# Initialize obstacles list
 		self.obstacles = []
 		
-		# Spawn timer (REQ-003: randomised intervals)
-		self.next_spawn_time = pg.time.get_ticks() + random.randint(
-			SPAWN_INTERVAL_RANGE[0], SPAWN_INTERVAL_RANGE[1]
-		)
+		# REQ-011: Precomputed reach tables for rejecting impossible layouts
+		self.reachability = level.envelope
+		
+		# REQ-019: Game time and flap log so a run can be re-simulated for verification
+		self.tick = 0
+		self.elapsed_ms = 0.0
+		self.flap_log = array("I")
+		self.accumulator = 0.0
+		self.last_submission = None
+		# Set when the tuning is swapped mid-run; the verifier replays one tuning
+		self.tuning_reloaded = False
+		
+		# REQ-028: Recent snapshots for rewinding; a rewound run is practice and not recorded
+		self.snapshots = SnapshotRing()
+		self.practice = False
+		
+		# Spawn timer (REQ-003: randomised intervals, in game time)
+		self.next_spawn_time = self.rng.randint(*self.tuning.spawn_interval_range)
 		
 		# REQ-005: Score tracking
 		self.score = 0
-		self.high_score = 0
+		
+		# REQ-012: High score and run stats persisted between launches
+		self.score_store = ScoreStore()
+		self.high_score = self.score_store.high_score
+		self.run_start_time = pg.time.get_ticks()
+		
+		# REQ-013: Gameplay telemetry (exported only when a target is configured)
+		self.telemetry = Telemetry()
+		
+		# REQ-015: Optional bot player for soak tests (toggle with A)
+		self.autopilot = Autopilot(self) if os.environ.get(AUTOPILOT_ENV) else None
+		
+		# REQ-016: Opt-in allocation tracker, started by run()
+		# REQ-022: tracemalloc is only imported when tracking is on
+		self.memory_tracker = None
+		if os.environ.get(MEMTRACK_ENV):
+			from memtrack import MemoryTracker
+			self.memory_tracker = MemoryTracker()
 		
 		# REQ-007: Mute toggle
 		self.sound_enabled = SOUND_ENABLED_DEFAULT
@@ -199,9 +483,32 @@ class Game:
 		# self.sound_crash = pg.mixer.Sound(SOUND_CRASH)
 		
 		# Font for UI (REQ-010: use emoji-compatible font)
-		self.score_font = get_emoji_font(SCORE_FONT_SIZE)
-		self.game_over_font = get_emoji_font(GAME_OVER_FONT_SIZE)
-		self.instruction_font = get_emoji_font(INSTRUCTION_FONT_SIZE)
+		# REQ-014: Sized for the render target so text is never rescaled per frame
+		target = self.render_target
+		self.score_font = get_emoji_font(target.toRenderSize(SCORE_FONT_SIZE))
+		self.game_over_font = get_emoji_font(target.toRenderSize(GAME_OVER_FONT_SIZE))
+		self.instruction_font = get_emoji_font(target.toRenderSize(INSTRUCTION_FONT_SIZE))
+	
+	@property
+	def score(self):
+		"""Score of the main player (REQ-005)."""
+		return self.player.score
+	
+	@score.setter
+	def score(self, value):
+		self.player.score = value
+	
+	def createRacers(self):
+		"""
+		Create one Player per local racer (REQ-017).
+		Extra racers start one emoji lower and are tinted.
+		"""
+		return [
+			Player(self.screen_width // 4, self.screen_height // 2 + i * EMOJI_SIZE,
+				   tint=RACER_TINTS[i], tuning=self.tuning, particles=self.particles,
+				   fixed_point=self.fixed_point)
+			for i in range(self.racer_count)
+		]
 	
 	def handleEvents(self):
 		"""
@@ -210,6 +517,11 @@ class Game:
 		REQ-006: Restart after game over
 		REQ-007: Mute toggle
 		REQ-008: Quit shortcut
+		REQ-015: Autopilot toggle
+		REQ-017: Extra racer flap keys, racer count and ghost toggles
+		REQ-020: Tuning reload key
+		REQ-021: Difficulty progression toggle
+		REQ-028: Rewind and save-state keys
 		"""
 		for event in pg.event.get():
 			if event.type == pg.QUIT:
@@ -234,21 +546,69 @@ class Game:
 				# REQ-007: Mute toggle
 				elif event.key == pg.K_m:
 					self.toggleMute()
+				
+				# REQ-015: Autopilot toggle
+				elif event.key == pg.K_a:
+					self.toggleAutopilot()
+				
+				# REQ-017: Flap keys for additional local racers
+				elif event.key in RACER_KEYS[1:]:
+					index = RACER_KEYS.index(event.key)
+					if not self.game_over and index < len(self.players):
+						self.players[index].flap()
+				
+				# REQ-017: Racer count and ghost replay apply from the next restart
+				elif event.key == pg.K_2:
+					self.racer_count = 1 if self.racer_count > 1 else 2
+				elif event.key == pg.K_g:
+					self.ghost_racing = not self.ghost_racing
+				
+				# REQ-021: Difficulty progression applies from the next restart
+				elif event.key == pg.K_d:
+					self.progression = not self.progression
+				
+				# REQ-028: Practice rewind and save-state debugging
+				elif event.key == REWIND_KEY:
+					self.rewind()
+				elif event.key == SAVE_STATE_KEY:
+					self.saveState()
+				elif event.key == LOAD_STATE_KEY:
+					self.loadState()
+				
+				# REQ-020: Re-read tuning overrides (the only trigger in the browser)
+				elif event.key == TUNING_RELOAD_KEY:
+					self.reloadTuning()
 	
 	def spawnObstacle(self):
 		"""
 		Spawn new obstacle at randomised interval (REQ-003).
+		Impossible layouts are rejected and regenerated (REQ-011).
+		Intervals run on game time so re-simulation spawns identically (REQ-019).
+		Gap sizes and intervals come from the current difficulty tier (REQ-021).
 		"""
-		current_time = pg.time.get_ticks()
+		current_time = self.elapsed_ms
 		
 		if current_time >= self.next_spawn_time:
 			# Spawn at right edge of screen
-			obstacle = Obstacle(self.screen_width, self.screen_height)
+			obstacle = Obstacle(self.screen_width, self.screen_height, rng=self.rng,
+								tuning=self.tuning, fixed_point=self.fixed_point)
+			
+			# REQ-011: Reject gaps the player cannot reach from the previous one
+			if self.obstacles:
+				previous = self.obstacles[-1]
+				if not self.reachability.isReachable(previous, obstacle):
+					reach = self.reachability.reachableCenters(
+						previous, obstacle.x - previous.x
+					)
+					obstacle = Obstacle(self.screen_width, self.screen_height, reach=reach,
+										rng=self.rng, tuning=self.tuning,
+										fixed_point=self.fixed_point)
+			
 			self.obstacles.append(obstacle)
 			
 			# Set next random spawn time (REQ-003)
-			self.next_spawn_time = current_time + random.randint(
-				SPAWN_INTERVAL_RANGE[0], SPAWN_INTERVAL_RANGE[1]
+			self.next_spawn_time = current_time + self.rng.randint(
+				*self.tuning.spawn_interval_range
 			)
 	
 	def update(self, dt):
@@ -258,20 +618,50 @@ class Game:
 		REQ-003: Obstacle spawning and movement
 		REQ-004: Collision detection
 		REQ-005: Score increment
+		REQ-017: Every racer is updated, collided and scored against shared obstacles
+		REQ-019: Main-player flaps are logged against the tick they take effect on
+		REQ-025: Score sparkles
 		"""
 		if self.game_over:
 			return
 		
-		# Update player (REQ-002)
-		self.player.update(dt)
+		# REQ-028: Snapshot of the state before this tick, every SNAPSHOT_INTERVAL_TICKS
+		if not self.tick % SNAPSHOT_INTERVAL_TICKS:
+			self.snapshots.record(self)
 		
-		# Check screen boundary collision (REQ-004)
-		if self.player.y - self.player.size // 2 <= 0:
-			self.game_over = True
-			self.onGameOver()
-		if self.player.y + self.player.size // 2 >= self.screen_height:
-			self.game_over = True
-			self.onGameOver()
+		# REQ-015: Autopilot flaps through the same interface as the player
+		if self.autopilot is not None and self.player.alive and self.autopilot.decide():
+			self.player.flap()
+		
+		# REQ-019: Flap log and game clock for score verification
+		if self.player.flapped:
+			self.flap_log.append(self.tick)
+			self.player.flapped = False
+		self.tick += 1
+		if self.fixed_point:
+			# REQ-029: Whole milliseconds from the tick count, so spawns need no float clock
+			self.elapsed_ms = self.tick * 1000 // PHYSICS_TICK_RATE
+		else:
+			self.elapsed_ms += dt * 1000.0
+		
+		for player in self.players:
+			if not player.alive:
+				continue
+			
+			# Update player (REQ-002)
+			player.update(dt)
+			
+			# Check screen boundary collision (REQ-004)
+			if player.y - player.size // 2 <= 0:
+				self.killPlayer(player, CAUSE_CEILING)
+			elif player.y + player.size // 2 >= self.screen_height:
+				self.killPlayer(player, CAUSE_FLOOR)
+		
+		# REQ-017: Record the main player for next run's ghost and advance ghosts
+		if self.player.alive:
+			self.trajectory.append(self.player.y)
+		for ghost in self.ghosts:
+			ghost.update()
 		
 		# Spawn obstacles (REQ-003)
 		self.spawnObstacle()
@@ -279,101 +669,235 @@ class Game:
 		# Update obstacles
 		for obstacle in self.obstacles:
 			obstacle.update(dt)
-			
-			# REQ-004: Check collision
-			if obstacle.checkCollision(self.player.getRect()):
-				self.game_over = True
-				self.onGameOver()
-			
-			# REQ-005: Score increment when passing obstacle
+		
+		# REQ-004, REQ-017: One collision pass for all live racers; a lone racer
+		# skips the racing bookkeeping
+		solo = len(self.players) == 1
+		if solo:
+			player = self.player
+			if player.alive:
+				rect = player.rect
+				for obstacle in self.obstacles:
+					if obstacle.overlapsColumn(rect.left, rect.right):
+						cause = obstacle.getCollisionCause(rect)
+						if cause is not None:
+							self.killPlayer(player, cause)
+							break
+		else:
+			racers = [player for player in self.players if player.alive]
+			for player, cause in findCollisions(self.obstacles, racers):
+				self.killPlayer(player, cause)
+		
+		# REQ-005: Score increment when passing obstacle (racers share one column)
+		scored = False
+		for obstacle in self.obstacles:
 			if obstacle.checkPassed(self.player.x):
-				self.score += 1
+				scored = True
+				# REQ-025: Sparkles in the gap that was cleared
+				self.particles.emit("sparkle", obstacle.x + obstacle.emoji_width / 2,
+									(obstacle.gap_top + obstacle.gap_bottom) / 2)
+				for player in self.players:
+					if player.alive:
+						player.score += 1
 				# TODO: REQ-007 - Play score sound
 				# if self.sound_enabled:
 				#     self.sound_score.play()
 		
-		# Remove off-screen obstacles
-		self.obstacles = [obs for obs in self.obstacles if not obs.isOffScreen()]
+		# REQ-021: The tier only changes when the score does
+		if scored:
+			self.updateDifficulty()
+		
+		# Remove off-screen obstacles; they scroll in spawn order, so the oldest leaves first
+		if self.obstacles and self.obstacles[0].isOffScreen():
+			self.obstacles = [obs for obs in self.obstacles if not obs.isOffScreen()]
+		
+		# REQ-004, REQ-017: The run ends once every racer is out
+		all_out = not any(player.alive for player in self.players)
+		if all_out:
+			self.game_over = True
+			self.onGameOver(self.player.death_cause)
+	
+	def advance(self, dt):
+		"""
+		Run as many fixed PHYSICS_TICK_RATE updates as the frame time covers (REQ-019).
+		A fixed step keeps every run reproducible from its flap log; the backlog is
+		capped so a stall cannot trigger a burst of catch-up ticks.
+		"""
+		# REQ-013: Frame-time summary for the current run
+		if not self.game_over:
+			self.telemetry.recordFrame(dt)
+		
+		step = 1.0 / PHYSICS_TICK_RATE
+		self.accumulator = min(self.accumulator + dt, MAX_FRAME_STEPS * step)
+		while self.accumulator >= step:
+			self.update(step)
+			self.accumulator -= step
+		
+		# REQ-025: Particles move on frame time and keep falling after game over
+		self.particles.update(dt)
+	
+	def killPlayer(self, player, cause):
+		"""
+		Take a racer out of the run (REQ-004, REQ-017).
+		"""
+		player.alive = False
+		player.death_cause = cause
 	
 	def draw(self):
 		"""
 		Render all game elements.
 		REQ-005: Score display
 		REQ-006: Game over screen with restart prompt
+		REQ-014: Drawn to the render target, then scaled to the window
+		REQ-017: All racers and ghosts over one shared set of obstacles
+		REQ-025: Particle effects over the racers
+		REQ-026: Batched per-layer draw list
 		"""
+		target = self.render_target
+		screen = target.surface
+		# Entities only need the target when positions and sprites must be scaled
+		entity_target = target if target.scale != 1.0 else None
+		center_x = self.screen_width // 2
+		center_y = self.screen_height // 2
+		
 		# Clear screen
-		self.screen.fill(BG_COLOR)
+		screen.fill(BG_COLOR)
+		
+		# REQ-026: Entities and HUD lines queue their blits; the queue draws each layer at once
+		queue = self.render_queue
 		
 		# Draw obstacles
 		for obstacle in self.obstacles:
-			obstacle.draw(self.screen)
+			obstacle.draw(queue, entity_target)
 		
-		# Draw player
-		self.player.draw(self.screen)
+		# REQ-017: Ghost of the previous run behind the live racers
+		for ghost in self.ghosts:
+			ghost.draw(queue, entity_target)
+		
+		# Draw players
+		for player in self.players:
+			if player.alive or player is self.player:
+				player.draw(queue, entity_target)
+		
+		# REQ-025: Particle effects over the racers
+		self.particles.draw(queue, entity_target)
 		
 		# REQ-005: Draw score
 		score_text = self.score_font.render(f"Score: {self.score}", True, TEXT_COLOR)
-		self.screen.blit(score_text, SCORE_POSITION)
+		position = target.toRender(SCORE_POSITION)
+		queue.submit(LAYER_HUD, score_text, position)
+		
+		# REQ-017: Scores of the extra racers under the main score
+		line_height = score_text.get_height()
+		for i, player in enumerate(self.players[1:], start=2):
+			racer_text = self.instruction_font.render(f"P{i}: {player.score}", True, TEXT_COLOR)
+			queue.submit(LAYER_HUD, racer_text, (position[0], position[1] + line_height * (i - 1)))
+		
+		# REQ-028: Practice runs are labelled under the scores
+		if self.practice:
+			practice_text = self.instruction_font.render("Practice (R to rewind)", True, TEXT_COLOR)
+			queue.submit(LAYER_HUD, practice_text,
+						 (position[0], position[1] + line_height * len(self.players)))
 		
 		# REQ-006: Draw game over screen
 		if self.game_over:
 			# Semi-transparent overlay
-			overlay = pg.Surface((self.screen_width, self.screen_height))
-			overlay.set_alpha(128)
-			overlay.fill((0, 0, 0))
-			self.screen.blit(overlay, (0, 0))
+			if self.overlay is None:
+				self.overlay = pg.Surface(target.size)
+				self.overlay.set_alpha(128)
+				self.overlay.fill((0, 0, 0))
+			queue.submit(LAYER_OVERLAY, self.overlay, (0, 0))
 			
 			# Game over text
 			game_over_text = self.game_over_font.render("GAME OVER", True, GAME_OVER_COLOR)
-			text_rect = game_over_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 - 60))
-			self.screen.blit(game_over_text, text_rect)
+			text_rect = game_over_text.get_rect(center=target.toRender((center_x, center_y - 60)))
+			queue.submit(LAYER_MENU, game_over_text, text_rect)
 			
 			# Final score
 			final_score_text = self.score_font.render(f"Score: {self.score}", True, TEXT_COLOR)
-			score_rect = final_score_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
-			self.screen.blit(final_score_text, score_rect)
+			score_rect = final_score_text.get_rect(center=target.toRender((center_x, center_y)))
+			queue.submit(LAYER_MENU, final_score_text, score_rect)
 			
 			# High score
 			high_score_text = self.instruction_font.render(f"High Score: {self.high_score}", True, TEXT_COLOR)
-			high_rect = high_score_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + 40))
-			self.screen.blit(high_score_text, high_rect)
+			high_rect = high_score_text.get_rect(center=target.toRender((center_x, center_y + 40)))
+			queue.submit(LAYER_MENU, high_score_text, high_rect)
 			
 			# Restart instruction
 			restart_text = self.instruction_font.render("Press Space to Restart", True, TEXT_COLOR)
-			restart_rect = restart_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + 80))
-			self.screen.blit(restart_text, restart_rect)
+			restart_rect = restart_text.get_rect(center=target.toRender((center_x, center_y + 80)))
+			queue.submit(LAYER_MENU, restart_text, restart_rect)
 			
 			# Mute status (REQ-007)
 			mute_status = "Sound: ON" if self.sound_enabled else "Sound: OFF"
 			mute_text = self.instruction_font.render(f"{mute_status} (M to toggle)", True, TEXT_COLOR)
-			mute_rect = mute_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + 120))
-			self.screen.blit(mute_text, mute_rect)
+			mute_rect = mute_text.get_rect(center=target.toRender((center_x, center_y + 120)))
+			queue.submit(LAYER_MENU, mute_text, mute_rect)
 		
-		pg.display.flip()
+		queue.flush(screen)
+		target.present()
 	
 	def restart(self):
 		"""
 		Restart game after game over (REQ-006).
 		Resets all game state without closing the app.
+		REQ-017: With ghost racing on, the last run is replayed over the same obstacles.
+		REQ-028: Existing racers are reset in place rather than rendered again.
 		"""
-		# Update high score (REQ-005)
-		if self.score > self.high_score:
+		# Update high score (REQ-005); practice runs do not count
+		if self.score > self.high_score and not self.practice:
 			self.high_score = self.score
 		
+		# REQ-013: Mark the start of a new run
+		self.telemetry.recordRestart(self.high_score)
+		
+		# REQ-016: Compare memory between otherwise identical runs
+		if self.memory_tracker is not None:
+			self.memory_tracker.onRestart()
+		
+		# REQ-017: Ghost racing replays the same seed; otherwise draw a fresh one
+		if self.ghost_racing and self.trajectory:
+			self.ghosts = [Ghost(self.player, self.trajectory)]
+		else:
+			self.ghosts = []
+			self.obstacle_seed = random.randrange(2 ** 32)
+		self.rng = random.Random(self.obstacle_seed)
+		self.trajectory = array("f")
+		
 		# Reset game state
 		self.game_over = False
-		self.score = 0
 		
-		# Reset player position
-		self.player = Player(self.screen_width // 4, self.screen_height // 2)
+		# Reset player positions and scores
+		if len(self.players) == self.racer_count:
+			for i, player in enumerate(self.players):
+				player.reset(self.screen_height // 2 + i * EMOJI_SIZE)
+		else:
+			self.players = self.createRacers()
+			self.player = self.players[0]
 		
 		# Clear obstacles
 		self.obstacles = []
+		self.particles.clear()
+		
+		# REQ-028: Snapshots of the last run no longer apply
+		self.snapshots.clear()
+		self.practice = False
+		
+		# REQ-021: Back to the first tier; a toggled progression setting applies now
+		if self.progression != self.difficulty.progressive:
+			self.difficulty = self.createDifficulty()
+		self.setLevel(self.difficulty.getLevel(0))
+		self.run_start_time = pg.time.get_ticks()
+		
+		# REQ-019: Restart the game clock and flap log
+		self.tick = 0
+		self.elapsed_ms = 0.0
+		self.flap_log = array("I")
+		self.accumulator = 0.0
+		self.tuning_reloaded = False
 		
 		# Reset spawn timer
-		self.next_spawn_time = pg.time.get_ticks() + random.randint(
-			SPAWN_INTERVAL_RANGE[0], SPAWN_INTERVAL_RANGE[1]
-		)
+		self.next_spawn_time = self.rng.randint(*self.tuning.spawn_interval_range)
 	
 	def toggleMute(self):
 		"""
@@ -390,30 +914,248 @@ class Game:
 		#     self.sound_score.set_volume(0.0)
 		#     self.sound_crash.set_volume(0.0)
 	
-	def onGameOver(self):
+	def pollTuning(self):
+		"""
+		Apply changed tuning overrides, called between frames (REQ-020).
+		"""
+		if self.tuning_watcher is not None:
+			tuning = self.tuning_watcher.poll()
+			if tuning is not None:
+				self.applyTuning(tuning)
+	
+	def reloadTuning(self):
+		"""
+		Force a tuning reload (REQ-020).
+		"""
+		if self.tuning_watcher is None:
+			print(f"[INFO] Set {TUNING_ENV} to a JSON file to enable tuning reloads")
+			return
+		tuning = self.tuning_watcher.reload()
+		if tuning is not None:
+			self.applyTuning(tuning)
+	
+	def applyTuning(self, tuning):
+		"""
+		Swap in a new tuning snapshot for every entity at once (REQ-020).
+		Derived tables such as the reach envelope are rebuilt here, once per reload.
+		REQ-021: The snapshot is the base the difficulty curve is rebuilt from.
+		"""
+		self.base_tuning = tuning
+		# REQ-019: A run that changed tuning part-way cannot be re-simulated
+		if self.tick:
+			self.tuning_reloaded = True
+		self.difficulty = self.createDifficulty()
+		self.setLevel(self.difficulty.getLevel(self.getLeadScore()))
+		print(f"[INFO] Tuning applied: {tuning.overrides or 'defaults'}")
+	
+	def createDifficulty(self):
+		"""
+		Difficulty curve for the base tuning (REQ-021).
+		With progression off the curve has a single tier equal to the base tuning.
+		"""
+		max_score = DIFFICULTY_MAX_SCORE if self.progression else 0
+		return DifficultyCurve(self.base_tuning, max_score)
+	
+	def getLeadScore(self):
+		"""Best score among the racers; it drives the shared difficulty (REQ-021)."""
+		return max(player.score for player in self.players)
+	
+	def updateDifficulty(self):
+		"""
+		Switch tiers if the lead score has crossed a tier boundary (REQ-021).
+		A table lookup; the tier's tuning and reach tables are prebuilt.
+		"""
+		level = self.difficulty.getLevel(self.getLeadScore())
+		if level.tuning is not self.tuning:
+			self.setLevel(level)
+	
+	def setLevel(self, level):
+		"""Apply a difficulty tier's tuning to every entity (REQ-020, REQ-021)."""
+		tuning = level.tuning
+		self.tuning = tuning
+		for player in self.players:
+			player.tuning = tuning
+		for obstacle in self.obstacles:
+			obstacle.tuning = tuning
+		self.reachability = level.envelope
+	
+	def createObstacle(self, state, like=None):
+		"""Obstacle restored from snapshot state with the current tier tuning (REQ-028)."""
+		return Obstacle.fromState(state, self.screen_height, self.tuning, like, self.fixed_point)
+	
+	def rewind(self):
+		"""
+		Step back to the latest snapshot at least SNAPSHOT_INTERVAL_TICKS old (REQ-028).
+		Works from the game-over screen too; the run becomes a practice run.
+		"""
+		snapshot = self.snapshots.rewind(self.tick)
+		if snapshot is None:
+			return False
+		restoreSnapshot(self, snapshot)
+		self.particles.clear()
+		self.practice = True
+		return True
+	
+	def getSaveStatePath(self):
+		return os.environ.get(SAVE_STATE_ENV) or SAVE_STATE_FILE
+	
+	def saveState(self):
+		"""Write the current simulation state to the save-state file (REQ-028)."""
+		if RUNNING_IN_PYGBAG:
+			print("[INFO] Save states are not available in the browser")
+			return
+		path = self.getSaveStatePath()
+		try:
+			saveSnapshot(takeSnapshot(self), path)
+		except OSError as e:
+			print(f"[WARNING] Could not save state to {path}: {e}")
+			return
+		print(f"[INFO] State saved at tick {self.tick} to {path}")
+	
+	def loadState(self):
+		"""Restore the save-state file; the run becomes a practice run (REQ-028)."""
+		if RUNNING_IN_PYGBAG:
+			print("[INFO] Save states are not available in the browser")
+			return
+		path = self.getSaveStatePath()
+		try:
+			snapshot = loadSnapshot(path)
+		except (OSError, ValueError) as e:
+			print(f"[WARNING] Could not load state from {path}: {e}")
+			return
+		restoreSnapshot(self, snapshot)
+		self.particles.clear()
+		self.snapshots.clear()
+		self.practice = True
+		print(f"[INFO] State loaded at tick {self.tick} from {path}")
+	
+	def toggleAutopilot(self):
+		"""
+		Toggle the autopilot bot on/off (REQ-015).
+		"""
+		self.autopilot = None if self.autopilot is not None else Autopilot(self)
+	
+	def onGameOver(self, cause=None):
 		"""
 		Handle game over event.
 		REQ-004: Collision triggers game over
+		REQ-012: Queue the finished run for persistence
+		REQ-013: Record the death cause
+		REQ-025: Crash debris
+		REQ-028: Practice runs are not recorded
+		
+		Args:
+			cause: One of the telemetry CAUSE_* constants, if known
 		"""
 		# TODO: REQ-007 - Play crash sound
 		# if self.sound_enabled:
 		#     self.sound_crash.play()
-		pass
+		
+		# REQ-025: Debris where the main player crashed
+		self.particles.emit("debris", self.player.x, self.player.y)
+		
+		duration = (pg.time.get_ticks() - self.run_start_time) / 1000.0
+		self.telemetry.recordDeath(cause, self.score, duration)
+		
+		# REQ-028: Rewound or loaded runs are practice; they are not stored or submitted
+		if self.practice:
+			self.last_submission = None
+			return
+		self.score_store.recordRun(self.score, duration)
+		self.high_score = max(self.high_score, self.score_store.high_score)
+		
+		# REQ-019: Submission the leaderboard can verify by re-simulation; the session
+		# replays a single racer under one tuning, so other runs are not submitted
+		self.last_submission = None
+		if len(self.players) == 1 and not self.tuning_reloaded:
+			self.last_submission = self.getSubmission()
+	
+	def onFirstFrame(self):
+		"""
+		Report the time to the first presented frame (REQ-022).
+		Measured from boot_start; in the browser the page clock also covers
+		downloading and starting the pygbag bundle.
+		"""
+		self.first_frame_ms = (time.perf_counter() - self.boot_start) * 1000.0
+		report = f"[BOOT] First frame after {self.first_frame_ms:.0f} ms"
+		if RUNNING_IN_PYGBAG:
+			import platform  # pygbag's browser bridge, only available under emscripten
+			report += f" ({platform.window.performance.now():.0f} ms since page load)"
+		print(report)
+		if os.environ.get(BOOT_BENCH_ENV):
+			self.running = False
+	
+	def getSubmission(self):
+		"""
+		Seed, tick-indexed flap log and claimed result of the current run (REQ-019).
+		REQ-021: Flags runs played with difficulty progression so they re-simulate with it.
+		REQ-029: Likewise flags fixed-point runs.
+		"""
+		return {
+			"seed": self.obstacle_seed,
+			"flaps": self.flap_log.tolist(),
+			"ticks": self.tick,
+			"score": self.score,
+			"progression": self.difficulty.progressive,
+			"fixed_point": self.fixed_point,
+		}
 	
 	async def run(self):
 		"""
 		Main game loop (async for pygbag compatibility).
 		REQ-001: Web-based game execution
 		REQ-009: Async/await for pygbag
+		REQ-012: Background score flush
+		REQ-013: Background telemetry export
+		REQ-015: Autopilot soak loop
+		REQ-016: Per-subsystem allocation tracking
+		REQ-019: Fixed-step simulation
+		REQ-020: Live tuning reloads
+		REQ-022: Time-to-first-frame report
+		REQ-024: Selectable frame pacing
 		NFR-001: 60 FPS target
 		"""
+		tracker = self.memory_tracker
+		if tracker is not None:
+			tracker.start()
+		
 		while self.running:
 			# Delta time in seconds
-			dt = self.clock.tick(60) / 1000.0
+			# REQ-024: The power saver slows down while the game-over screen is static
+			idle = self.game_over and self.autopilot is None and self.particles.count == 0
+			dt = self.pacer.tick(idle=idle)
+			
+			# REQ-020: Tuning changes take effect between frames
+			self.pollTuning()
+			
+			if tracker is None:
+				self.handleEvents()
+				self.advance(dt)
+				self.draw()
+			else:
+				tracker.beginFrame()
+				self.handleEvents()
+				tracker.mark("events")
+				self.advance(dt)
+				tracker.mark("update")
+				self.draw()
+				tracker.mark("draw")
+			
+			# REQ-022: Startup benchmark
+			if self.first_frame_ms is None:
+				self.onFirstFrame()
+			
+			# REQ-012, REQ-013: Save queued runs and events while idle on the game-over screen
+			if self.game_over:
+				self.score_store.scheduleFlush()
+				self.telemetry.scheduleExport()
 			
-			self.handleEvents()
-			self.update(dt)
-			self.draw()
+			# REQ-015: Soak testing - the bot reports frame drift and restarts itself
+			if self.autopilot is not None:
+				self.autopilot.recordFrame(dt)
+				if self.game_over:
+					self.autopilot.runs += 1
+					self.restart()
 			
 			# REQ-009: Required for pygbag to yield control to browser
 			await asyncio.sleep(0)
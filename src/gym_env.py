@@ -0,0 +1,210 @@
+"""
+Emoji Flappy - Training Environment
+REQ-027: Gym-style environment for reinforcement learning
+
+Wraps the headless Session (REQ-018), which applies the game rules at
+PHYSICS_TICK_RATE without a display, in the Gymnasium calling convention:
+
+	env = FlappyEnv()
+	observation, info = env.reset(seed=1)
+	observation, reward, terminated, truncated, info = env.step(1)  # 1 = flap
+
+Gymnasium itself is not required. An observation is GYM_OBSERVATION_SIZE
+floats: player y, velocity, next gap top, next gap bottom and the horizontal
+distance to that obstacle, each scaled to roughly [-1, 1]. With pixels=True the
+observation is instead a GYM_PIXEL_SIZE RGB frame (bytes), drawn off-screen with
+plain rectangles, so no window or fonts are needed.
+
+VectorFlappyEnv steps many sessions per call, writing observations and rewards
+into preallocated flat arrays and resetting finished sessions in place.
+"""
+
+import random
+from array import array
+import pygame as pg
+from config import (
+	SCREEN_WIDTH, SCREEN_HEIGHT, EMOJI_SIZE, BG_COLOR, V_MAX_DOWN,
+	GYM_OBSERVATION_SIZE, GYM_REWARD_ALIVE, GYM_REWARD_SCORE, GYM_REWARD_CRASH,
+	GYM_MAX_TICKS, GYM_PIXEL_SIZE, GYM_PLAYER_COLOR, GYM_OBSTACLE_COLOR
+)
+from server import Session, PLAYER_LEFT
+from tuning import DEFAULT_TUNING
+
+ACTION_NOOP = 0
+ACTION_FLAP = 1
+
+
+def observe(session, out, offset=0):
+	"""Write the session's observation vector into out[offset:offset + GYM_OBSERVATION_SIZE]."""
+	gap_top = 0.0
+	gap_bottom = SCREEN_HEIGHT
+	distance = SCREEN_WIDTH - PLAYER_LEFT
+	# The next obstacle is the first one whose right edge is still ahead of the player
+	for obstacle in session.obstacles:
+		if obstacle.x + EMOJI_SIZE >= PLAYER_LEFT:
+			gap_top = obstacle.gap_top
+			gap_bottom = obstacle.gap_bottom
+			distance = obstacle.x - PLAYER_LEFT
+			break
+	out[offset] = session.y / SCREEN_HEIGHT
+	out[offset + 1] = session.velocity / V_MAX_DOWN
+	out[offset + 2] = gap_top / SCREEN_HEIGHT
+	out[offset + 3] = gap_bottom / SCREEN_HEIGHT
+	out[offset + 4] = distance / SCREEN_WIDTH
+
+
+def stepSession(session, action):
+	"""Apply action for the session's next tick and advance it; returns the reward."""
+	if action:
+		session.flaps.append(session.tick)
+	score = session.score
+	session.advance(1)
+	if session.cause is not None:
+		return GYM_REWARD_CRASH
+	return GYM_REWARD_ALIVE + (session.score - score) * GYM_REWARD_SCORE
+
+
+class FlappyEnv:
+	"""
+	Single training environment (REQ-027).
+	reset()/step() follow Gymnasium's signatures; render() returns the pixel frame.
+	"""
+
+	def __init__(self, pixels=False, max_ticks=GYM_MAX_TICKS, tuning=DEFAULT_TUNING,
+				 progressive=False, seed=None):
+		"""
+		Args:
+			pixels: Observe GYM_PIXEL_SIZE RGB frames instead of the state vector
+			max_ticks: Ticks after which an episode is truncated
+			tuning: Gameplay parameters (REQ-020)
+			progressive: Play with difficulty progression (REQ-021)
+			seed: Seeds the stream of episode seeds used when reset() gets none
+		"""
+		self.pixels = pixels
+		self.max_ticks = max_ticks
+		self.tuning = tuning
+		self.progressive = progressive
+		self.seeds = random.Random(seed)
+		self.session = None
+		self.vector = array("f", bytes(4 * GYM_OBSERVATION_SIZE))
+		self.frame = None
+
+	def reset(self, seed=None):
+		"""Start a new episode; returns (observation, info)."""
+		if seed is None:
+			seed = self.seeds.randrange(2 ** 32)
+		self.session = Session(seed, [], self.max_ticks, tuning=self.tuning,
+							   progressive=self.progressive)
+		return self.getObservation(), {"seed": seed, "score": 0, "tick": 0}
+
+	def step(self, action):
+		"""
+		Advance one physics tick.
+
+		Returns:
+			(observation, reward, terminated, truncated, info); terminated means the
+			bird crashed, truncated that the episode reached max_ticks
+		"""
+		session = self.session
+		reward = stepSession(session, action)
+		terminated = session.cause is not None
+		truncated = session.done and not terminated
+		info = {"score": session.score, "tick": session.tick, "cause": session.cause}
+		return self.getObservation(), reward, terminated, truncated, info
+
+	def getObservation(self):
+		if self.pixels:
+			return self.render()
+		observe(self.session, self.vector)
+		return tuple(self.vector)
+
+	def render(self):
+		"""Current state as GYM_PIXEL_SIZE RGB bytes, drawn off-screen."""
+		width, height = GYM_PIXEL_SIZE
+		if self.frame is None:
+			self.frame = pg.Surface(GYM_PIXEL_SIZE)
+		frame = self.frame
+		sx = width / SCREEN_WIDTH
+		sy = height / SCREEN_HEIGHT
+		tile = max(1, round(EMOJI_SIZE * sx))
+		frame.fill(BG_COLOR)
+		for obstacle in self.session.obstacles:
+			x = round(obstacle.x * sx)
+			frame.fill(GYM_OBSTACLE_COLOR, (x, 0, tile, round(obstacle.gap_top * sy)))
+			bottom = round(obstacle.gap_bottom * sy)
+			frame.fill(GYM_OBSTACLE_COLOR, (x, bottom, tile, height - bottom))
+		size = max(1, round(EMOJI_SIZE * sy))
+		frame.fill(GYM_PLAYER_COLOR, (round(PLAYER_LEFT * sx),
+									  round(self.session.y * sy) - size // 2, tile, size))
+		return pg.image.tobytes(frame, "RGB")
+
+
+class VectorFlappyEnv:
+	"""
+	Batch of independent vector-observation environments (REQ-027).
+	step(actions) advances every session one tick; finished sessions are reset
+	in the same call, as Gymnasium's vector environments do, and the episode that
+	just ended is reported in the infos.
+	"""
+
+	def __init__(self, count, max_ticks=GYM_MAX_TICKS, tuning=DEFAULT_TUNING,
+				 progressive=False, seed=None):
+		self.count = count
+		self.max_ticks = max_ticks
+		self.tuning = tuning
+		self.progressive = progressive
+		self.seeds = random.Random(seed)
+		self.sessions = [None] * count
+		# Flat row-major buffers reused by every step
+		self.observations = array("f", bytes(4 * count * GYM_OBSERVATION_SIZE))
+		self.rewards = array("f", bytes(4 * count))
+		self.terminated = bytearray(count)
+		self.truncated = bytearray(count)
+
+	def createSession(self, seed=None):
+		if seed is None:
+			seed = self.seeds.randrange(2 ** 32)
+		return Session(seed, [], self.max_ticks, tuning=self.tuning, progressive=self.progressive)
+
+	def reset(self, seed=None):
+		"""
+		Start a new episode in every environment; environment i uses seed + i when given.
+		Returns (observations, infos).
+		"""
+		observations = self.observations
+		for i in range(self.count):
+			session = self.createSession(None if seed is None else seed + i)
+			self.sessions[i] = session
+			observe(session, observations, i * GYM_OBSERVATION_SIZE)
+		return observations, {}
+
+	def step(self, actions):
+		"""
+		Advance every environment one tick with actions[i].
+
+		Returns:
+			(observations, rewards, terminated, truncated, infos); the buffers are
+			reused between calls. infos maps the index of each environment that
+			finished an episode to its final score, tick count and cause.
+		"""
+		sessions = self.sessions
+		observations = self.observations
+		rewards = self.rewards
+		terminated = self.terminated
+		truncated = self.truncated
+		infos = {}
+		offset = 0
+		for i, session in enumerate(sessions):
+			rewards[i] = stepSession(session, actions[i])
+			if session.done:
+				crashed = session.cause is not None
+				terminated[i] = crashed
+				truncated[i] = not crashed
+				infos[i] = {"score": session.score, "tick": session.tick, "cause": session.cause}
+				session = sessions[i] = self.createSession()
+			else:
+				terminated[i] = 0
+				truncated[i] = 0
+			observe(session, observations, offset)
+			offset += GYM_OBSERVATION_SIZE
+		return observations, rewards, terminated, truncated, infos
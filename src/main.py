@@ -4,25 +4,46 @@ Emoji Flappy - Main Entry Point
 REQ-001: Web-based display (pygbag compatible)
 REQ-008: Quit shortcut (Esc/Q)
 REQ-009: Async compatibility
+REQ-012: Persistent high score
+REQ-013: Gameplay telemetry
+REQ-016: Memory growth tracking
+REQ-022: Lazy subsystem initialisation
+REQ-024: Frame pacing report
 """
 
+import time
+BOOT_START = time.perf_counter()  # REQ-022: first-frame time includes the imports below
+
 import asyncio
 import pygame as pg
 import sys
+from config import init_subsystems
 from game import Game
 
 
 async def main():
 	"""Entry point for Emoji Flappy game (async for pygbag)."""
-	pg.init()
+	# REQ-022: Only display and font up front; other subsystems start on first use
+	init_subsystems()
+	game = None
 	
 	try:
-		game = Game()
+		game = Game(boot_start=BOOT_START)
 		await game.run()
 	except Exception as e:
 		print(f"Error during game execution: {e}")
 		raise
 	finally:
+		# REQ-012, REQ-013: Write any runs and events still queued before exiting
+		if game is not None:
+			await game.score_store.close()
+			await game.telemetry.close()
+			# REQ-016: Allocation report for opt-in memory tracking
+			if game.memory_tracker is not None:
+				print(game.memory_tracker.getReport())
+				game.memory_tracker.stop()
+			# REQ-024: Achieved frame rate and jitter for the pacing mode
+			print(game.pacer.getReport())
 		pg.quit()
 
 
@@ -0,0 +1,154 @@
+"""
+Emoji Flappy - Memory Tracker
+REQ-016: Memory growth tracking
+
+Opt-in allocation tracker for long sessions. Uses tracemalloc to measure the
+net and transient Python allocations of each frame subsystem (events, update,
+draw), gc callbacks to time collector pauses, and a snapshot at every restart
+to flag steady growth between otherwise identical runs.
+
+tracemalloc only sees allocations made through Python's allocator; pixel
+buffers owned by SDL (Surface data) are not included.
+"""
+
+import gc
+import time
+import tracemalloc
+from config import MEMTRACK_TOP_SITES, MEMTRACK_WARMUP_RESTARTS, MEMTRACK_GROWTH_BYTES
+
+
+class SubsystemStats:
+	"""Per-subsystem allocation summary."""
+
+	def __init__(self):
+		self.frames = 0
+		self.net_bytes = 0
+		self.transient_max = 0
+		self.transient_total = 0
+
+	def add(self, net, transient):
+		self.frames += 1
+		self.net_bytes += net
+		self.transient_total += transient
+		if transient > self.transient_max:
+			self.transient_max = transient
+
+
+class MemoryTracker:
+	"""
+	Allocation and GC tracker around the frame loop (REQ-016).
+	Call beginFrame() then mark(name) after each subsystem.
+	"""
+
+	def __init__(self, frames=1):
+		self.trace_frames = frames
+		self.subsystems = {}
+		self.gc_pauses = {0: [0, 0.0, 0.0], 1: [0, 0.0, 0.0], 2: [0, 0.0, 0.0]}
+		self.gc_start = None
+		self.restart_samples = []
+		self.growth_flagged = False
+		self.baseline = None
+		self.last_current = 0
+
+	def start(self):
+		"""Begin tracing allocations and GC pauses."""
+		if not tracemalloc.is_tracing():
+			tracemalloc.start(self.trace_frames)
+		gc.callbacks.append(self.onGc)
+		self.baseline = tracemalloc.take_snapshot()
+		self.beginFrame()
+
+	def stop(self):
+		"""Stop tracing and detach the GC callback."""
+		if self.onGc in gc.callbacks:
+			gc.callbacks.remove(self.onGc)
+		tracemalloc.stop()
+
+	def onGc(self, phase, info):
+		"""gc callback: time each collection by generation."""
+		if phase == "start":
+			self.gc_start = time.perf_counter()
+		elif self.gc_start is not None:
+			pause = time.perf_counter() - self.gc_start
+			stats = self.gc_pauses.setdefault(info.get("generation", 2), [0, 0.0, 0.0])
+			stats[0] += 1
+			stats[1] += pause
+			stats[2] = max(stats[2], pause)
+			self.gc_start = None
+
+	def beginFrame(self):
+		"""Reset the transient peak at the start of a frame."""
+		tracemalloc.reset_peak()
+		self.last_current = tracemalloc.get_traced_memory()[0]
+
+	def mark(self, name):
+		"""Attribute allocations since the previous mark to a subsystem."""
+		current, peak = tracemalloc.get_traced_memory()
+		stats = self.subsystems.get(name)
+		if stats is None:
+			stats = self.subsystems[name] = SubsystemStats()
+		stats.add(current - self.last_current, peak - self.last_current)
+		tracemalloc.reset_peak()
+		self.last_current = tracemalloc.get_traced_memory()[0]
+
+	def onRestart(self):
+		"""
+		Sample traced memory at a restart and flag steady growth.
+		Returns True when growth has just been detected.
+		"""
+		gc.collect()
+		self.restart_samples.append(tracemalloc.get_traced_memory()[0])
+		samples = self.restart_samples[MEMTRACK_WARMUP_RESTARTS:]
+		if len(samples) < 3 or self.growth_flagged:
+			return False
+
+		slope = getSlope(samples)
+		rising = all(b >= a for a, b in zip(samples, samples[1:]))
+		if slope > MEMTRACK_GROWTH_BYTES and rising:
+			self.growth_flagged = True
+			print(f"[MEMORY] Steady growth of {slope / 1024:.1f} KiB per restart "
+				  f"over {len(samples)} restarts")
+			return True
+		return False
+
+	def getTopSites(self, limit=MEMTRACK_TOP_SITES):
+		"""Allocation sites that grew most since tracking started."""
+		snapshot = tracemalloc.take_snapshot().filter_traces((
+			tracemalloc.Filter(False, tracemalloc.__file__),
+			tracemalloc.Filter(False, __file__),
+		))
+		if self.baseline is None:
+			return snapshot.statistics("lineno")[:limit]
+		return snapshot.compare_to(self.baseline, "lineno")[:limit]
+
+	def getReport(self):
+		"""Multi-line summary of subsystem allocations, GC pauses and top sites."""
+		lines = ["[MEMORY] Allocation report"]
+		current, peak = tracemalloc.get_traced_memory()
+		lines.append(f"  traced now={current / 1024:.1f} KiB")
+		for name, stats in self.subsystems.items():
+			mean = stats.transient_total / stats.frames if stats.frames else 0
+			lines.append(
+				f"  {name}: frames={stats.frames} net={stats.net_bytes / 1024:.1f} KiB "
+				f"transient_mean={mean:.0f} B transient_max={stats.transient_max} B"
+			)
+		for generation, (count, total, longest) in sorted(self.gc_pauses.items()):
+			lines.append(
+				f"  gc gen{generation}: collections={count} total={total * 1000:.2f} ms "
+				f"max={longest * 1000:.3f} ms"
+			)
+		if len(self.restart_samples) > 1:
+			lines.append(f"  growth per restart={getSlope(self.restart_samples) / 1024:.1f} KiB")
+		for stat in self.getTopSites():
+			lines.append(f"  {stat}")
+		return "\n".join(lines)
+
+
+def getSlope(samples):
+	"""Least-squares slope of samples against their index."""
+	n = len(samples)
+	mean_x = (n - 1) / 2
+	mean_y = sum(samples) / n
+	num = sum((i - mean_x) * (y - mean_y) for i, y in enumerate(samples))
+	den = sum((i - mean_x) ** 2 for i in range(n))
+	return num / den if den else 0.0
@@ -0,0 +1,165 @@
+"""
+Emoji Flappy - Frame Pacing
+REQ-024: Selectable frame pacing with jitter reporting
+
+The frame loop waits for the next frame through a FramePacer instead of a
+fixed clock.tick(60). Modes:
+
+	sleep       clock.tick(TARGET_FPS); sleeps between frames (default)
+	vsync       the display flip waits for the monitor refresh; the clock only measures
+	precise     clock.tick_busy_loop(TARGET_FPS); spins instead of sleeping for even frames
+	uncapped    no wait at all; for benchmarking the frame cost
+	powersaver  like sleep, but drops to POWER_SAVER_FPS while idle on the game-over screen
+
+Every frame time is recorded so each mode can report the jitter it achieved:
+the standard deviation of the frame time and the 99th percentile distance from
+the target frame time. Frame times come from perf_counter rather than the
+clock's whole milliseconds, so uncapped sub-millisecond frames still register.
+The first frame (which includes startup) and idle power-saver frames are kept
+out of the jitter figures.
+"""
+
+import math
+import os
+import time
+from array import array
+import pygame as pg
+from config import (
+	RUNNING_IN_PYGBAG, PACING_ENV, PACING_MODES, PACING_DEFAULT_MODE, TARGET_FPS,
+	POWER_SAVER_FPS, PACING_SAMPLE_FRAMES, get_screen
+)
+
+
+class FramePacer:
+	"""
+	Frame limiter and frame-time statistics (REQ-024).
+	Call tick() once per frame; it returns the frame's delta time in seconds.
+	"""
+
+	def __init__(self, mode=None, fps=TARGET_FPS, idle_fps=POWER_SAVER_FPS):
+		"""
+		Args:
+			mode: One of PACING_MODES; None reads PACING_ENV
+		"""
+		if mode is None:
+			mode = os.environ.get(PACING_ENV) or PACING_DEFAULT_MODE
+		if mode not in PACING_MODES:
+			print(f"[WARNING] Unknown pacing mode {mode!r}, using {PACING_DEFAULT_MODE}")
+			mode = PACING_DEFAULT_MODE
+		# The browser paces frames itself; spinning would only block its event loop
+		if mode == "precise" and RUNNING_IN_PYGBAG:
+			print("[WARNING] Precise pacing is not available in the browser, using sleep")
+			mode = PACING_DEFAULT_MODE
+		self.mode = mode
+		self.fps = fps
+		self.idle_fps = idle_fps
+		self.clock = pg.time.Clock()
+		self.last_time = None
+
+		# Ring of recent active frame times in ms, for the percentile
+		self.samples = array("d", bytes(8 * PACING_SAMPLE_FRAMES))
+		self.resetStats()
+
+	def resetStats(self):
+		self.frames = 0
+		self.idle_frames = 0
+		self.frame_total = 0.0
+		self.frame_squares = 0.0
+		self.frame_max = 0.0
+
+	def openDisplay(self, size):
+		"""
+		Create the display for this mode.
+		A vsync display falls back to a plain one with precise pacing when the
+		driver cannot synchronise to the refresh.
+		"""
+		if self.mode == "vsync":
+			try:
+				return get_screen(size, vsync=True)
+			except pg.error as e:
+				print(f"[WARNING] Vsync unavailable ({e}), using precise pacing")
+				self.mode = "precise"
+		return get_screen(size)
+
+	def tick(self, idle=False):
+		"""
+		Wait for the next frame as the mode dictates.
+
+		Args:
+			idle: Nothing on screen is moving; the power saver drops to idle_fps
+
+		Returns:
+			Time since the previous frame in seconds
+		"""
+		mode = self.mode
+		idle = idle and mode == "powersaver"
+		if mode == "precise":
+			ms = self.clock.tick_busy_loop(self.fps)
+		elif mode == "vsync" or mode == "uncapped":
+			ms = self.clock.tick()
+		else:
+			ms = self.clock.tick(self.idle_fps if idle else self.fps)
+
+		now = time.perf_counter()
+		if self.last_time is None:
+			self.last_time = now
+			return ms / 1000.0
+		dt = now - self.last_time
+		self.last_time = now
+		if idle:
+			self.idle_frames += 1
+		else:
+			self.recordFrame(dt * 1000.0)
+		return dt
+
+	def recordFrame(self, ms):
+		"""Add one active frame time in milliseconds to the statistics."""
+		self.samples[self.frames % PACING_SAMPLE_FRAMES] = ms
+		self.frames += 1
+		self.frame_total += ms
+		self.frame_squares += ms * ms
+		if ms > self.frame_max:
+			self.frame_max = ms
+
+	def getTargetMs(self):
+		"""Frame time the mode aims for; vsync and uncapped aim for their own mean."""
+		if self.mode in ("vsync", "uncapped"):
+			return self.frame_total / self.frames if self.frames else 0.0
+		return 1000.0 / self.fps
+
+	def getStats(self):
+		"""
+		Achieved pacing over the active frames.
+
+		Returns:
+			dict with "frames", "idle_frames", "mean_ms", "fps", "jitter_ms" (standard
+			deviation), "p99_ms" (99th percentile distance from the target) and "max_ms"
+		"""
+		frames = self.frames
+		if frames == 0:
+			return {"frames": 0, "idle_frames": self.idle_frames, "mean_ms": 0.0, "fps": 0.0,
+					"jitter_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+		mean = self.frame_total / frames
+		variance = max(self.frame_squares / frames - mean * mean, 0.0)
+		target = self.getTargetMs()
+		count = min(frames, PACING_SAMPLE_FRAMES)
+		deviations = sorted(abs(ms - target) for ms in self.samples[:count])
+		return {
+			"frames": frames,
+			"idle_frames": self.idle_frames,
+			"mean_ms": mean,
+			"fps": 1000.0 / mean if mean else 0.0,
+			"jitter_ms": math.sqrt(variance),
+			"p99_ms": deviations[min(count - 1, int(count * 0.99))],
+			"max_ms": self.frame_max,
+		}
+
+	def getReport(self):
+		"""One-line summary of the achieved frame rate and jitter."""
+		stats = self.getStats()
+		return (
+			f"[PACING] mode={self.mode} frames={stats['frames']} idle={stats['idle_frames']} "
+			f"fps={stats['fps']:.1f} mean={stats['mean_ms']:.2f}ms "
+			f"jitter={stats['jitter_ms']:.2f}ms p99={stats['p99_ms']:.2f}ms "
+			f"max={stats['max_ms']:.2f}ms"
+		)
@@ -0,0 +1,154 @@
+"""
+Emoji Flappy - Particle Effects
+REQ-025: Pooled particle effects
+
+Flap feathers, score sparkles and crash debris. Particles live in one
+preallocated pool of parallel arrays (position, velocity, gravity, lifetime,
+sprite set) instead of one Python object each: the live particles are kept
+packed at the front, an expired particle is replaced by the last live one, and
+update() walks the arrays in a single loop. Every effect has PARTICLE_FADE_STEPS
+pre-rendered sprites of decreasing opacity, and draw() queues the whole pool on
+the particles layer, which the render queue draws with one Surface.blits call.
+
+Particles are cosmetic: they use their own random stream and frame time, so
+seeded obstacle streams and verified runs are unaffected.
+"""
+
+import math
+import random
+from array import array
+import pygame as pg
+from config import PARTICLE_CAPACITY, PARTICLE_FADE_STEPS, PARTICLE_EFFECTS
+from render import LAYER_PARTICLES
+
+
+def createSprites(colour, size, steps=PARTICLE_FADE_STEPS):
+	"""Sprites for one effect, from faintest to fully opaque."""
+	sprites = []
+	for step in range(1, steps + 1):
+		sprite = pg.Surface((size, size), pg.SRCALPHA)
+		alpha = round(255 * step / steps)
+		pg.draw.circle(sprite, (*colour, alpha), (size / 2, size / 2), size / 2)
+		sprites.append(sprite)
+	return sprites
+
+
+class ParticleSystem:
+	"""
+	Fixed-capacity particle pool (REQ-025).
+	emit() adds a burst, update(dt) moves and expires particles, draw() queues them.
+	"""
+
+	def __init__(self, capacity=PARTICLE_CAPACITY, effects=PARTICLE_EFFECTS, rng=None):
+		self.capacity = capacity
+		self.rng = rng or random.Random()
+		self.count = 0
+
+		# Parallel columns; only the first count entries are live
+		self.x = array("f", bytes(4 * capacity))
+		self.y = array("f", bytes(4 * capacity))
+		self.vx = array("f", bytes(4 * capacity))
+		self.vy = array("f", bytes(4 * capacity))
+		self.gravity = array("f", bytes(4 * capacity))
+		self.life = array("f", bytes(4 * capacity))
+		self.fade = array("f", bytes(4 * capacity))  # fade steps per second of life
+		self.sprite = array("H", bytes(2 * capacity))  # first sprite of the particle's effect
+
+		# All effects' sprites in one list; an effect's fade steps are consecutive
+		self.effects = {}
+		self.sprites = []
+		for name, effect in effects.items():
+			count, colour, size, speed, direction, spread, gravity, lifetime = effect
+			self.effects[name] = (len(self.sprites), count, size, speed, direction, spread,
+								  gravity, lifetime)
+			self.sprites.extend(createSprites(colour, size))
+		self.scaled_sprites = self.sprites
+		self.scaled_for = None
+
+	def emit(self, name, x, y, count=None):
+		"""
+		Start a burst of effect name centred on (x, y).
+		Particles that do not fit in the pool are dropped.
+
+		Returns:
+			Number of particles emitted
+		"""
+		(first_sprite, default_count, size, speed, direction, spread, gravity,
+		 lifetime) = self.effects[name]
+		count = default_count if count is None else count
+		count = min(count, self.capacity - self.count)
+		rng = self.rng
+		half = size / 2
+		fade = PARTICLE_FADE_STEPS / lifetime
+		for i in range(self.count, self.count + count):
+			angle = math.radians(direction + rng.uniform(-spread, spread))
+			velocity = speed * rng.uniform(0.4, 1.0)
+			self.x[i] = x - half
+			self.y[i] = y - half
+			self.vx[i] = math.cos(angle) * velocity
+			self.vy[i] = math.sin(angle) * velocity
+			self.gravity[i] = gravity
+			self.life[i] = lifetime * rng.uniform(0.6, 1.0)
+			self.fade[i] = fade
+			self.sprite[i] = first_sprite
+		self.count += count
+		return count
+
+	def update(self, dt):
+		"""Advance every live particle by dt seconds and drop the expired ones."""
+		xs, ys, vxs, vys = self.x, self.y, self.vx, self.vy
+		gravity, life, fade, sprite = self.gravity, self.life, self.fade, self.sprite
+		count = self.count
+		i = 0
+		while i < count:
+			remaining = life[i] - dt
+			if remaining <= 0.0:
+				# Move the last live particle into the freed slot
+				count -= 1
+				xs[i] = xs[count]
+				ys[i] = ys[count]
+				vxs[i] = vxs[count]
+				vys[i] = vys[count]
+				gravity[i] = gravity[count]
+				life[i] = life[count]
+				fade[i] = fade[count]
+				sprite[i] = sprite[count]
+				continue
+			life[i] = remaining
+			vy = vys[i] + gravity[i] * dt
+			vys[i] = vy
+			xs[i] += vxs[i] * dt
+			ys[i] += vy * dt
+			i += 1
+		self.count = count
+
+	def draw(self, queue, target=None):
+		"""
+		Queue every live particle on the particles layer (REQ-026).
+		target: optional RenderTarget when drawing at a scaled resolution (REQ-014)
+		"""
+		count = self.count
+		if count == 0:
+			return
+		sprites = self.sprites
+		scale = 1.0
+		if target is not None:
+			scale = target.scale
+			if self.scaled_for is not target:
+				self.scaled_sprites = [target.sprite(s) for s in sprites]
+				self.scaled_for = target
+			sprites = self.scaled_sprites
+		last_step = PARTICLE_FADE_STEPS - 1
+		life, fade, first = self.life, self.fade, self.sprite
+		if scale == 1.0:
+			positions = zip(self.x[:count], self.y[:count])
+		else:
+			positions = ((x * scale, y * scale) for x, y in zip(self.x[:count], self.y[:count]))
+		queue.extend(LAYER_PARTICLES, [
+			(sprites[first[i] + min(int(life[i] * fade[i]), last_step)], position)
+			for i, position in enumerate(positions)
+		])
+
+	def clear(self):
+		"""Drop every live particle."""
+		self.count = 0
@@ -0,0 +1,81 @@
+"""
+Emoji Flappy - Racing
+REQ-017: Local racing and ghost replays
+
+Helpers for several birds sharing one obstacle stream: a ghost that replays
+the main player's previous run, and a collision pass that tests each obstacle
+against all racers with a single horizontal overlap check.
+"""
+
+from array import array
+from config import GHOST_ALPHA
+from render import LAYER_GHOSTS
+
+
+class Ghost:
+	"""
+	Replay of a recorded run (REQ-017).
+	Positions are replayed tick by tick, so the ghost never collides or scores.
+	"""
+
+	def __init__(self, player, trajectory):
+		self.x = player.x
+		self.trajectory = array("f", trajectory)
+		self.index = 0
+		self.surface = player.surface.copy()
+		self.surface.set_alpha(GHOST_ALPHA)
+		self.rect = self.surface.get_rect(center=(self.x, player.y))
+		self.start = self.rect.center
+
+	@property
+	def alive(self):
+		return self.index < len(self.trajectory)
+
+	def seek(self, index):
+		"""Jump to a recorded tick, as when a snapshot is restored (REQ-028)."""
+		self.index = min(index, len(self.trajectory))
+		if self.index > 0:
+			self.rect.center = (self.x, self.trajectory[self.index - 1])
+		else:
+			self.rect.center = self.start
+	
+	def update(self):
+		"""Advance one recorded tick."""
+		if self.alive:
+			self.rect.center = (self.x, self.trajectory[self.index])
+			self.index += 1
+
+	def draw(self, queue, target=None):
+		"""Queue the translucent ghost while its recording lasts (REQ-026)."""
+		if not self.alive:
+			return
+		if target is None:
+			queue.submit(LAYER_GHOSTS, self.surface, self.rect.topleft)
+		else:
+			queue.submit(LAYER_GHOSTS, target.sprite(self.surface),
+						 target.toRender(self.rect.topleft))
+
+
+def findCollisions(obstacles, racers):
+	"""
+	Collisions between obstacles and live racers (REQ-004, REQ-017).
+	Racers fly in a shared column, so each obstacle needs one horizontal
+	overlap test; per-racer checks only run for the few obstacles inside it.
+
+	Returns a list of (racer, cause) pairs, at most one per racer.
+	"""
+	if not racers:
+		return []
+	left = min(racer.rect.left for racer in racers)
+	right = max(racer.rect.right for racer in racers)
+
+	hits = {}
+	for obstacle in obstacles:
+		if not obstacle.overlapsColumn(left, right):
+			continue
+		for racer in racers:
+			if racer not in hits:
+				cause = obstacle.getCollisionCause(racer.getRect())
+				if cause is not None:
+					hits[racer] = cause
+	return list(hits.items())
@@ -0,0 +1,134 @@
+"""
+Emoji Flappy - Obstacle Reachability
+REQ-011: Solvable obstacle layouts
+
+Precomputes, from the flap/gravity physics in config.py, how far the player can
+rise or fall over a given horizontal distance. The spawner uses the tables to
+reject obstacle pairs the player cannot physically fly between.
+"""
+
+import math
+import random
+from config import EMOJI_SIZE, PHYSICS_TICK_RATE, REACH_MARGIN
+from tuning import DEFAULT_TUNING
+
+
+def stepPhysics(y, velocity, flap, dt, tuning=DEFAULT_TUNING):
+	"""
+	Advance a headless player by one tick, mirroring Player.flap/Player.update.
+	Returns (y, velocity).
+	"""
+	if flap:
+		velocity = tuning.v_flap
+	velocity += tuning.g * dt
+	velocity = max(tuning.v_max_up, min(tuning.v_max_down, velocity))
+	return y + velocity * dt, velocity
+
+
+def generateGap(screen_height, reach=None, rng=random, tuning=DEFAULT_TUNING):
+	"""
+	Random obstacle gap (REQ-003), shared by Obstacle and headless sessions.
+
+	Args:
+		screen_height: Height of the play area in px
+		reach: Optional (top, bottom) range of reachable player centres;
+			the gap is placed so part of it lies inside (REQ-011); when no gap
+			centre within the bounds can, the nearest bound is used
+		rng: Random source; draws exactly two values
+		tuning: Gap sizes and centre bounds (REQ-020), precomputed when
+			screen_height is SCREEN_HEIGHT
+
+	Returns (gap_top, gap_bottom).
+	"""
+	gap_size = rng.randint(tuning.gap_size_range[0], tuning.gap_size_range[1])
+	center_min, center_max = tuning.getGapBounds(gap_size, screen_height)
+
+	if reach is not None:
+		# Player centre must fit between the gap edges
+		slack = gap_size // 2 - EMOJI_SIZE // 2
+		reach_min = max(center_min, int(math.ceil(reach[0])) - slack)
+		reach_max = min(center_max, int(math.floor(reach[1])) + slack)
+		if reach_min <= reach_max:
+			center_min, center_max = reach_min, reach_max
+		else:
+			# The reach lies past the screen margins; closest placement still allowed
+			nearest = (int(math.ceil(reach[0])) + int(math.floor(reach[1]))) // 2
+			center_min = center_max = max(center_min, min(center_max, nearest))
+
+	gap_center = rng.randint(center_min, center_max)
+	return gap_center - gap_size // 2, gap_center + gap_size // 2
+
+
+class ReachabilityEnvelope:
+	"""
+	Lookup tables of the maximum rise and drop reachable after N ticks (REQ-011).
+	Built once per tuning (REQ-020).
+
+	Both tables start from rest: the rise assumes a flap on every tick and the
+	drop assumes no flaps at all. Every displacement in between is reachable by
+	choosing when to flap.
+	"""
+
+	def __init__(self, max_distance=None, tick_rate=PHYSICS_TICK_RATE, margin=REACH_MARGIN,
+				 tuning=DEFAULT_TUNING):
+		if max_distance is None:
+			max_distance = tuning.max_spawn_distance
+
+		self.dt = 1.0 / tick_rate
+		self.margin = margin
+		# Horizontal distance the world scrolls per tick
+		self.step = tuning.scroll_speed * self.dt
+		self.max_ticks = int(math.ceil(max_distance / self.step))
+
+		self.max_rise = [0.0]
+		self.max_drop = [0.0]
+		rise_y, rise_v = 0.0, 0.0
+		drop_y, drop_v = 0.0, 0.0
+		for _ in range(self.max_ticks):
+			rise_y, rise_v = stepPhysics(rise_y, rise_v, True, self.dt, tuning)
+			drop_y, drop_v = stepPhysics(drop_y, drop_v, False, self.dt, tuning)
+			self.max_rise.append(max(0.0, -rise_y))
+			self.max_drop.append(max(0.0, drop_y))
+
+	def ticksForDistance(self, distance):
+		"""
+		Ticks available to cover a horizontal distance in px.
+		Distances beyond the table are clamped, which under-estimates reach.
+		"""
+		ticks = int(distance // self.step)
+		return max(0, min(self.max_ticks, ticks))
+
+	def getRise(self, distance):
+		"""Maximum upward displacement (px) over a horizontal distance."""
+		return self.max_rise[self.ticksForDistance(distance)]
+
+	def getDrop(self, distance):
+		"""Maximum downward displacement (px) over a horizontal distance."""
+		return self.max_drop[self.ticksForDistance(distance)]
+
+	def reachableCenters(self, previous, distance):
+		"""
+		Range (top, bottom) of player centres reachable at the next obstacle.
+
+		Args:
+			previous: Obstacle the player has to fly through first
+			distance: Horizontal spacing between the two obstacles in px
+		"""
+		half = EMOJI_SIZE // 2
+		# The player is only free to move once clear of the previous obstacle
+		free_distance = distance - previous.emoji_width - EMOJI_SIZE
+		rise = self.getRise(free_distance) * self.margin
+		drop = self.getDrop(free_distance) * self.margin
+
+		top = previous.gap_top + half - rise
+		bottom = previous.gap_bottom - half + drop
+		return (max(half, top), min(previous.screen_height - half, bottom))
+
+	def isReachable(self, previous, obstacle):
+		"""
+		Check whether the player can fly from one obstacle's gap into the next.
+		O(1): a single table lookup per call.
+		"""
+		top, bottom = self.reachableCenters(previous, obstacle.x - previous.x)
+		half = EMOJI_SIZE // 2
+		return obstacle.gap_top + half <= bottom and obstacle.gap_bottom - half >= top
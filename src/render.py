@@ -0,0 +1,114 @@
+"""
+Emoji Flappy - Render Target
+REQ-014: Resolution scaling
+REQ-026: Batched draw list
+
+The game is drawn to an internal surface whose size is RENDER_SCALE times the
+logical resolution, then scaled to the window once per frame. Gameplay keeps
+using logical coordinates; only positions and sprites are scaled when drawn.
+
+Entities do not blit directly: they submit (surface, position) commands to a
+RenderQueue under a layer, and the queue draws each layer with one
+Surface.blits call, bottom layer first.
+"""
+
+import weakref
+import pygame as pg
+
+# REQ-026: Draw layers, bottom to top
+LAYER_OBSTACLES = 0
+LAYER_GHOSTS = 1
+LAYER_PLAYERS = 2
+LAYER_PARTICLES = 3
+LAYER_HUD = 4
+LAYER_OVERLAY = 5
+LAYER_MENU = 6
+LAYER_NAMES = ("obstacles", "ghosts", "players", "particles", "hud", "overlay", "menu")
+
+
+class RenderQueue:
+	"""
+	Per-layer draw lists flushed with one blits call per layer (REQ-026).
+	counts holds the number of commands each layer drew in the last flush.
+	"""
+
+	def __init__(self):
+		self.layers = [[] for _ in LAYER_NAMES]
+		self.counts = [0] * len(LAYER_NAMES)
+
+	def submit(self, layer, surface, position):
+		"""Queue one blit of surface at position (a point or Rect) on layer."""
+		self.layers[layer].append((surface, position))
+
+	def extend(self, layer, commands):
+		"""Queue an iterable of (surface, position) commands on layer."""
+		self.layers[layer].extend(commands)
+
+	def flush(self, screen):
+		"""Draw every queued command onto screen, layer by layer, and empty the queue."""
+		counts = self.counts
+		for layer, commands in enumerate(self.layers):
+			counts[layer] = len(commands)
+			if commands:
+				screen.blits(commands, doreturn=False)
+				commands.clear()
+
+	def getCounts(self):
+		"""Commands drawn per layer name in the last flush."""
+		return dict(zip(LAYER_NAMES, self.counts))
+
+	def getTotal(self):
+		return sum(self.counts)
+
+
+class RenderTarget:
+	"""
+	Internal render surface plus the mapping from logical to render coordinates.
+	At scale 1.0 with a matching window, it draws straight to the display.
+	"""
+
+	def __init__(self, display, logical_size, scale=1.0):
+		self.display = display
+		self.logical_size = logical_size
+		self.scale = scale
+		self.size = (max(1, round(logical_size[0] * scale)), max(1, round(logical_size[1] * scale)))
+
+		if self.size == display.get_size():
+			self.surface = display
+		else:
+			self.surface = pg.Surface(self.size).convert()
+
+		# Scaled copies of sprites, dropped when the source surface is released
+		self.sprites = weakref.WeakKeyDictionary()
+
+	def toRender(self, pos):
+		"""Map a logical (x, y) position to render-target pixels."""
+		if self.scale == 1.0:
+			return pos
+		return (round(pos[0] * self.scale), round(pos[1] * self.scale))
+
+	def toRenderSize(self, size):
+		"""Map a logical length in px to render-target pixels."""
+		return max(1, round(size * self.scale))
+
+	def sprite(self, surface):
+		"""Sprite scaled to the render target, cached per source surface."""
+		if self.scale == 1.0:
+			return surface
+		scaled = self.sprites.get(surface)
+		if scaled is None:
+			width, height = surface.get_size()
+			size = (self.toRenderSize(width), self.toRenderSize(height))
+			try:
+				scaled = pg.transform.smoothscale(surface, size)
+			except ValueError:
+				# smoothscale only supports 24/32-bit surfaces
+				scaled = pg.transform.scale(surface, size)
+			self.sprites[surface] = scaled
+		return scaled
+
+	def present(self):
+		"""Scale the internal surface into the window (if needed) and flip."""
+		if self.surface is not self.display:
+			pg.transform.scale(self.surface, self.display.get_size(), self.display)
+		pg.display.flip()
@@ -0,0 +1,584 @@
+#!/usr/bin/env python3
+"""
+Emoji Flappy - Headless Game Server
+REQ-018: Headless session server
+REQ-021: Sessions follow the same difficulty progression as the game
+REQ-029: Sessions can re-simulate fixed-point runs
+
+Re-simulates submitted runs with the game rules at a fixed tick, without a
+display, fonts or surfaces, so a single process can hold thousands of
+sessions. Clients send one NDJSON job per line ({"id", "seed", "flaps",
+"ticks", optional "progression" and "fixed_point"}) and receive the simulated
+result ({"id", "score", "ticks", "cause"}), or {"id", "error"} for a bad job.
+Queued sessions are stepped in batches, either on the event loop in short
+slices or sharded across worker processes.
+
+Usage:
+	python src/server.py [--host HOST] [--port PORT] [--workers N]
+	python src/server.py --bench 5000   # local stand-in client, reports sessions/s
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from config import (
+	SCREEN_WIDTH, SCREEN_HEIGHT, EMOJI_SIZE,
+	PHYSICS_TICK_RATE, SERVER_HOST, SERVER_PORT, SERVER_WORKERS, SERVER_BATCH_SIZE,
+	SERVER_SLICE_TICKS, SERVER_MAX_TICKS, FIXED_SHIFT, FIXED_ONE
+)
+from difficulty import getCurve
+from reachability import generateGap
+from tuning import DEFAULT_TUNING
+from telemetry import CAUSE_CEILING, CAUSE_FLOOR, CAUSE_TOP_PIPE, CAUSE_BOTTOM_PIPE
+
+# Per-tick constants computed exactly as Game.advance does
+DT = 1.0 / PHYSICS_TICK_RATE
+TICK_MS = DT * 1000.0
+HALF = EMOJI_SIZE // 2
+PLAYER_LEFT = SCREEN_WIDTH // 4 - HALF
+PLAYER_RIGHT = PLAYER_LEFT + EMOJI_SIZE
+
+# REQ-029: The same bounds in 1/FIXED_ONE px
+HALF_FX = HALF * FIXED_ONE
+EMOJI_SIZE_FX = EMOJI_SIZE * FIXED_ONE
+SCREEN_HEIGHT_FX = SCREEN_HEIGHT * FIXED_ONE
+
+
+def warmWorker():
+	"""Build the per-process tables before the first batch arrives."""
+	getCurve()
+	getCurve(progressive=True)
+
+
+class ObstacleState:
+	"""Obstacle fields the rules and reachability checks need (REQ-003, REQ-011)."""
+
+	__slots__ = ("x", "x_fx", "gap_top", "gap_bottom", "emoji_width", "screen_height", "passed")
+
+	def __init__(self, x, gap):
+		self.x = x
+		self.x_fx = x * FIXED_ONE
+		self.gap_top, self.gap_bottom = gap
+		self.emoji_width = EMOJI_SIZE
+		self.screen_height = SCREEN_HEIGHT
+		self.passed = False
+
+
+class Session:
+	"""
+	One headless run of the game rules (REQ-018).
+	Mirrors Game.update at PHYSICS_TICK_RATE, drawing obstacles from the same
+	seeded stream as Game.rng. flaps lists the ticks on which the player flapped,
+	as recorded in Game.flap_log. progressive replays a run played with
+	difficulty progression on (REQ-021). fixed_point replays a run played with
+	fixed-point physics, keeping positions in y_fx and ObstacleState.x_fx (REQ-029).
+	"""
+
+	__slots__ = ("id", "difficulty", "level", "tuning", "rng", "flaps", "next_flap",
+				 "max_ticks", "x", "y", "velocity", "tick", "elapsed_ms", "score", "cause", "done",
+				 "obstacles", "next_spawn_ms", "fixed_point", "y_fx", "velocity_fx")
+
+	def __init__(self, seed, flaps=(), max_ticks=SERVER_MAX_TICKS, session_id=None,
+				 tuning=DEFAULT_TUNING, progressive=False, fixed_point=False):
+		self.id = session_id
+		# REQ-021: Tier tuning and reach tables, switched as the score rises
+		self.difficulty = getCurve(tuning, progressive)
+		self.level = self.difficulty.getLevel(0)
+		self.tuning = self.level.tuning
+		self.rng = random.Random(seed)
+		self.flaps = sorted(flaps)
+		self.next_flap = 0
+		self.max_ticks = min(max_ticks, SERVER_MAX_TICKS)
+		self.x = SCREEN_WIDTH // 4
+		self.y = float(SCREEN_HEIGHT // 2)
+		self.velocity = 0.0
+		self.tick = 0
+		self.elapsed_ms = 0.0
+		self.score = 0
+		self.cause = None
+		self.done = False
+		self.obstacles = []
+		self.next_spawn_ms = self.rng.randint(*self.tuning.spawn_interval_range)
+		self.fixed_point = fixed_point
+		self.y_fx = SCREEN_HEIGHT // 2 * FIXED_ONE
+		self.velocity_fx = 0
+
+	def end(self, cause=None):
+		self.cause = cause
+		self.done = True
+
+	def step(self):
+		"""Advance one tick."""
+		self.advance(1)
+
+	def advance(self, ticks):
+		"""
+		Advance up to ticks ticks: physics, boundaries, spawning, movement, collisions, score.
+		State lives in locals inside the loop; a ten-minute run takes a few milliseconds.
+		"""
+		if self.done:
+			return
+		if self.fixed_point:
+			self.advanceFixed(ticks)
+			return
+		flaps = self.flaps
+		flap_count = len(flaps)
+		next_flap = self.next_flap
+		y = self.y
+		velocity = self.velocity
+		tick = self.tick
+		elapsed_ms = self.elapsed_ms
+		score = self.score
+		obstacles = self.obstacles
+		player_x = self.x
+		tuning = self.tuning
+		v_flap = tuning.v_flap
+		gravity_step = tuning.g * DT
+		v_max_up = tuning.v_max_up
+		v_max_down = tuning.v_max_down
+		scroll_step = tuning.scroll_speed * DT
+		end_tick = min(self.max_ticks, tick + ticks)
+		cause = None
+
+		while tick < end_tick:
+			# REQ-002: Player.flap/Player.update
+			if next_flap < flap_count and flaps[next_flap] <= tick:
+				velocity = v_flap
+				while next_flap < flap_count and flaps[next_flap] <= tick:
+					next_flap += 1
+			velocity += gravity_step
+			if velocity < v_max_up:
+				velocity = v_max_up
+			elif velocity > v_max_down:
+				velocity = v_max_down
+			y += velocity * DT
+			tick += 1
+			elapsed_ms += TICK_MS
+
+			# REQ-004: Screen boundaries
+			if y - HALF <= 0:
+				cause = CAUSE_CEILING
+				break
+			if y + HALF >= SCREEN_HEIGHT:
+				cause = CAUSE_FLOOR
+				break
+
+			# REQ-003, REQ-011: Same draw order as Game.spawnObstacle
+			if elapsed_ms >= self.next_spawn_ms:
+				self.spawn(elapsed_ms)
+
+			# REQ-004: pg.Rect rounds the player's centre and truncates obstacle x
+			top = int(y + 0.5) - HALF
+			bottom = top + EMOJI_SIZE
+			for obstacle in obstacles:
+				obstacle.x -= scroll_step
+				x = int(obstacle.x)
+				if x < PLAYER_RIGHT and x + EMOJI_SIZE > PLAYER_LEFT:
+					if top < obstacle.gap_top:
+						cause = CAUSE_TOP_PIPE
+						break
+					if bottom > obstacle.gap_bottom:
+						cause = CAUSE_BOTTOM_PIPE
+						break
+			if cause is not None:
+				break
+
+			# REQ-005: Score once the player is past an obstacle
+			scored = False
+			for obstacle in obstacles:
+				if not obstacle.passed and player_x > obstacle.x + EMOJI_SIZE:
+					obstacle.passed = True
+					score += 1
+					scored = True
+
+			# REQ-021: Game.updateDifficulty; only the scroll speed changes per tick
+			if scored:
+				level = self.difficulty.getLevel(score)
+				if level.tuning is not self.tuning:
+					self.level = level
+					self.tuning = level.tuning
+					scroll_step = level.tuning.scroll_speed * DT
+
+			if obstacles and obstacles[0].x + EMOJI_SIZE < 0:
+				obstacles.pop(0)
+
+		self.next_flap = next_flap
+		self.y = y
+		self.velocity = velocity
+		self.tick = tick
+		self.elapsed_ms = elapsed_ms
+		self.score = score
+		if cause is not None or tick >= self.max_ticks:
+			self.end(cause)
+
+	def advanceFixed(self, ticks):
+		"""
+		advance() for fixed-point runs, mirroring Player.update and
+		Obstacle.update (REQ-029). Every quantity is an integer; obstacle x is
+		written back only where spawning and callers read it.
+		"""
+		flaps = self.flaps
+		flap_count = len(flaps)
+		next_flap = self.next_flap
+		y = self.y_fx
+		velocity = self.velocity_fx
+		tick = self.tick
+		elapsed_ms = self.elapsed_ms
+		score = self.score
+		obstacles = self.obstacles
+		player_x_fx = self.x * FIXED_ONE
+		tuning = self.tuning
+		v_flap = tuning.fixed_v_flap
+		gravity_step = tuning.fixed_gravity_step
+		v_max_up = tuning.fixed_v_max_up
+		v_max_down = tuning.fixed_v_max_down
+		scroll_step = tuning.fixed_scroll_step
+		end_tick = min(self.max_ticks, tick + ticks)
+		cause = None
+
+		while tick < end_tick:
+			# REQ-002: Player.flap/Player.update
+			if next_flap < flap_count and flaps[next_flap] <= tick:
+				velocity = v_flap
+				while next_flap < flap_count and flaps[next_flap] <= tick:
+					next_flap += 1
+			velocity += gravity_step
+			if velocity < v_max_up:
+				velocity = v_max_up
+			elif velocity > v_max_down:
+				velocity = v_max_down
+			y += velocity
+			tick += 1
+			elapsed_ms = tick * 1000 // PHYSICS_TICK_RATE
+
+			# REQ-004: Screen boundaries
+			if y - HALF_FX <= 0:
+				cause = CAUSE_CEILING
+				break
+			if y + HALF_FX >= SCREEN_HEIGHT_FX:
+				cause = CAUSE_FLOOR
+				break
+
+			# REQ-003, REQ-011: Reachability reads the previous obstacle's x
+			if elapsed_ms >= self.next_spawn_ms:
+				if obstacles:
+					obstacles[-1].x = obstacles[-1].x_fx / FIXED_ONE
+				self.spawn(elapsed_ms)
+
+			# REQ-004: Player.syncFixed rounds the centre half up; x >= 0 wherever the
+			# columns overlap, so the shift truncates like pg.Rect
+			top = ((y + FIXED_ONE // 2) >> FIXED_SHIFT) - HALF
+			bottom = top + EMOJI_SIZE
+			for obstacle in obstacles:
+				obstacle.x_fx -= scroll_step
+				x = obstacle.x_fx >> FIXED_SHIFT
+				if x < PLAYER_RIGHT and x + EMOJI_SIZE > PLAYER_LEFT:
+					if top < obstacle.gap_top:
+						cause = CAUSE_TOP_PIPE
+						break
+					if bottom > obstacle.gap_bottom:
+						cause = CAUSE_BOTTOM_PIPE
+						break
+			if cause is not None:
+				break
+
+			# REQ-005: Score once the player is past an obstacle
+			scored = False
+			for obstacle in obstacles:
+				if not obstacle.passed and player_x_fx > obstacle.x_fx + EMOJI_SIZE_FX:
+					obstacle.passed = True
+					score += 1
+					scored = True
+
+			# REQ-021: Game.updateDifficulty; only the scroll step changes per tick
+			if scored:
+				level = self.difficulty.getLevel(score)
+				if level.tuning is not self.tuning:
+					self.level = level
+					self.tuning = level.tuning
+					scroll_step = level.tuning.fixed_scroll_step
+
+			if obstacles and obstacles[0].x_fx + EMOJI_SIZE_FX < 0:
+				obstacles.pop(0)
+
+		for obstacle in obstacles:
+			obstacle.x = obstacle.x_fx / FIXED_ONE
+		self.next_flap = next_flap
+		self.y_fx = y
+		self.velocity_fx = velocity
+		self.y = y / FIXED_ONE
+		self.velocity = velocity * PHYSICS_TICK_RATE / FIXED_ONE
+		self.tick = tick
+		self.elapsed_ms = elapsed_ms
+		self.score = score
+		if cause is not None or tick >= self.max_ticks:
+			self.end(cause)
+
+	def spawn(self, now_ms):
+		"""Add the next obstacle from the seeded stream (REQ-003, REQ-011)."""
+		obstacles = self.obstacles
+		tuning = self.tuning
+		obstacle = ObstacleState(SCREEN_WIDTH, generateGap(SCREEN_HEIGHT, None, self.rng, tuning))
+		if obstacles:
+			envelope = self.level.envelope
+			previous = obstacles[-1]
+			if not envelope.isReachable(previous, obstacle):
+				reach = envelope.reachableCenters(previous, obstacle.x - previous.x)
+				obstacle = ObstacleState(
+					SCREEN_WIDTH, generateGap(SCREEN_HEIGHT, reach, self.rng, tuning)
+				)
+		obstacles.append(obstacle)
+		self.next_spawn_ms = now_ms + self.rng.randint(*tuning.spawn_interval_range)
+
+	def getResult(self):
+		return {"id": self.id, "score": self.score, "ticks": self.tick, "cause": self.cause}
+
+
+def jobId(job):
+	"""The job's id, or None when the job is not even an object."""
+	return job.get("id") if isinstance(job, dict) else None
+
+
+def sessionFromJob(job):
+	"""
+	Build a Session from a decoded client job; raises ValueError if malformed.
+	json.loads accepts Infinity and NaN, which int() rejects with OverflowError
+	and ValueError.
+	"""
+	try:
+		return Session(int(job["seed"]), [int(t) for t in job.get("flaps", ())],
+					   int(job.get("ticks", SERVER_MAX_TICKS)), job.get("id"),
+					   progressive=bool(job.get("progression", False)),
+					   fixed_point=bool(job.get("fixed_point", False)))
+	except (KeyError, TypeError, AttributeError, ValueError, OverflowError) as e:
+		raise ValueError(f"invalid job: {e!r}") from None
+
+
+def stepSessions(sessions, ticks):
+	"""
+	Advance every session in the batch by up to ticks ticks.
+	Returns the sessions still running.
+	"""
+	live = []
+	for session in sessions:
+		session.advance(ticks)
+		if not session.done:
+			live.append(session)
+	return live
+
+
+def simulateJobs(jobs):
+	"""Run a shard of jobs to completion (worker process entry point)."""
+	sessions = []
+	results = [None] * len(jobs)
+	for i, job in enumerate(jobs):
+		try:
+			sessions.append((i, sessionFromJob(job)))
+		except ValueError as e:
+			results[i] = {"id": jobId(job), "error": str(e)}
+	stepSessions([session for _, session in sessions], SERVER_MAX_TICKS)
+	for i, session in sessions:
+		results[i] = session.getResult()
+	return results
+
+
+class GameServer:
+	"""
+	Asyncio NDJSON server that validates runs by re-simulation (REQ-018).
+	Jobs from all connections share one queue and are simulated in batches.
+	"""
+
+	def __init__(self, workers=SERVER_WORKERS, batch_size=SERVER_BATCH_SIZE,
+				 slice_ticks=SERVER_SLICE_TICKS):
+		self.workers = workers
+		self.batch_size = batch_size
+		self.slice_ticks = slice_ticks
+		self.pool = None
+		if workers > 0:
+			# Forked children inherit pygame's SDL state and can deadlock; spawn clean ones
+			self.pool = ProcessPoolExecutor(workers,
+											mp_context=multiprocessing.get_context("spawn"))
+		self.queue = []
+		self.wakeup = None
+		self.server = None
+		self.batch_task = None
+
+		# Throughput stats
+		self.sessions_done = 0
+		self.ticks_done = 0
+		self.busy_time = 0.0
+
+	async def start(self, host=SERVER_HOST, port=SERVER_PORT):
+		"""Listen for clients; returns the bound port (useful with port=0)."""
+		self.wakeup = asyncio.Event()
+		if self.pool is not None:
+			loop = asyncio.get_running_loop()
+			await asyncio.gather(*(
+				loop.run_in_executor(self.pool, warmWorker) for _ in range(self.workers)
+			))
+		self.server = await asyncio.start_server(self.handleClient, host, port)
+		self.batch_task = asyncio.ensure_future(self.processQueue())
+		return self.server.sockets[0].getsockname()[1]
+
+	async def stop(self):
+		if self.server is not None:
+			self.server.close()
+			await self.server.wait_closed()
+		if self.batch_task is not None:
+			self.batch_task.cancel()
+		if self.pool is not None:
+			self.pool.shutdown()
+
+	def submit(self, job):
+		"""Queue a job; returns a future for its result."""
+		future = asyncio.get_running_loop().create_future()
+		self.queue.append((job, future))
+		self.wakeup.set()
+		return future
+
+	async def handleClient(self, reader, writer):
+		"""Answer each job line with its result line, in completion order."""
+		replies = []
+		while True:
+			line = await reader.readline()
+			if not line:
+				break
+			try:
+				job = json.loads(line)
+			except ValueError:
+				writer.write(b'{"id": null, "error": "invalid json"}\n')
+				continue
+			replies.append(asyncio.ensure_future(self.reply(writer, self.submit(job))))
+		if replies:
+			await asyncio.gather(*replies)
+		await writer.drain()
+		writer.close()
+
+	async def reply(self, writer, future):
+		writer.write((json.dumps(await future) + "\n").encode("utf-8"))
+		await writer.drain()
+
+	async def processQueue(self):
+		"""Take queued jobs in batches and simulate them."""
+		while True:
+			await self.wakeup.wait()
+			self.wakeup.clear()
+			while self.queue:
+				batch = self.queue[:self.batch_size]
+				del self.queue[:self.batch_size]
+				jobs = [job for job, _ in batch]
+
+				start = time.perf_counter()
+				try:
+					if self.pool is None:
+						results = await self.simulateInline(jobs)
+					else:
+						results = await self.simulateSharded(jobs)
+				except Exception as e:
+					# Every client still gets an answer and the loop keeps serving
+					print(f"[WARNING] Batch of {len(jobs)} jobs failed: {e!r}")
+					results = [{"id": jobId(job), "error": f"server error: {e!r}"} for job in jobs]
+				self.busy_time += time.perf_counter() - start
+
+				for (_, future), result in zip(batch, results):
+					self.sessions_done += 1
+					self.ticks_done += result.get("ticks", 0)
+					if not future.done():
+						future.set_result(result)
+
+	async def simulateInline(self, jobs):
+		"""Step the batch on the event loop, yielding every slice_ticks ticks."""
+		results = [None] * len(jobs)
+		sessions = []
+		for i, job in enumerate(jobs):
+			try:
+				sessions.append((i, sessionFromJob(job)))
+			except ValueError as e:
+				results[i] = {"id": jobId(job), "error": str(e)}
+		live = [session for _, session in sessions]
+		while live:
+			live = stepSessions(live, self.slice_ticks)
+			await asyncio.sleep(0)
+		for i, session in sessions:
+			results[i] = session.getResult()
+		return results
+
+	async def simulateSharded(self, jobs):
+		"""Split the batch round-robin across worker processes."""
+		loop = asyncio.get_running_loop()
+		shards = [jobs[i::self.workers] for i in range(self.workers)]
+		done = await asyncio.gather(*(
+			loop.run_in_executor(self.pool, simulateJobs, shard) for shard in shards if shard
+		))
+		results = [None] * len(jobs)
+		for i, shard_results in enumerate(done):
+			results[i::self.workers] = shard_results
+		return results
+
+	def getReport(self):
+		"""Throughput summary."""
+		rate = self.sessions_done / self.busy_time if self.busy_time else 0.0
+		tick_rate = self.ticks_done / self.busy_time if self.busy_time else 0.0
+		return (f"[SERVER] {self.sessions_done} sessions in {self.busy_time:.2f}s: "
+				f"{rate:,.0f} sessions/s, {tick_rate:,.0f} ticks/s (workers={self.workers})")
+
+
+def makeJob(rng, session_id, ticks=SERVER_MAX_TICKS):
+	"""A plausible client run: a random seed and a flap every 15-30 ticks."""
+	flaps = []
+	tick = rng.randint(0, 20)
+	while tick < ticks:
+		flaps.append(tick)
+		tick += rng.randint(15, 30)
+	return {"id": session_id, "seed": rng.randrange(2 ** 32), "flaps": flaps, "ticks": ticks}
+
+
+async def runClient(host, port, jobs):
+	"""Local stand-in client: send jobs on one connection and collect the results by id."""
+	reader, writer = await asyncio.open_connection(host, port)
+	writer.write("".join(json.dumps(job) + "\n" for job in jobs).encode("utf-8"))
+	await writer.drain()
+	writer.write_eof()
+	results = {}
+	async for line in reader:
+		result = json.loads(line)
+		results[result["id"]] = result
+	writer.close()
+	return results
+
+
+async def main():
+	"""Run the server, or benchmark it against the stand-in client."""
+	parser = argparse.ArgumentParser(description="Emoji Flappy headless session server")
+	parser.add_argument("--host", default=SERVER_HOST)
+	parser.add_argument("--port", type=int, default=SERVER_PORT)
+	parser.add_argument("--workers", type=int, default=SERVER_WORKERS)
+	parser.add_argument("--bench", type=int, default=0, metavar="SESSIONS",
+						help="simulate SESSIONS stand-in client runs and report throughput")
+	args = parser.parse_args()
+
+	server = GameServer(workers=args.workers)
+	if args.bench:
+		port = await server.start(args.host, 0)
+		rng = random.Random(0)
+		jobs = [makeJob(rng, i, ticks=60 * PHYSICS_TICK_RATE) for i in range(args.bench)]
+		await runClient(args.host, port, jobs)
+		print(server.getReport())
+		await server.stop()
+		return
+
+	port = await server.start(args.host, args.port)
+	print(f"[INFO] Serving on {args.host}:{port} (workers={args.workers})")
+	try:
+		await asyncio.Event().wait()
+	finally:
+		print(server.getReport())
+		await server.stop()
+
+
+if __name__ == "__main__":
+	asyncio.run(main())
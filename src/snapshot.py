@@ -0,0 +1,266 @@
+"""
+Emoji Flappy - Game Snapshots
+REQ-028: Snapshot, restore and rewind of the simulation state
+
+A GameSnapshot holds everything the fixed-step simulation needs to carry on
+from a tick: players, obstacles, the obstacle RNG state, ghost positions, the
+game clock, the spawn timer and how much of the flap log and trajectory
+existed. Entities are stored as plain tuples, so taking a snapshot costs a few
+microseconds and restoring one reuses the existing sprites instead of
+re-rendering them.
+
+The game records a snapshot into a SnapshotRing every SNAPSHOT_INTERVAL_TICKS
+ticks, which is what the practice rewind key steps back through. Snapshots
+convert to and from JSON-compatible dicts for save-state debugging.
+
+Particles, telemetry and the score store are not part of the simulation and
+are left alone.
+"""
+
+import json
+import math
+import random
+from collections import deque
+from config import (
+	SNAPSHOT_INTERVAL_TICKS, SNAPSHOT_RING_SIZE, RACER_TINTS, SCREEN_WIDTH, SCREEN_HEIGHT,
+	TUNING_MAX_SPEED
+)
+from telemetry import CAUSE_CEILING, CAUSE_FLOOR, CAUSE_TOP_PIPE, CAUSE_BOTTOM_PIPE
+
+DEATH_CAUSES = (None, CAUSE_CEILING, CAUSE_FLOOR, CAUSE_TOP_PIPE, CAUSE_BOTTOM_PIPE)
+
+# Ranges a restored entity may occupy; positions stay small enough for a pg.Rect
+PLAYER_Y_LIMIT = (-SCREEN_HEIGHT, 2 * SCREEN_HEIGHT)
+VELOCITY_LIMIT = (-TUNING_MAX_SPEED, TUNING_MAX_SPEED)
+OBSTACLE_X_LIMIT = (-SCREEN_WIDTH, 2 * SCREEN_WIDTH)
+
+
+def checkNumber(name, value, finite=True, limit=None):
+	"""
+	Return value if it is a number: never NaN, finite unless finite=False and
+	within limit=(low, high) when given.
+	"""
+	if isinstance(value, bool) or not isinstance(value, (int, float)):
+		raise ValueError(f"{name} must be a number")
+	if isinstance(value, float) and (math.isnan(value) or (finite and math.isinf(value))):
+		raise ValueError(f"{name} must be a {'finite ' if finite else ''}number")
+	if limit is not None and not limit[0] <= value <= limit[1]:
+		raise ValueError(f"{name} must be within {limit[0]:g} to {limit[1]:g}")
+	return value
+
+
+def checkCount(name, value):
+	"""Return value if it is a non-negative integer."""
+	if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+		raise ValueError(f"{name} must be a non-negative integer")
+	return value
+
+
+def checkFlag(name, value):
+	if not isinstance(value, bool):
+		raise ValueError(f"{name} must be true or false")
+	return value
+
+
+def checkEntries(name, value, arity):
+	"""Return value as a tuple of arity-tuples."""
+	if not isinstance(value, (list, tuple)) or not all(
+			isinstance(entry, (list, tuple)) and len(entry) == arity for entry in value):
+		raise ValueError(f"{name} must be a list of {arity}-item lists")
+	return tuple(tuple(entry) for entry in value)
+
+
+class GameSnapshot:
+	"""Simulation state of a Game before one tick (REQ-028)."""
+
+	__slots__ = ("tick", "elapsed_ms", "accumulator", "next_spawn_time", "obstacle_seed",
+				 "rng_state", "players", "obstacles", "ghosts", "flap_count",
+				 "trajectory_length", "game_over")
+
+	FIELDS = __slots__
+
+	def toDict(self):
+		"""JSON-compatible copy of the snapshot."""
+		data = {name: getattr(self, name) for name in self.FIELDS}
+		version, internal, gauss = self.rng_state
+		data["rng_state"] = [version, list(internal), gauss]
+		return data
+
+	@classmethod
+	def fromDict(cls, data):
+		"""
+		Snapshot from toDict() output; raises KeyError or ValueError if malformed.
+		Every field is checked here, so restoring a loaded snapshot cannot fail
+		part-way and leave the game half restored.
+		"""
+		snapshot = cls()
+		snapshot.tick = checkCount("tick", data["tick"])
+		snapshot.elapsed_ms = checkNumber("elapsed_ms", data["elapsed_ms"])
+		snapshot.accumulator = checkNumber("accumulator", data["accumulator"])
+		snapshot.next_spawn_time = checkNumber("next_spawn_time", data["next_spawn_time"],
+											   finite=False)
+		snapshot.obstacle_seed = checkCount("obstacle_seed", data["obstacle_seed"])
+		snapshot.flap_count = checkCount("flap_count", data["flap_count"])
+		snapshot.trajectory_length = checkCount("trajectory_length", data["trajectory_length"])
+		snapshot.game_over = checkFlag("game_over", data["game_over"])
+
+		# Let random validate the state itself, on a scratch generator
+		rng_state = data["rng_state"]
+		if not isinstance(rng_state, (list, tuple)) or len(rng_state) != 3:
+			raise ValueError("rng_state must be a [version, internal, gauss] list")
+		version, internal, gauss = rng_state
+		if not isinstance(internal, (list, tuple)):
+			raise ValueError("rng_state internal state must be a list")
+		if gauss is not None:
+			checkNumber("rng_state gauss", gauss)
+		snapshot.rng_state = (version, tuple(internal), gauss)
+		try:
+			random.Random().setstate(snapshot.rng_state)
+		except (TypeError, ValueError, OverflowError) as e:
+			raise ValueError(f"invalid rng_state: {e}") from None
+
+		snapshot.players = checkEntries("players", data["players"], 6)
+		if not 1 <= len(snapshot.players) <= len(RACER_TINTS):
+			raise ValueError(f"players must hold 1 to {len(RACER_TINTS)} racers")
+		for y, velocity, alive, score, death_cause, flapped in snapshot.players:
+			checkNumber("player y", y, limit=PLAYER_Y_LIMIT)
+			checkNumber("player velocity", velocity, limit=VELOCITY_LIMIT)
+			checkFlag("player alive", alive)
+			checkCount("player score", score)
+			checkFlag("player flapped", flapped)
+			if death_cause not in DEATH_CAUSES:
+				raise ValueError(f"unknown death cause {death_cause!r}")
+
+		snapshot.obstacles = checkEntries("obstacles", data["obstacles"], 4)
+		for x, gap_top, gap_bottom, passed in snapshot.obstacles:
+			checkNumber("obstacle x", x, limit=OBSTACLE_X_LIMIT)
+			if isinstance(gap_top, bool) or isinstance(gap_bottom, bool) or not (
+					isinstance(gap_top, int) and isinstance(gap_bottom, int)):
+				raise ValueError("obstacle gap edges must be integers")
+			if not 0 <= gap_top <= gap_bottom <= SCREEN_HEIGHT:
+				raise ValueError(f"obstacle gap must satisfy 0 <= top <= bottom <= {SCREEN_HEIGHT}")
+			checkFlag("obstacle passed", passed)
+
+		if not isinstance(data["ghosts"], (list, tuple)):
+			raise ValueError("ghosts must be a list")
+		snapshot.ghosts = tuple(checkCount("ghost index", index) for index in data["ghosts"])
+		return snapshot
+
+
+def takeSnapshot(game):
+	"""Capture the game's simulation state."""
+	snapshot = GameSnapshot()
+	snapshot.tick = game.tick
+	snapshot.elapsed_ms = game.elapsed_ms
+	snapshot.accumulator = game.accumulator
+	snapshot.next_spawn_time = game.next_spawn_time
+	snapshot.obstacle_seed = game.obstacle_seed
+	snapshot.rng_state = game.rng.getstate()
+	snapshot.players = tuple(
+		(p.y, p.velocity, p.alive, p.score, p.death_cause, p.flapped) for p in game.players
+	)
+	snapshot.obstacles = tuple(
+		(o.x, o.gap_top, o.gap_bottom, o.passed) for o in game.obstacles
+	)
+	snapshot.ghosts = tuple(ghost.index for ghost in game.ghosts)
+	snapshot.flap_count = len(game.flap_log)
+	snapshot.trajectory_length = len(game.trajectory)
+	snapshot.game_over = game.game_over
+	return snapshot
+
+
+def restoreSnapshot(game, snapshot):
+	"""
+	Put the game back into the snapshot's state.
+	The flap log and trajectory are cut back to their length at the snapshot, so
+	the run stays reproducible from its seed and flap log (REQ-019).
+	"""
+	game.tick = snapshot.tick
+	game.elapsed_ms = snapshot.elapsed_ms
+	game.accumulator = snapshot.accumulator
+	game.next_spawn_time = snapshot.next_spawn_time
+	game.obstacle_seed = snapshot.obstacle_seed
+	game.rng.setstate(snapshot.rng_state)
+	game.game_over = snapshot.game_over
+
+	if len(game.players) != len(snapshot.players):
+		game.racer_count = len(snapshot.players)
+		game.players = game.createRacers()
+		game.player = game.players[0]
+	for player, state in zip(game.players, snapshot.players):
+		player.restoreState(state)
+
+	# Obstacles share one sprite, so any live one can stand in for the rest
+	like = game.obstacles[0] if game.obstacles else None
+	obstacles = []
+	for state in snapshot.obstacles:
+		obstacle = game.createObstacle(state, like)
+		like = obstacle
+		obstacles.append(obstacle)
+	game.obstacles = obstacles
+
+	if len(game.ghosts) == len(snapshot.ghosts):
+		for ghost, index in zip(game.ghosts, snapshot.ghosts):
+			ghost.seek(index)
+	else:
+		game.ghosts = []
+
+	del game.flap_log[snapshot.flap_count:]
+	del game.trajectory[snapshot.trajectory_length:]
+
+	# REQ-021: Tier for the restored score
+	game.setLevel(game.difficulty.getLevel(game.getLeadScore()))
+
+
+class SnapshotRing:
+	"""
+	Most recent snapshots of a run, one every interval ticks (REQ-028).
+	Oldest snapshots are dropped once size is reached.
+	"""
+
+	def __init__(self, size=SNAPSHOT_RING_SIZE, interval=SNAPSHOT_INTERVAL_TICKS):
+		self.interval = interval
+		self.snapshots = deque(maxlen=size)
+
+	def __len__(self):
+		return len(self.snapshots)
+
+	def record(self, game):
+		"""Take a snapshot if the game is on an interval tick not recorded yet."""
+		tick = game.tick
+		if tick % self.interval:
+			return
+		snapshots = self.snapshots
+		if snapshots and snapshots[-1].tick == tick:
+			return
+		snapshots.append(takeSnapshot(game))
+
+	def rewind(self, tick):
+		"""
+		Latest snapshot at least one interval before tick, or None.
+		Newer snapshots are discarded; the returned one is kept so the next
+		rewind steps back further.
+		"""
+		snapshots = self.snapshots
+		while snapshots and snapshots[-1].tick > tick - self.interval:
+			snapshots.pop()
+		return snapshots[-1] if snapshots else None
+
+	def clear(self):
+		self.snapshots.clear()
+
+
+def saveSnapshot(snapshot, path):
+	"""Write a snapshot as JSON for save-state debugging."""
+	with open(path, "w", encoding="utf-8") as f:
+		json.dump(snapshot.toDict(), f)
+
+
+def loadSnapshot(path):
+	"""Read a snapshot written by saveSnapshot; raises OSError or ValueError on failure."""
+	with open(path, "r", encoding="utf-8") as f:
+		data = json.load(f)
+	try:
+		return GameSnapshot.fromDict(data)
+	except (KeyError, TypeError) as e:
+		raise ValueError(f"invalid save state: {e!r}") from None
@@ -0,0 +1,198 @@
+"""
+Emoji Flappy - Score Persistence
+REQ-012: Persistent high score
+
+Stores the high score and per-run stats between launches: an append-only
+JSON Lines file natively, browser localStorage under pygbag. Runs are queued
+in memory and written in batches off the frame path.
+"""
+
+import asyncio
+import json
+import os
+import threading
+from config import (
+	RUNNING_IN_PYGBAG, SCORE_FILE, SCORE_FILE_ENV, SCORE_STORAGE_KEY, SCORE_COMPACT_LINES
+)
+
+
+def emptyStats():
+	"""Fresh stats summary."""
+	return {"runs": 0, "best": 0, "total_score": 0, "total_time": 0.0}
+
+
+class FileBackend:
+	"""
+	Append-only JSON Lines file.
+	Each line is either a run record or a summary written by compaction.
+	"""
+
+	def __init__(self, path):
+		self.path = path
+		self.line_count = 0
+		self.needs_newline = False
+
+	def load(self):
+		"""Read all valid records, skipping corrupt or partially written lines."""
+		records = []
+		try:
+			with open(self.path, "r", encoding="utf-8") as f:
+				data = f.read()
+		except FileNotFoundError:
+			return records
+		except OSError as e:
+			print(f"[WARNING] Could not read scores from {self.path}: {e}")
+			return records
+
+		# A crash mid-write leaves an unterminated line; start the next batch on a fresh one
+		self.needs_newline = bool(data) and not data.endswith("\n")
+		for line in data.splitlines():
+			try:
+				record = json.loads(line)
+			except ValueError:
+				continue
+			if isinstance(record, dict) and record.get("type") in ("run", "summary"):
+				records.append(record)
+		self.line_count = len(records)
+		return records
+
+	def write(self, batch, stats):
+		"""Append a batch of run records, compacting the file when it grows too long."""
+		if self.line_count + len(batch) > SCORE_COMPACT_LINES:
+			self.compact(stats)
+			return
+
+		directory = os.path.dirname(self.path)
+		if directory:
+			os.makedirs(directory, exist_ok=True)
+		lines = "".join(json.dumps(record) + "\n" for record in batch)
+		with open(self.path, "a", encoding="utf-8") as f:
+			if self.needs_newline:
+				f.write("\n")
+			f.write(lines)
+		self.needs_newline = False
+		self.line_count += len(batch)
+
+	def compact(self, stats):
+		"""Atomically replace the file with a single summary record."""
+		tmp_path = self.path + ".tmp"
+		with open(tmp_path, "w", encoding="utf-8") as f:
+			f.write(json.dumps(dict(stats, type="summary")) + "\n")
+		os.replace(tmp_path, self.path)
+		self.needs_newline = False
+		self.line_count = 1
+
+
+class BrowserBackend:
+	"""localStorage backend for pygbag; keeps a single summary record."""
+
+	def __init__(self, key=SCORE_STORAGE_KEY):
+		import platform  # pygbag's browser bridge, only available under emscripten
+		self.storage = platform.window.localStorage
+		self.key = key
+
+	def load(self):
+		"""Read the stored summary, ignoring missing or corrupt values."""
+		try:
+			record = json.loads(self.storage.getItem(self.key) or "")
+		except (TypeError, ValueError):
+			return []
+		if isinstance(record, dict):
+			return [dict(record, type="summary")]
+		return []
+
+	def write(self, batch, stats):
+		"""Overwrite the summary; localStorage has no append."""
+		self.storage.setItem(self.key, json.dumps(stats))
+
+
+class ScoreStore:
+	"""
+	High score and run stats with batched persistence (REQ-012).
+	recordRun() is O(1) and never touches storage; flush() writes the batch.
+	Background flushes run on a worker thread, so the queue and stats are
+	guarded by a lock and writes are serialised.
+	"""
+
+	def __init__(self, path=None, backend=None):
+		if backend is None:
+			if RUNNING_IN_PYGBAG:
+				backend = BrowserBackend()
+			else:
+				backend = FileBackend(path or os.environ.get(SCORE_FILE_ENV) or SCORE_FILE)
+		self.backend = backend
+		self.stats = emptyStats()
+		self.pending = []
+		self.flush_task = None
+		self.lock = threading.Lock()
+		self.write_lock = threading.Lock()
+
+		for record in self.backend.load():
+			self.applyRecord(record)
+
+	@property
+	def high_score(self):
+		return self.stats["best"]
+
+	def applyRecord(self, record):
+		"""Fold a stored record into the stats summary."""
+		try:
+			if record.get("type") == "summary":
+				stats = emptyStats()
+				for key in stats:
+					stats[key] = type(stats[key])(record.get(key, stats[key]))
+				self.stats = stats
+			else:
+				score = int(record["score"])
+				self.stats["runs"] += 1
+				self.stats["best"] = max(self.stats["best"], score)
+				self.stats["total_score"] += score
+				self.stats["total_time"] += float(record.get("duration", 0.0))
+		except (KeyError, TypeError, ValueError):
+			pass
+
+	def recordRun(self, score, duration):
+		"""Queue a finished run for the next flush."""
+		record = {"type": "run", "score": int(score), "duration": round(duration, 3)}
+		with self.lock:
+			self.applyRecord(record)
+			self.pending.append(record)
+
+	def hasPending(self):
+		return bool(self.pending)
+
+	def flush(self):
+		"""Write all queued runs in one batch. Failed writes are re-queued."""
+		with self.write_lock:
+			with self.lock:
+				if not self.pending:
+					return
+				batch, self.pending = self.pending, []
+				stats = dict(self.stats)
+			try:
+				self.backend.write(batch, stats)
+			except OSError as e:
+				print(f"[WARNING] Could not save scores: {e}")
+				with self.lock:
+					self.pending = batch + self.pending
+
+	async def flushAsync(self):
+		"""Flush without blocking the frame loop (worker thread natively)."""
+		if RUNNING_IN_PYGBAG:
+			self.flush()
+		else:
+			await asyncio.to_thread(self.flush)
+
+	def scheduleFlush(self):
+		"""Start a background flush if runs are queued and none is in flight."""
+		if not self.pending:
+			return
+		if self.flush_task is not None and not self.flush_task.done():
+			return
+		self.flush_task = asyncio.ensure_future(self.flushAsync())
+
+	async def close(self):
+		"""Wait for a background flush still in flight, then write what is left."""
+		if self.flush_task is not None and not self.flush_task.done():
+			await self.flush_task
+		self.flush()
@@ -0,0 +1,218 @@
+"""
+Emoji Flappy - Gameplay Telemetry
+REQ-013: Gameplay telemetry
+
+Records compact run events (death cause, score, run length, frame-time summary)
+into a fixed-size ring buffer and exports them in batches as NDJSON, either to
+a local file or to an HTTP endpoint. Recording is O(1) and allocation-free per
+frame; exporting only happens off the frame path.
+"""
+
+import asyncio
+import json
+import os
+import time
+from config import (
+	RUNNING_IN_PYGBAG, TELEMETRY_ENV, TELEMETRY_CAPACITY, TELEMETRY_BATCH_SIZE, SLOW_FRAME_MS
+)
+
+# Death causes (REQ-004 collision sources)
+CAUSE_CEILING = "ceiling"
+CAUSE_FLOOR = "floor"
+CAUSE_TOP_PIPE = "top_pipe"
+CAUSE_BOTTOM_PIPE = "bottom_pipe"
+
+# Events are stored as tuples; field names are only attached at export
+EVENT_FIELDS = {
+	"death": ("cause", "score", "duration", "frames", "mean_frame_ms", "max_frame_ms",
+			  "slow_frames"),
+	"restart": ("run", "high_score"),
+}
+
+
+class RingBuffer:
+	"""Preallocated fixed-capacity FIFO that overwrites the oldest entry when full."""
+
+	def __init__(self, capacity):
+		self.capacity = capacity
+		self.items = [None] * capacity
+		self.start = 0
+		self.count = 0
+		self.dropped = 0
+
+	def push(self, item):
+		"""Append an item in O(1)."""
+		end = (self.start + self.count) % self.capacity
+		self.items[end] = item
+		if self.count < self.capacity:
+			self.count += 1
+		else:
+			self.start = (self.start + 1) % self.capacity
+			self.dropped += 1
+
+	def drain(self, limit=None):
+		"""Remove and return up to limit items, oldest first."""
+		n = self.count if limit is None else min(limit, self.count)
+		out = []
+		for _ in range(n):
+			out.append(self.items[self.start])
+			self.items[self.start] = None
+			self.start = (self.start + 1) % self.capacity
+		self.count -= n
+		return out
+
+	def __len__(self):
+		return self.count
+
+
+class FileExporter:
+	"""Append events to a local NDJSON file."""
+
+	def __init__(self, path):
+		self.path = path
+
+	def send(self, lines):
+		directory = os.path.dirname(self.path)
+		if directory:
+			os.makedirs(directory, exist_ok=True)
+		with open(self.path, "a", encoding="utf-8") as f:
+			f.write(lines)
+
+
+class HttpExporter:
+	"""POST events as an NDJSON body to a collector endpoint."""
+
+	def __init__(self, url, timeout=2.0):
+		self.url = url
+		self.timeout = timeout
+
+	def send(self, lines):
+		import urllib.request  # REQ-022: only loaded once an HTTP target is used
+		request = urllib.request.Request(
+			self.url, data=lines.encode("utf-8"), method="POST",
+			headers={"Content-Type": "application/x-ndjson"}
+		)
+		with urllib.request.urlopen(request, timeout=self.timeout) as response:
+			response.read()
+
+
+def getExporter(target):
+	"""Build an exporter from an NDJSON path or http(s) URL; None disables export."""
+	if not target:
+		return None
+	if target.startswith(("http://", "https://")):
+		return HttpExporter(target)
+	return FileExporter(target)
+
+
+class Telemetry:
+	"""
+	Gameplay event recorder (REQ-013).
+	recordFrame() runs every frame and only updates a few counters.
+	"""
+
+	def __init__(self, exporter=None, capacity=TELEMETRY_CAPACITY,
+				 batch_size=TELEMETRY_BATCH_SIZE):
+		if exporter is None and not RUNNING_IN_PYGBAG:
+			exporter = getExporter(os.environ.get(TELEMETRY_ENV))
+		self.exporter = exporter
+		self.buffer = RingBuffer(capacity)
+		self.batch_size = batch_size
+		self.session = int(time.time())
+		self.runs = 0
+		self.export_task = None
+		# Batches a failed export left behind, retried first; bounded like the buffer
+		self.unsent = []
+		self.max_unsent = -(-capacity // batch_size)
+		self.dropped_batches = 0
+		self.resetFrameStats()
+
+	def resetFrameStats(self):
+		self.frames = 0
+		self.frame_total_ms = 0.0
+		self.frame_max_ms = 0.0
+		self.slow_frames = 0
+
+	def recordFrame(self, dt):
+		"""Accumulate frame-time summary for the current run."""
+		ms = dt * 1000.0
+		self.frames += 1
+		self.frame_total_ms += ms
+		if ms > self.frame_max_ms:
+			self.frame_max_ms = ms
+		if ms > SLOW_FRAME_MS:
+			self.slow_frames += 1
+
+	def recordDeath(self, cause, score, duration):
+		"""Record how and when a run ended."""
+		mean_ms = self.frame_total_ms / self.frames if self.frames else 0.0
+		self.buffer.push(("death", cause, score, round(duration, 3), self.frames,
+						  round(mean_ms, 3), round(self.frame_max_ms, 3), self.slow_frames))
+		self.runs += 1
+
+	def recordRestart(self, high_score):
+		"""Record a restart and begin a fresh frame-time summary."""
+		self.buffer.push(("restart", self.runs, high_score))
+		self.resetFrameStats()
+
+	def drainEvents(self, limit=None):
+		"""Remove buffered events and return them as dicts."""
+		events = []
+		for item in self.buffer.drain(limit):
+			event = {"event": item[0], "session": self.session}
+			event.update(zip(EVENT_FIELDS[item[0]], item[1:]))
+			events.append(event)
+		return events
+
+	def takeBatches(self):
+		"""Unsent batches first, then the buffer drained into batches of batch_size events."""
+		batches, self.unsent = self.unsent, []
+		while len(self.buffer):
+			batch = self.drainEvents(self.batch_size)
+			batches.append("".join(json.dumps(event) + "\n" for event in batch))
+		return batches
+
+	def sendBatches(self, batches):
+		"""
+		Send batches in order. After a failure the remainder is kept for the next
+		export; beyond max_unsent batches the oldest are dropped and counted.
+		"""
+		for i, lines in enumerate(batches):
+			try:
+				self.exporter.send(lines)
+			except OSError as e:
+				remaining = batches[i:]
+				dropped = max(0, len(remaining) - self.max_unsent)
+				self.dropped_batches += dropped
+				self.unsent = remaining[dropped:]
+				print(f"[WARNING] Telemetry export failed: {e}; {len(self.unsent)} batches kept "
+					  f"for the next export, {dropped} dropped")
+				return
+
+	def hasUnexported(self):
+		return bool(len(self.buffer) or self.unsent)
+
+	def export(self):
+		"""Send all buffered events now."""
+		if self.exporter is None:
+			return
+		self.sendBatches(self.takeBatches())
+
+	async def exportAsync(self):
+		"""Drain on the loop, send on a worker thread so the frame loop never blocks."""
+		batches = self.takeBatches()
+		await asyncio.to_thread(self.sendBatches, batches)
+
+	def scheduleExport(self):
+		"""Start a background export if events are buffered and none is in flight."""
+		if self.exporter is None or not self.hasUnexported():
+			return
+		if self.export_task is not None and not self.export_task.done():
+			return
+		self.export_task = asyncio.ensure_future(self.exportAsync())
+
+	async def close(self):
+		"""Wait for a background export still in flight, then send what is left."""
+		if self.export_task is not None and not self.export_task.done():
+			await self.export_task
+		self.export()
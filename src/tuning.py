@@ -0,0 +1,202 @@
+"""
+Emoji Flappy - Live Tuning
+REQ-020: Hot-reloadable tuning
+
+Gameplay parameters that can be changed while the game runs. A Tuning is an
+immutable snapshot of the tunable config.py values plus everything derived
+from them (gap centre bounds, obstacle tile offsets, reach distance), so the
+derived values are computed once per reload instead of per frame or spawn.
+The game swaps in a new snapshot between frames.
+
+Overrides are JSON objects keyed by config.py names, e.g.
+	{"G": 2000, "GAP_SIZE_RANGE": [160, 240]}
+read from the EMOJI_FLAPPY_TUNING file natively (polled for changes) or from
+localStorage under pygbag (reloaded with the T key).
+"""
+
+import json
+import math
+import os
+import time
+from config import (
+	RUNNING_IN_PYGBAG, SCREEN_HEIGHT, EMOJI_SIZE, G, V_FLAP, V_MAX_UP, V_MAX_DOWN,
+	SCROLL_SPEED, GAP_SIZE_RANGE, SPAWN_INTERVAL_RANGE, TUNING_ENV, TUNING_STORAGE_KEY,
+	TUNING_POLL_INTERVAL, TUNING_MAX_SPEED, TUNING_MAX_SPAWN_INTERVAL, PHYSICS_TICK_RATE,
+	FIXED_ONE
+)
+
+# config.py name -> (attribute, default)
+TUNABLES = {
+	"G": ("g", G),
+	"V_FLAP": ("v_flap", V_FLAP),
+	"V_MAX_UP": ("v_max_up", V_MAX_UP),
+	"V_MAX_DOWN": ("v_max_down", V_MAX_DOWN),
+	"SCROLL_SPEED": ("scroll_speed", SCROLL_SPEED),
+	"GAP_SIZE_RANGE": ("gap_size_range", GAP_SIZE_RANGE),
+	"SPAWN_INTERVAL_RANGE": ("spawn_interval_range", SPAWN_INTERVAL_RANGE),
+}
+
+# Vertical clearance kept between a gap and the screen edges (REQ-003)
+GAP_EDGE_MARGIN = 50
+
+
+def parseRange(name, value):
+	"""Validate a (min, max) integer range."""
+	try:
+		low, high = (int(v) for v in value)
+	except (TypeError, ValueError, OverflowError):
+		raise ValueError(f"{name} must be a [min, max] pair") from None
+	if not 0 < low <= high:
+		raise ValueError(f"{name} must satisfy 0 < min <= max")
+	return (low, high)
+
+
+class Tuning:
+	"""
+	Snapshot of tunable parameters and their derived values (REQ-020).
+	Never modified after construction; a reload builds a new snapshot.
+	"""
+
+	def __init__(self, overrides=None):
+		overrides = dict(overrides or {})
+		unknown = set(overrides) - set(TUNABLES)
+		if unknown:
+			raise ValueError(f"unknown tuning keys: {', '.join(sorted(unknown))}")
+
+		for name, (attribute, default) in TUNABLES.items():
+			value = overrides.get(name, default)
+			if isinstance(default, tuple):
+				value = parseRange(name, value)
+			elif isinstance(value, bool) or not isinstance(value, (int, float)):
+				raise ValueError(f"{name} must be a number")
+			elif abs(value) > TUNING_MAX_SPEED or not math.isfinite(value):
+				raise ValueError(f"{name} must be finite and within +/-{TUNING_MAX_SPEED:g}")
+			setattr(self, attribute, value)
+
+		if not self.v_max_up < 0 < self.v_max_down:
+			raise ValueError("V_MAX_UP must be negative and V_MAX_DOWN positive")
+		if self.scroll_speed <= 0:
+			raise ValueError("SCROLL_SPEED must be positive")
+		if self.gap_size_range[1] + 2 * GAP_EDGE_MARGIN > SCREEN_HEIGHT:
+			raise ValueError("GAP_SIZE_RANGE leaves no room on screen")
+		if self.spawn_interval_range[1] > TUNING_MAX_SPAWN_INTERVAL:
+			raise ValueError(
+				f"SPAWN_INTERVAL_RANGE must stay within {TUNING_MAX_SPAWN_INTERVAL} ms")
+
+		self.overrides = overrides
+
+		# Derived: gap centre bounds per gap size, replacing per-spawn arithmetic
+		low, high = self.gap_size_range
+		self.gap_bounds = tuple(
+			(gap // 2 + GAP_EDGE_MARGIN, SCREEN_HEIGHT - gap // 2 - GAP_EDGE_MARGIN)
+			for gap in range(low, high + 1)
+		)
+
+		# Derived: y offsets of the emoji tiles stacked in an obstacle column
+		self.tiles_per_column = -(-SCREEN_HEIGHT // EMOJI_SIZE)
+		self.tile_offsets = tuple(i * EMOJI_SIZE for i in range(self.tiles_per_column))
+
+		# Derived: longest horizontal spacing between obstacles (REQ-011)
+		self.max_spawn_distance = self.scroll_speed * self.spawn_interval_range[1] / 1000.0
+
+		# Derived: per-tick steps in 1/FIXED_ONE px for fixed-point physics (REQ-029);
+		# rounded once here, so every platform integrates the same integers
+		per_tick = FIXED_ONE / PHYSICS_TICK_RATE
+		self.fixed_v_flap = round(self.v_flap * per_tick)
+		self.fixed_v_max_up = round(self.v_max_up * per_tick)
+		self.fixed_v_max_down = round(self.v_max_down * per_tick)
+		self.fixed_gravity_step = round(self.g * per_tick / PHYSICS_TICK_RATE)
+		self.fixed_scroll_step = round(self.scroll_speed * per_tick)
+
+	def getGapBounds(self, gap_size, screen_height=SCREEN_HEIGHT):
+		"""
+		(center_min, center_max) for a gap size inside gap_size_range.
+		Precomputed for SCREEN_HEIGHT; other heights are worked out per call.
+		"""
+		if screen_height == SCREEN_HEIGHT:
+			return self.gap_bounds[gap_size - self.gap_size_range[0]]
+		return (gap_size // 2 + GAP_EDGE_MARGIN, screen_height - gap_size // 2 - GAP_EDGE_MARGIN)
+
+	def getTileOffsets(self, screen_height=SCREEN_HEIGHT):
+		"""
+		y offsets of the tiles filling a column screen_height tall.
+		Precomputed for SCREEN_HEIGHT; other heights are worked out per call.
+		"""
+		if screen_height == SCREEN_HEIGHT:
+			return self.tile_offsets
+		return tuple(range(0, screen_height, EMOJI_SIZE))
+
+	def __repr__(self):
+		return f"Tuning({self.overrides!r})"
+
+
+DEFAULT_TUNING = Tuning()
+
+
+class TuningWatcher:
+	"""
+	Source of tuning overrides (REQ-020).
+	Natively a JSON file whose modification time is polled between frames;
+	under pygbag a localStorage entry that is re-read on demand.
+	"""
+
+	def __init__(self, path=None, storage_key=TUNING_STORAGE_KEY, interval=TUNING_POLL_INTERVAL):
+		self.path = path
+		self.storage_key = storage_key
+		self.interval = interval
+		self.next_poll = 0.0
+		self.mtime = None
+
+	def read(self):
+		"""Raw override text, or None if there is nothing to read."""
+		if self.path is None:
+			import platform  # pygbag's browser bridge, only available under emscripten
+			return platform.window.localStorage.getItem(self.storage_key)
+		try:
+			with open(self.path, "r", encoding="utf-8") as f:
+				return f.read()
+		except FileNotFoundError:
+			return None
+
+	def reload(self):
+		"""
+		Build a Tuning from the current overrides.
+		Returns None, keeping the running tuning, if they are missing or invalid.
+		"""
+		try:
+			text = self.read()
+			if not text:
+				return None
+			return Tuning(json.loads(text))
+		except (OSError, ValueError, TypeError, OverflowError) as e:
+			print(f"[WARNING] Ignoring invalid tuning: {e}")
+			return None
+
+	def poll(self, now=None):
+		"""
+		Reload if the file changed since the last poll; at most once per interval.
+		Browser storage has no change signal, so it is only reloaded on demand.
+		"""
+		if self.path is None:
+			return None
+		now = time.monotonic() if now is None else now
+		if now < self.next_poll:
+			return None
+		self.next_poll = now + self.interval
+
+		try:
+			mtime = os.stat(self.path).st_mtime_ns
+		except OSError:
+			return None
+		if mtime == self.mtime:
+			return None
+		self.mtime = mtime
+		return self.reload()
+
+
+def createTuningWatcher():
+	"""Watcher for this platform, or None natively when no tuning file is configured."""
+	if RUNNING_IN_PYGBAG:
+		return TuningWatcher()
+	path = os.environ.get(TUNING_ENV)
+	return TuningWatcher(path) if path else None
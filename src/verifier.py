@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Emoji Flappy - Score Verification
+REQ-019: Verifiable score submissions
+
+Checks a leaderboard submission ({"seed", "flaps", "ticks", "score",
+"progression", "fixed_point"}, as built by Game.getSubmission) by
+re-simulating the run with the headless session rules and comparing the
+claimed length and score with the simulated ones.
+Batches are verified in parallel on worker processes.
+
+Usage:
+	python src/verifier.py submissions.ndjson [--workers N]
+"""
+
+import argparse
+import json
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from config import SERVER_MAX_TICKS, VERIFY_WORKERS, VERIFY_CHUNK_SIZE
+from server import Session
+from tuning import DEFAULT_TUNING
+
+# Rejection reasons
+REASON_MALFORMED = "malformed"
+REASON_BAD_LENGTH = "bad_length"
+REASON_BAD_FLAPS = "bad_flaps"
+REASON_LENGTH_MISMATCH = "length_mismatch"
+REASON_SCORE_MISMATCH = "score_mismatch"
+
+
+def verifySubmission(submission, tuning=DEFAULT_TUNING):
+	"""
+	Re-simulate one submission and compare it with its claims (REQ-019).
+
+	The run must end in a crash on exactly the claimed tick, and every flap
+	must fall inside the run in strictly increasing tick order.
+
+	tuning is the leaderboard's authoritative tuning (REQ-020); runs played with
+	other overrides do not verify.
+
+	Returns a dict with "valid", "reason" (None when valid) and the simulated
+	"score", "ticks" and "cause".
+	"""
+	result = {"valid": False, "reason": None, "score": None, "ticks": None, "cause": None}
+	try:
+		seed = int(submission["seed"])
+		flaps = [int(tick) for tick in submission["flaps"]]
+		ticks = int(submission["ticks"])
+		score = int(submission["score"])
+		progressive = bool(submission.get("progression", False))
+		fixed_point = bool(submission.get("fixed_point", False))
+	except (KeyError, TypeError, ValueError, OverflowError):
+		# OverflowError: json.loads accepts Infinity, which int() cannot convert
+		result["reason"] = REASON_MALFORMED
+		return result
+
+	if not 0 < ticks <= SERVER_MAX_TICKS:
+		result["reason"] = REASON_BAD_LENGTH
+		return result
+	if flaps and (flaps[0] < 0 or flaps[-1] >= ticks
+				  or any(b <= a for a, b in zip(flaps, flaps[1:]))):
+		result["reason"] = REASON_BAD_FLAPS
+		return result
+
+	# REQ-021: Progression runs replay the same per-tier tuning as the game
+	# REQ-029: Fixed-point runs replay with the integer physics
+	session = Session(seed, flaps, max_ticks=ticks, tuning=tuning, progressive=progressive,
+					  fixed_point=fixed_point)
+	session.advance(ticks)
+	result.update(score=session.score, ticks=session.tick, cause=session.cause)
+
+	if session.cause is None or session.tick != ticks:
+		result["reason"] = REASON_LENGTH_MISMATCH
+	elif session.score != score:
+		result["reason"] = REASON_SCORE_MISMATCH
+	else:
+		result["valid"] = True
+	return result
+
+
+def createExecutor(workers=VERIFY_WORKERS):
+	"""Process pool for verifyBatch; spawn avoids inheriting pygame's SDL state."""
+	return ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+def verifyBatch(submissions, workers=VERIFY_WORKERS, chunk_size=VERIFY_CHUNK_SIZE,
+				executor=None):
+	"""
+	Verify many submissions, in order, in parallel when worthwhile.
+	Pass a long-lived executor to avoid paying process start-up per batch.
+	"""
+	if executor is None and (workers <= 1 or len(submissions) <= chunk_size):
+		return [verifySubmission(submission) for submission in submissions]
+	if executor is not None:
+		return list(executor.map(verifySubmission, submissions, chunksize=chunk_size))
+	with createExecutor(workers) as pool:
+		return list(pool.map(verifySubmission, submissions, chunksize=chunk_size))
+
+
+def main():
+	"""Verify an NDJSON file of submissions and print one result per line."""
+	parser = argparse.ArgumentParser(description="Verify Emoji Flappy score submissions")
+	parser.add_argument("path", help="NDJSON file of submissions")
+	parser.add_argument("--workers", type=int, default=VERIFY_WORKERS)
+	args = parser.parse_args()
+
+	submissions = []
+	with open(args.path, "r", encoding="utf-8") as f:
+		for line in f:
+			if line.strip():
+				try:
+					submissions.append(json.loads(line))
+				except ValueError:
+					submissions.append(None)
+
+	results = verifyBatch(submissions, workers=args.workers)
+	for result in results:
+		print(json.dumps(result))
+	valid = sum(result["valid"] for result in results)
+	print(f"[INFO] {valid}/{len(results)} submissions verified", file=sys.stderr)
+
+
+if __name__ == "__main__":
+	main()
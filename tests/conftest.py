@@ -0,0 +1,64 @@
+"""
+Shared test fixtures.
+REQ-012: Keep Game instances away from the player's real score file.
+REQ-013: Never export telemetry from tests unless a test opts in.
+REQ-015: Games start without the autopilot.
+REQ-016: Games start without memory tracking.
+REQ-017: Games start with a single racer.
+REQ-020: Games start with the stock tuning.
+REQ-021: Games start without difficulty progression.
+REQ-022: Games keep running after the first frame.
+REQ-024: Games use the default frame pacing.
+REQ-028: Save states stay out of the player's home folder.
+REQ-029: Games start with float physics.
+
+Also the seeded-game helpers shared by the verification, snapshot, fixed-point
+and benchmark tests (REQ-019, REQ-028, REQ-029).
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import random
+import pytest
+from game import Game
+from tuning import Tuning
+
+# Wide gaps so simple steering policies score before the run ends
+WIDE_GAPS = Tuning({"GAP_SIZE_RANGE": [190, 220]})
+
+
+def seededGame(seed=5, tuning=WIDE_GAPS):
+	"""Game with a fixed obstacle stream and, unless tuning is None, that tuning applied."""
+	random.seed(seed)  # fixes Game.obstacle_seed
+	game = Game()
+	if tuning is not None:
+		game.applyTuning(tuning)
+	return game
+
+
+def play(game, ticks, shouldFlap):
+	"""Step up to ticks ticks, flapping whenever shouldFlap(game) is true."""
+	for _ in range(ticks):
+		if game.game_over:
+			break
+		if shouldFlap(game):
+			game.player.flap()
+		game.update(1.0 / 60)
+
+
+@pytest.fixture(autouse=True)
+def isolatedScoreFile(tmp_path, monkeypatch):
+	"""Point the score store at a per-test file."""
+	monkeypatch.setenv("EMOJI_FLAPPY_SCORES", str(tmp_path / "scores.jsonl"))
+	monkeypatch.delenv("EMOJI_FLAPPY_TELEMETRY", raising=False)
+	monkeypatch.delenv("EMOJI_FLAPPY_AUTOPILOT", raising=False)
+	monkeypatch.delenv("EMOJI_FLAPPY_MEMTRACK", raising=False)
+	monkeypatch.delenv("EMOJI_FLAPPY_RACERS", raising=False)
+	monkeypatch.delenv("EMOJI_FLAPPY_TUNING", raising=False)
+	monkeypatch.delenv("EMOJI_FLAPPY_DIFFICULTY", raising=False)
+	monkeypatch.delenv("EMOJI_FLAPPY_BOOTBENCH", raising=False)
+	monkeypatch.delenv("EMOJI_FLAPPY_PACING", raising=False)
+	monkeypatch.delenv("EMOJI_FLAPPY_FIXEDPOINT", raising=False)
+	monkeypatch.setenv("EMOJI_FLAPPY_SAVESTATE", str(tmp_path / "savestate.json"))
@@ -0,0 +1,253 @@
+"""
+Headless performance benchmarks for the game loop.
+NFR-001: Guard update/draw throughput, spawn, restart and startup cost against regressions.
+REQ-022: Cold-start time to first frame of the real entry point.
+REQ-025: Particle update and draw cost with a full pool.
+REQ-027: Training environment steps per second.
+REQ-028: Snapshot and restore cost.
+REQ-029: Fixed-point physics runs no slower than float physics.
+
+Skipped unless EMOJI_FLAPPY_BENCH is set:
+	EMOJI_FLAPPY_BENCH=1       compare against tests/bench_baseline.json
+	EMOJI_FLAPPY_BENCH=update  record a new baseline
+The baseline is machine-specific and recorded on the first run if missing.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import json
+import re
+import subprocess
+import time
+import pytest
+import pygame as pg
+from game import Game, Obstacle
+from autopilot import Autopilot
+from particles import ParticleSystem
+from gym_env import VectorFlappyEnv
+from snapshot import takeSnapshot, restoreSnapshot
+from render import RenderQueue
+from server import Session
+from conftest import WIDE_GAPS, seededGame
+
+BENCH_ENV = "EMOJI_FLAPPY_BENCH"
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "bench_baseline.json")
+REGRESSION_THRESHOLD = 0.25     # fail when throughput drops by more than 25%
+DENSITIES = (0, 4, 16)          # obstacles on screen
+MEASURE_SECONDS = 0.2
+REPEATS = 3
+DT = 1.0 / 60
+GYM_ENVS = 256                 # environments in the vectorized step benchmark
+PARTICLE_COUNT = 4000          # live particles in the particle benchmark
+REPLAY_SECONDS = 60            # bot-played run re-simulated by the physics benchmark
+MAIN_PATH = os.path.join(os.path.dirname(__file__), '..', 'src', 'main.py')
+
+pytestmark = pytest.mark.skipif(
+	not os.environ.get(BENCH_ENV), reason=f"set {BENCH_ENV}=1 to run benchmarks"
+)
+
+
+def measureThroughput(setup, operation, batch=30):
+	"""
+	Best-of-REPEATS operations per second.
+	setup() runs untimed before every batch of operations.
+	"""
+	best = 0.0
+	for _ in range(REPEATS):
+		count = 0
+		elapsed = 0.0
+		while elapsed < MEASURE_SECONDS:
+			setup()
+			start = time.perf_counter()
+			for _ in range(batch):
+				operation()
+			elapsed += time.perf_counter() - start
+			count += batch
+		best = max(best, count / elapsed)
+	return best
+
+
+def populate(game, density, gap=None):
+	"""
+	Reset the game to a live run with density obstacles spread across the screen.
+	By default gaps are full height so obstacles are updated but never collide.
+	"""
+	game.game_over = False
+	game.player.y = game.screen_height // 2
+	game.player.velocity = 0.0
+	game.next_spawn_time = float("inf")
+	game.obstacles = []
+	# REQ-025: Effects emitted by earlier benchmarks would otherwise be drawn too
+	game.particles.clear()
+	for i in range(density):
+		obstacle = Obstacle(game.screen_width * (i + 1) // (density + 1), game.screen_height)
+		obstacle.gap_top, obstacle.gap_bottom = gap or (0, game.screen_height)
+		game.obstacles.append(obstacle)
+
+
+@pytest.fixture(scope="module")
+def game():
+	pg.init()
+	instance = Game()
+	yield instance
+	pg.quit()
+
+
+@pytest.fixture(scope="module")
+def baseline():
+	"""Load the stored baseline; write the merged results when recording."""
+	try:
+		with open(BASELINE_PATH, "r", encoding="utf-8") as f:
+			stored = json.load(f)
+	except (FileNotFoundError, ValueError):
+		stored = {}
+	recording = os.environ.get(BENCH_ENV) == "update" or not stored
+	results = {}
+	yield stored, results, recording
+
+	if recording and results:
+		with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+			json.dump(dict(stored, **results), f, indent=2, sort_keys=True)
+		print(f"\n[INFO] Benchmark baseline written to {BASELINE_PATH}")
+
+
+def checkThroughput(baseline, name, value):
+	"""Record a result and fail if it regressed beyond the threshold."""
+	stored, results, recording = baseline
+	results[name] = round(value, 1)
+	print(f"\n[BENCH] {name}: {value:,.0f}/s")
+	if recording or name not in stored:
+		return
+	floor = stored[name] * (1.0 - REGRESSION_THRESHOLD)
+	assert value >= floor, (
+		f"{name} regressed: {value:,.0f}/s vs baseline {stored[name]:,.0f}/s"
+	)
+
+
+class TestBenchmarks:
+	"""Throughput benchmarks (higher is better)."""
+
+	@pytest.mark.parametrize("density", DENSITIES)
+	def testUpdateThroughput_obstacleDensity_noRegression(self, game, baseline, density):
+		"""NFR-001: Game.update steps per second."""
+		value = measureThroughput(lambda: populate(game, density), lambda: game.update(DT))
+		checkThroughput(baseline, f"update_steps_per_s[{density}]", value)
+
+	@pytest.mark.parametrize("density", DENSITIES)
+	def testDrawThroughput_obstacleDensity_noRegression(self, game, baseline, density):
+		"""NFR-001: Game.draw frames per second."""
+		populate(game, density, gap=(200, 380))
+		value = measureThroughput(lambda: None, game.draw)
+		checkThroughput(baseline, f"draw_frames_per_s[{density}]", value)
+
+	def testSpawnThroughput_withPrevious_noRegression(self, game, baseline):
+		"""NFR-001: Obstacle spawn cost, including the reachability check."""
+		def spawn():
+			game.next_spawn_time = 0
+			game.spawnObstacle()
+
+		def setup():
+			populate(game, 1)
+
+		value = measureThroughput(setup, spawn)
+		checkThroughput(baseline, "spawns_per_s", value)
+
+	def testRestartThroughput_afterGameOver_noRegression(self, game, baseline):
+		"""NFR-001: Game.restart cost."""
+		value = measureThroughput(lambda: None, game.restart)
+		checkThroughput(baseline, "restarts_per_s", value)
+
+	def testAutopilotSearchThroughput_fullReplan_noRegression(self, game, baseline):
+		"""REQ-015: Lookahead searches per second when the plan must be rebuilt."""
+		populate(game, 2, gap=(220, 380))
+		game.obstacles[0].x = game.player.x + 60
+		autopilot = Autopilot(game)
+		autopilot.prepare()
+		player = game.player
+		value = measureThroughput(lambda: None,
+								  lambda: autopilot.findPlan(player.y, player.velocity))
+		checkThroughput(baseline, "autopilot_searches_per_s", value)
+
+	def testParticleThroughput_fullPool_noRegression(self, game, baseline):
+		"""REQ-025: Particle update plus batched draw per second with thousands live."""
+		particles = ParticleSystem()
+		queue = RenderQueue()
+		screen = game.render_target.surface
+
+		def setup():
+			particles.clear()
+			while particles.count < PARTICLE_COUNT:
+				particles.emit("debris", game.screen_width // 2, game.screen_height // 2)
+
+		def frame():
+			particles.update(DT / 100)
+			particles.draw(queue)
+			queue.flush(screen)
+
+		value = measureThroughput(setup, frame, batch=10)
+		checkThroughput(baseline, "particle_frames_per_s", value)
+
+	def testGymThroughput_vectorEnv_noRegression(self, baseline):
+		"""REQ-027: Environment steps per second through the vectorized environment."""
+		env = VectorFlappyEnv(GYM_ENVS, seed=1)
+		env.reset(seed=1)
+		# Flap on one tick in eight, staggered so episodes end at different times
+		schedule = [[int((tick + i) % 8 == 0) for i in range(GYM_ENVS)] for tick in range(8)]
+		ticks = iter(range(10 ** 9))
+		value = measureThroughput(lambda: None, lambda: env.step(schedule[next(ticks) % 8]))
+		checkThroughput(baseline, "gym_env_steps_per_s", value * GYM_ENVS)
+
+	def testSnapshotThroughput_fourObstacles_noRegression(self, game, baseline):
+		"""REQ-028: Snapshots taken, and restored, per second mid-run."""
+		populate(game, 4, gap=(200, 380))
+		snapshot = takeSnapshot(game)
+		taken = measureThroughput(lambda: None, lambda: takeSnapshot(game))
+		restored = measureThroughput(lambda: None, lambda: restoreSnapshot(game, snapshot))
+		checkThroughput(baseline, "snapshots_per_s", taken)
+		checkThroughput(baseline, "snapshot_restores_per_s", restored)
+
+	def testPhysicsThroughput_fixedPoint_noSlowerThanFloat(self, baseline, monkeypatch):
+		"""REQ-029: Session ticks per second re-simulating the same bot run in both modes."""
+		rates = {}
+		for fixed_point in (False, True):
+			monkeypatch.setenv("EMOJI_FLAPPY_FIXEDPOINT", "1" if fixed_point else "")
+			run = seededGame()
+			run.autopilot = Autopilot(run)
+			while not run.game_over and run.tick < REPLAY_SECONDS * 60:
+				run.update(DT)
+			run.autopilot = None
+			while not run.game_over:
+				run.update(DT)
+			submission = run.last_submission
+
+			def replay():
+				session = Session(submission["seed"], submission["flaps"], submission["ticks"],
+								  tuning=WIDE_GAPS, fixed_point=fixed_point)
+				session.advance(submission["ticks"])
+
+			ticks_per_replay = submission["ticks"]
+			rates[fixed_point] = measureThroughput(lambda: None, replay, batch=1) * ticks_per_replay
+		checkThroughput(baseline, "float_physics_ticks_per_s", rates[False])
+		checkThroughput(baseline, "fixed_physics_ticks_per_s", rates[True])
+		assert rates[True] >= rates[False]
+
+	def testStartupThroughput_newGame_noRegression(self, baseline):
+		"""NFR-001: Game construction (display, fonts, stores) per second."""
+		value = measureThroughput(lambda: None, Game, batch=3)
+		checkThroughput(baseline, "startups_per_s", value)
+
+	def testColdBoot_mainEntryPoint_noRegression(self, baseline, tmp_path):
+		"""REQ-022: Fresh-process boots per second, from main.py start to the first frame."""
+		env = dict(os.environ, EMOJI_FLAPPY_BOOTBENCH="1",
+				   EMOJI_FLAPPY_SCORES=str(tmp_path / "scores.jsonl"))
+		best_ms = float("inf")
+		for _ in range(REPEATS):
+			output = subprocess.run(
+				[sys.executable, MAIN_PATH], env=env, capture_output=True, text=True, timeout=60
+			).stdout
+			boot_ms = float(re.search(r"\[BOOT\] First frame after (\d+) ms", output)[1])
+			best_ms = min(best_ms, boot_ms)
+		checkThroughput(baseline, "cold_boots_per_s", 1000.0 / best_ms)
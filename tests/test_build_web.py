@@ -0,0 +1,114 @@
+"""
+Tests for the web bundle build.
+REQ-023: The staged bundle holds only the modules the game imports, precompiled
+when possible, compressed copies are served with cache headers and the report
+accounts for every file.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import gzip
+import subprocess
+import threading
+import urllib.request
+import urllib.error
+import pytest
+from build_web import (
+	collectModules, stageApp, compressBundle, getBundleReport, createServer
+)
+
+
+@pytest.fixture
+def webDir(tmp_path):
+	"""A fake pygbag output folder with a compressible page and a small icon."""
+	web = tmp_path / "web"
+	web.mkdir()
+	(web / "index.html").write_text("<html>" + "emoji flappy " * 400 + "</html>")
+	(web / "emoji_flappy.apk").write_bytes(b"PK" + b"\x00" * 4000)
+	(web / "favicon.png").write_bytes(b"\x89PNG" + bytes(range(200)))
+	return web
+
+
+@pytest.fixture
+def server(webDir):
+	"""Bundle server on a free port, stopped after the test."""
+	instance = createServer(str(webDir), host="127.0.0.1", port=0)
+	thread = threading.Thread(target=instance.serve_forever, daemon=True)
+	thread.start()
+	yield f"http://127.0.0.1:{instance.server_address[1]}"
+	instance.shutdown()
+	instance.server_close()
+
+
+def fetch(url, **headers):
+	try:
+		with urllib.request.urlopen(urllib.request.Request(url, headers=headers)) as response:
+			return response.status, response.headers, response.read()
+	except urllib.error.HTTPError as e:
+		return e.code, e.headers, b""
+
+
+class TestBuildWeb:
+	"""Test the trimmed bundle pipeline and the compressed static server."""
+
+	def testCollectModules_fromMain_toolsLeftOut(self):
+		"""REQ-023: Only modules the game can import are bundled."""
+		modules = collectModules()
+
+		assert {"main", "game", "config", "memtrack", "telemetry"} <= set(modules)
+		assert not {"server", "verifier", "difficulty_report", "build_web"} & set(modules)
+
+	def testStageApp_matchingRuntime_sourcelessBytecodeImports(self, tmp_path):
+		"""REQ-023: Staged bytecode replaces sources and still imports."""
+		stage = tmp_path / "stage"
+
+		summary = stageApp(str(stage), python_version=sys.version_info[:2])
+		code = "import sys; sys.path.insert(0, '.'); import game; print(game.__file__)"
+		env = dict(os.environ, SDL_VIDEODRIVER="dummy")
+		result = subprocess.run([sys.executable, "-c", code], cwd=stage, capture_output=True,
+								text=True, timeout=60, env=env)
+
+		assert summary["bytecode"] is True
+		assert (stage / "main.py").exists() and (stage / "game.pyc").exists()
+		assert not (stage / "game.py").exists() and not (stage / "server.pyc").exists()
+		assert result.stdout.strip().endswith("game.pyc")
+
+	def testStageApp_otherRuntime_stagesSources(self, tmp_path):
+		"""REQ-023: Bytecode for a different runtime version is never shipped."""
+		stage = tmp_path / "stage"
+
+		summary = stageApp(str(stage), python_version=(2, 7))
+
+		assert summary["bytecode"] is False
+		assert (stage / "game.py").exists() and not (stage / "game.pyc").exists()
+
+	def testReport_compressedBundle_smallerServedSize(self, webDir):
+		"""REQ-023: Compressible files get gzip copies and load estimates drop."""
+		compressed = compressBundle(str(webDir))
+
+		report = getBundleReport(str(webDir))
+
+		assert sorted(compressed) == ["emoji_flappy.apk", "index.html"]
+		assert [f["file"] for f in report["files"]] == [
+			"emoji_flappy.apk", "favicon.png", "index.html"]
+		assert report["served_bytes"] < report["bytes"]
+		assert all(load["served_s"] < load["raw_s"] for load in report["loads"])
+
+	def testServer_gzipAndEtag_compressedThenNotModified(self, webDir, server):
+		"""REQ-023: Compressed bodies when accepted, cache headers and 304 revalidation."""
+		compressBundle(str(webDir))
+
+		status, headers, body = fetch(server + "/emoji_flappy.apk", **{"Accept-Encoding": "gzip"})
+		plain_status, plain_headers, plain_body = fetch(server + "/emoji_flappy.apk")
+		page_status, page_headers, _ = fetch(server + "/")
+		revalidated, _, _ = fetch(server + "/emoji_flappy.apk",
+								  **{"If-None-Match": headers["ETag"]})
+
+		assert status == 200 and headers["Content-Encoding"] == "gzip"
+		assert gzip.decompress(body) == plain_body
+		assert plain_headers["Content-Encoding"] is None
+		assert "max-age" in headers["Cache-Control"]
+		assert page_status == 200 and page_headers["Cache-Control"] == "no-cache"
+		assert revalidated == 304
@@ -9,7 +9,10 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 import pytest
 import pygame as pg
+import game
 from game import Player, Obstacle, Game
+from server import PLAYER_LEFT
+from config import EMOJI_SIZE, SCREEN_WIDTH
 
 
 # Initialize pygame for testing
@@ -90,3 +93,18 @@ class TestCollision:
 		game.update(0.016)
 		
 		assert game.game_over is True
+	
+	def testHitbox_wideEmojiSprite_emojiSizeLikeSession(self, monkeypatch):
+		"""REQ-004: Hitboxes stay EMOJI_SIZE wide when the font renders larger sprites."""
+		class WideFont:
+			def render(self, text, antialias, color):
+				return pg.Surface((EMOJI_SIZE + 24, EMOJI_SIZE + 10))
+		monkeypatch.setattr(game, "get_emoji_font", lambda size: WideFont())
+		player = Player(SCREEN_WIDTH // 4, 300)
+		obstacle = Obstacle(200, 800)
+		
+		assert (player.rect.left, player.rect.width, player.rect.height) == (
+			PLAYER_LEFT, EMOJI_SIZE, EMOJI_SIZE)
+		assert player.rect.center == (SCREEN_WIDTH // 4, 300)
+		assert obstacle.emoji_width == EMOJI_SIZE
+		assert obstacle.sprite_offset == -12
@@ -0,0 +1,97 @@
+"""
+Tests for difficulty progression.
+REQ-021: Precomputed per-tier tuning tightens with score, the game and the
+headless sessions switch tiers identically and the survival report adds up.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import random
+from game import Game, Obstacle
+from autopilot import Autopilot
+from difficulty import DifficultyCurve
+from difficulty_report import simulateRuns, buildReport
+from verifier import verifySubmission
+from tuning import DEFAULT_TUNING
+from config import PHYSICS_TICK_RATE, DIFFICULTY_MAX_SCORE, DIFFICULTY_TIER_SIZE
+
+
+class TestDifficulty:
+	"""Test score-driven difficulty tiers."""
+
+	def testCurve_tiers_tightenWithScore(self):
+		"""REQ-021: Every tier is faster, with smaller gaps and shorter intervals."""
+		curve = DifficultyCurve()
+
+		assert curve.getLevel(0).tuning is DEFAULT_TUNING
+		assert len(curve.tiers) == DIFFICULTY_MAX_SCORE // DIFFICULTY_TIER_SIZE + 1
+		assert curve.getLevel(DIFFICULTY_TIER_SIZE - 1) is curve.tiers[0]
+		assert curve.getLevel(DIFFICULTY_TIER_SIZE) is curve.tiers[1]
+		assert curve.getLevel(10 ** 6) is curve.tiers[-1]
+		for easier, harder in zip(curve.tiers, curve.tiers[1:]):
+			assert harder.tuning.scroll_speed > easier.tuning.scroll_speed
+			assert harder.tuning.gap_size_range[1] < easier.tuning.gap_size_range[1]
+			assert harder.tuning.spawn_interval_range[1] < easier.tuning.spawn_interval_range[1]
+
+	def testGame_progressionOff_singleBaseTier(self):
+		"""REQ-021: Without progression the game plays the base tuning throughout."""
+		game = Game()
+		game.player.score = DIFFICULTY_MAX_SCORE
+		game.updateDifficulty()
+
+		assert game.difficulty.progressive is False
+		assert game.tuning is DEFAULT_TUNING
+
+	def testUpdateDifficulty_tierBoundary_obstaclesAndSpawnsUseNewTier(self, monkeypatch):
+		"""REQ-021: Crossing a tier boundary speeds up live obstacles and new spawns."""
+		monkeypatch.setenv("EMOJI_FLAPPY_DIFFICULTY", "1")
+		game = Game()
+		obstacle = Obstacle(400, game.screen_height, tuning=game.tuning)
+		game.obstacles = [obstacle]
+
+		game.player.score = DIFFICULTY_TIER_SIZE
+		game.updateDifficulty()
+		level = game.difficulty.tiers[1]
+		obstacle.update(1.0)
+		game.next_spawn_time = 0
+		game.spawnObstacle()
+
+		assert game.tuning is level.tuning
+		assert game.reachability is level.envelope
+		assert obstacle.x == 400 - level.tuning.scroll_speed
+		assert game.obstacles[-1].tuning is level.tuning
+		assert game.next_spawn_time <= level.tuning.spawn_interval_range[1]
+
+	def testVerify_progressionRun_sessionFollowsTiers(self, monkeypatch):
+		"""REQ-021: A run that changed tiers re-simulates to the same score."""
+		monkeypatch.setenv("EMOJI_FLAPPY_DIFFICULTY", "1")
+		random.seed(3)
+		game = Game()
+		game.autopilot = Autopilot(game)
+		while not game.game_over and game.tick < 120 * PHYSICS_TICK_RATE:
+			game.update(1.0 / PHYSICS_TICK_RATE)
+		game.autopilot = None
+		while not game.game_over:
+			game.update(1.0 / PHYSICS_TICK_RATE)
+		submission = game.last_submission
+
+		result = verifySubmission(submission)
+
+		assert submission["progression"] is True
+		assert game.difficulty.getTier(submission["score"]) >= 1
+		assert result["valid"] is True
+		assert verifySubmission(dict(submission, progression=False))["valid"] is False
+
+	def testReport_simulatedRuns_tierCountsAddUp(self):
+		"""REQ-021: Each run is counted once where it crashed and in every tier it reached."""
+		results, curve = simulateRuns(4, seed=1, max_ticks=40 * PHYSICS_TICK_RATE)
+
+		rows = buildReport(results, curve)
+
+		assert [row["tier"] for row in rows] == list(range(len(curve.tiers)))
+		assert rows[0]["entered"] == 4
+		assert sum(row["crashed"] for row in rows) == sum(r.cause is not None for r in results)
+		assert all(a["entered"] >= b["entered"] for a, b in zip(rows, rows[1:]))
+		assert all(sum(r.tier_ticks) == r.ticks for r in results)
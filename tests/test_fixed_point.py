@@ -0,0 +1,112 @@
+"""
+Tests for fixed-point physics.
+REQ-029: Integer motion reproduces known values exactly, the game and the
+headless session agree tick for tick, fixed-point runs are flagged so they
+re-simulate with integer physics and snapshots restore the integer state.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import json
+from server import Session, PLAYER_LEFT
+from snapshot import GameSnapshot, takeSnapshot, restoreSnapshot
+from verifier import verifySubmission
+from config import FIXED_ONE, SCREEN_HEIGHT, EMOJI_SIZE
+from conftest import WIDE_GAPS, seededGame, play
+
+
+def targetFx(obstacles):
+	"""Just below the middle of the next gap, in 1/FIXED_ONE px; integers only."""
+	for obstacle in obstacles:
+		if obstacle.x_fx + EMOJI_SIZE * FIXED_ONE >= PLAYER_LEFT * FIXED_ONE:
+			return ((obstacle.gap_top + obstacle.gap_bottom) // 2 + 20) * FIXED_ONE
+	return SCREEN_HEIGHT // 2 * FIXED_ONE
+
+
+def fixedPointGame(monkeypatch):
+	monkeypatch.setenv("EMOJI_FLAPPY_FIXEDPOINT", "1")
+	return seededGame()
+
+
+def steer(game):
+	"""Steer for the next gap on the integer state."""
+	player = game.player
+	return player.y_fx > targetFx(game.obstacles) and player.velocity_fx > 0
+
+
+def integerState(game):
+	return (game.tick, game.elapsed_ms, game.player.y_fx, game.player.velocity_fx, game.score,
+			[(o.x_fx, o.gap_top, o.gap_bottom, o.passed) for o in game.obstacles])
+
+
+class TestFixedPoint:
+	"""Test fixed-point determinism, game/session parity, verification and snapshots."""
+
+	def testSession_knownSeedAndPolicy_bitExactResult(self):
+		"""REQ-029: A minute of integer physics lands on the same values on any platform."""
+		session = Session(0, [], 3600, tuning=WIDE_GAPS, fixed_point=True)
+		while not session.done:
+			if session.y_fx > targetFx(session.obstacles) and session.velocity_fx > 0:
+				session.flaps.append(session.tick)
+			session.advance(1)
+
+		assert (session.tick, session.score, session.cause) == (3600, 40, None)
+		assert (session.y_fx, session.velocity_fx) == (22969176, 251221)
+		assert len(session.flaps) == 113
+		assert session.y == session.y_fx / FIXED_ONE
+
+	def testUpdate_gameAndSession_sameIntegersEveryTick(self, monkeypatch):
+		"""REQ-029: Game.update and Session.advance step identical integer state."""
+		game = fixedPointGame(monkeypatch)
+		session = Session(game.obstacle_seed, [], tuning=WIDE_GAPS, fixed_point=True)
+		mismatches = []
+		while not game.game_over and game.tick < 1200:
+			play(game, 1, steer)
+			if game.flap_log and game.flap_log[-1] == session.tick:
+				session.flaps.append(session.tick)
+			session.advance(1)
+			if (game.player.y_fx, game.score, [o.x_fx for o in game.obstacles]) != (
+					session.y_fx, session.score, [o.x_fx for o in session.obstacles]):
+				mismatches.append(game.tick)
+
+		assert game.score > 0
+		assert mismatches == []
+		assert all(isinstance(value, int) for value in integerState(game)[:5])
+
+	def testVerify_fixedPointRun_flaggedAndValid(self, monkeypatch):
+		"""REQ-029: Fixed-point submissions are flagged and re-simulate with integer physics."""
+		game = fixedPointGame(monkeypatch)
+		play(game, 1200, steer)
+		while not game.game_over:
+			game.update(1.0 / 60)
+		submission = game.last_submission
+		replays = [Session(submission["seed"], submission["flaps"], submission["ticks"],
+						   tuning=WIDE_GAPS, fixed_point=fixed_point)
+				   for fixed_point in (False, True)]
+		for session in replays:
+			session.advance(submission["ticks"])
+
+		result = verifySubmission(submission, WIDE_GAPS)
+
+		assert submission["fixed_point"] is True and submission["score"] > 0
+		assert result["valid"], result
+		assert replays[1].y == game.player.y
+		assert replays[0].y != game.player.y
+
+	def testRestore_jsonSnapshot_integerStateUnchanged(self, monkeypatch):
+		"""REQ-029: Snapshots hold exact float views, so the integers survive JSON."""
+		game = fixedPointGame(monkeypatch)
+		play(game, 300, steer)
+		snapshot = takeSnapshot(game)
+		saved = integerState(game)
+		play(game, 300, steer)
+		first = integerState(game)
+
+		restoreSnapshot(game, GameSnapshot.fromDict(json.loads(json.dumps(snapshot.toDict()))))
+		restored = integerState(game)
+		play(game, 300, steer)
+
+		assert restored == saved
+		assert integerState(game) == first
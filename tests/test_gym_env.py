@@ -0,0 +1,109 @@
+"""
+Tests for the training environment.
+REQ-027: Seeded episodes, Gymnasium-style step results, the observation vector,
+off-screen pixel frames and a vectorized batch that resets finished episodes.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pytest
+from gym_env import FlappyEnv, VectorFlappyEnv, ACTION_FLAP, ACTION_NOOP
+from server import PLAYER_LEFT
+from config import (
+	SCREEN_WIDTH, SCREEN_HEIGHT, GYM_OBSERVATION_SIZE, GYM_REWARD_ALIVE, GYM_REWARD_CRASH,
+	GYM_PIXEL_SIZE, GYM_PLAYER_COLOR
+)
+
+
+def playEpisode(env, seed, flap_every=12, limit=2000):
+	"""Flap every few ticks until the episode ends; returns observations and rewards."""
+	observations = [env.reset(seed=seed)[0]]
+	rewards = []
+	for tick in range(limit):
+		action = ACTION_FLAP if tick % flap_every == 0 else ACTION_NOOP
+		observation, reward, terminated, truncated, info = env.step(action)
+		observations.append(observation)
+		rewards.append(reward)
+		if terminated or truncated:
+			break
+	return observations, rewards
+
+
+class TestGymEnv:
+	"""Test the single and vectorized training environments."""
+
+	def testReset_sameSeedAndActions_sameEpisode(self):
+		"""REQ-027: Episodes are reproducible from their seed."""
+		first = playEpisode(FlappyEnv(), seed=7)
+		second = playEpisode(FlappyEnv(), seed=7)
+
+		observation = first[0][0]
+		assert first == second
+		assert len(observation) == GYM_OBSERVATION_SIZE
+		assert observation[0] == pytest.approx(0.5) and observation[1] == 0.0
+
+	def testStep_noFlaps_crashTerminatesAndShortEpisodeTruncates(self):
+		"""REQ-027: Crashing ends with the crash reward; hitting max_ticks truncates."""
+		env = FlappyEnv()
+		env.reset(seed=1)
+		rewards = []
+		terminated = truncated = False
+		while not (terminated or truncated):
+			_, reward, terminated, truncated, info = env.step(ACTION_NOOP)
+			rewards.append(reward)
+
+		short = FlappyEnv(max_ticks=10)
+		short.reset(seed=1)
+		results = [short.step(ACTION_NOOP) for _ in range(10)]
+
+		assert terminated and not truncated and info["cause"] == "floor"
+		assert rewards[-1] == GYM_REWARD_CRASH
+		assert rewards[:-1] == [pytest.approx(GYM_REWARD_ALIVE)] * (len(rewards) - 1)
+		assert [r[3] for r in results] == [False] * 9 + [True]
+		assert not any(r[2] for r in results)
+
+	def testObservation_obstacleAhead_describesNextGap(self):
+		"""REQ-027: The vector holds the nearest gap still ahead of the player."""
+		env = FlappyEnv()
+		env.reset(seed=3)
+		while not env.session.obstacles:
+			observation = env.step(ACTION_FLAP if env.session.velocity > 200 else ACTION_NOOP)[0]
+		obstacle = env.session.obstacles[0]
+
+		assert observation[2] == pytest.approx(obstacle.gap_top / SCREEN_HEIGHT)
+		assert observation[3] == pytest.approx(obstacle.gap_bottom / SCREEN_HEIGHT)
+		assert observation[4] == pytest.approx((obstacle.x - PLAYER_LEFT) / SCREEN_WIDTH)
+
+	def testRender_pixelObservation_offScreenFrame(self):
+		"""REQ-027: Pixel observations are downsampled RGB frames with the bird drawn in."""
+		env = FlappyEnv(pixels=True)
+
+		frame, _ = env.reset(seed=1)
+
+		width, height = GYM_PIXEL_SIZE
+		assert isinstance(frame, bytes) and len(frame) == width * height * 3
+		pixels = {frame[i:i + 3] for i in range(0, len(frame), 3)}
+		assert bytes(GYM_PLAYER_COLOR) in pixels
+
+	def testVectorStep_finishedEpisodes_resetInPlace(self):
+		"""REQ-027: One call steps every environment and restarts the ones that ended."""
+		env = VectorFlappyEnv(8, seed=2)
+		observations, _ = env.reset(seed=100)
+		reference = FlappyEnv()
+		first, _ = reference.reset(seed=103)
+
+		assert len(observations) == 8 * GYM_OBSERVATION_SIZE
+		assert tuple(observations[3 * GYM_OBSERVATION_SIZE:4 * GYM_OBSERVATION_SIZE]) == first
+
+		finished = {}
+		while len(finished) < 8:
+			_, rewards, terminated, truncated, infos = env.step([ACTION_NOOP] * 8)
+			finished.update(infos)
+			for i in infos:
+				assert terminated[i] and not truncated[i]
+				assert rewards[i] == GYM_REWARD_CRASH
+
+		assert all(info["cause"] == "floor" for info in finished.values())
+		assert all(session.tick <= 1 for session in env.sessions)
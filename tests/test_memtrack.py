@@ -0,0 +1,82 @@
+"""
+Tests for memory growth tracking.
+REQ-016: Per-subsystem allocations, GC pauses and growth across restarts are reported.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import gc
+import pytest
+from memtrack import MemoryTracker, getSlope
+from config import MEMTRACK_WARMUP_RESTARTS
+
+
+@pytest.fixture
+def tracker():
+	instance = MemoryTracker()
+	instance.start()
+	yield instance
+	instance.stop()
+
+
+class TestMemoryTracker:
+	"""Test opt-in allocation tracker."""
+	
+	def testMark_allocatingSubsystem_netAndTransientRecorded(self, tracker):
+		"""REQ-016: Retained and temporary allocations are attributed per subsystem."""
+		kept = []
+		tracker.beginFrame()
+		kept.append(bytearray(200_000))
+		tracker.mark("update")
+		temporary = bytearray(500_000)
+		del temporary
+		tracker.mark("draw")
+		
+		assert tracker.subsystems["update"].net_bytes >= 200_000
+		assert tracker.subsystems["draw"].transient_max >= 450_000
+		assert tracker.subsystems["draw"].net_bytes < 100_000
+	
+	def testGcCallback_collection_pauseTimed(self, tracker):
+		"""REQ-016: GC pauses are counted per generation."""
+		gc.collect()
+		
+		count, total, longest = tracker.gc_pauses[2]
+		assert count >= 1
+		assert total >= longest > 0
+	
+	def testOnRestart_leakEveryRun_growthFlagged(self, tracker):
+		"""REQ-016: Memory that keeps rising across restarts is flagged."""
+		leak = []
+		flagged = False
+		for _ in range(MEMTRACK_WARMUP_RESTARTS + 4):
+			leak.append(bytearray(100_000))
+			flagged = tracker.onRestart() or flagged
+		
+		assert flagged is True
+		assert tracker.growth_flagged is True
+	
+	def testOnRestart_steadyState_notFlagged(self, tracker):
+		"""REQ-016: Stable memory across restarts is not flagged."""
+		for _ in range(MEMTRACK_WARMUP_RESTARTS + 4):
+			scratch = bytearray(100_000)
+			del scratch
+			tracker.onRestart()
+		
+		assert tracker.growth_flagged is False
+	
+	def testGetReport_afterFrames_listsSubsystemsGcAndSites(self, tracker):
+		"""REQ-016: The report covers subsystems, GC and top allocation sites."""
+		kept = []
+		tracker.beginFrame()
+		kept.append([object() for _ in range(1000)])
+		tracker.mark("update")
+		gc.collect()
+		
+		report = tracker.getReport()
+		
+		assert "update:" in report
+		assert "gc gen2" in report
+		assert "test_memtrack.py" in report
+		assert getSlope([0, 10, 20, 30]) == pytest.approx(10.0)
@@ -0,0 +1,86 @@
+"""
+Tests for frame pacing.
+REQ-024: Each pacing mode limits the frame rate its own way, vsync falls back
+when unavailable, the power saver slows down on an idle screen and the
+achieved jitter is reported.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pygame as pg
+import pytest
+import pacing
+from pacing import FramePacer
+from config import PACING_DEFAULT_MODE
+
+
+def runFrames(pacer, frames, idle=False):
+	"""Tick the pacer frames + 1 times; the first tick only starts the measurement."""
+	for _ in range(frames + 1):
+		pacer.tick(idle=idle)
+	return pacer.getStats()
+
+
+class TestPacing:
+	"""Test the frame pacer modes and their jitter statistics."""
+
+	def testInit_modeFromEnv_unknownFallsBack(self, monkeypatch):
+		"""REQ-024: The mode comes from the environment; unknown names use the default."""
+		monkeypatch.setenv("EMOJI_FLAPPY_PACING", "uncapped")
+		assert FramePacer().mode == "uncapped"
+
+		monkeypatch.setenv("EMOJI_FLAPPY_PACING", "warp")
+		assert FramePacer().mode == PACING_DEFAULT_MODE
+
+	def testOpenDisplay_vsyncUnavailable_fallsBackToPrecise(self, monkeypatch):
+		"""REQ-024: A driver without vsync still opens a display, paced by busy-waiting."""
+		def getScreen(size, vsync=False):
+			if vsync:
+				raise pg.error("vsync not supported")
+			return pg.display.set_mode(size)
+		monkeypatch.setattr(pacing, "get_screen", getScreen)
+		pacer = FramePacer("vsync")
+
+		screen = pacer.openDisplay((120, 80))
+
+		assert screen.get_size() == (120, 80)
+		assert pacer.mode == "precise"
+
+	def testTick_precise_holdsTargetRate(self):
+		"""REQ-024: Precise pacing never runs faster than the target frame time."""
+		pacer = FramePacer("precise", fps=200)
+
+		stats = runFrames(pacer, 20)
+
+		assert stats["frames"] == 20
+		assert stats["mean_ms"] >= 4.5
+		assert stats["max_ms"] >= stats["mean_ms"]
+
+	def testTick_powerSaverIdle_slowsDownAndSkipsStats(self):
+		"""REQ-024: Idle frames run at the low rate and stay out of the jitter figures."""
+		pacer = FramePacer("powersaver", fps=200, idle_fps=25)
+		runFrames(pacer, 3)
+
+		dt = pacer.tick(idle=True)
+
+		assert dt >= 0.035
+		assert pacer.idle_frames == 1
+		assert pacer.frames == 3
+
+	def testStats_knownFrameTimes_jitterAndPercentile(self):
+		"""REQ-024: Jitter is the frame-time spread; p99 is the distance from the target."""
+		pacer = FramePacer("sleep", fps=50)
+		for ms in [20.0] * 98 + [30.0, 10.0]:
+			pacer.recordFrame(ms)
+
+		stats = pacer.getStats()
+		report = pacer.getReport()
+
+		assert stats["mean_ms"] == pytest.approx(20.0)
+		assert stats["fps"] == pytest.approx(50.0)
+		assert stats["jitter_ms"] == pytest.approx(2 ** 0.5)
+		assert stats["p99_ms"] == pytest.approx(10.0)
+		assert stats["max_ms"] == 30.0
+		assert report.startswith("[PACING] mode=sleep frames=100")
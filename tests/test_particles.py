@@ -0,0 +1,93 @@
+"""
+Tests for particle effects.
+REQ-025: Particles live in a fixed-size pool, expire without leaving gaps, are
+drawn in one batch and are triggered by flaps, scoring and crashes.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pygame as pg
+from game import Game, Obstacle
+from particles import ParticleSystem
+from render import RenderTarget, RenderQueue
+from config import PARTICLE_EFFECTS, PARTICLE_FADE_STEPS
+
+
+class TestParticles:
+	"""Test the particle pool and the game's effect triggers."""
+
+	def testEmit_fullPool_dropsOverflow(self):
+		"""REQ-025: A burst never grows the pool past its capacity."""
+		particles = ParticleSystem(capacity=20)
+
+		first = particles.emit("sparkle", 100, 100)
+		second = particles.emit("sparkle", 100, 100)
+
+		assert first == PARTICLE_EFFECTS["sparkle"][0]
+		assert second == 20 - first
+		assert particles.count == 20
+		assert len(particles.x) == 20
+
+	def testUpdate_expiredParticles_survivorsStayPacked(self):
+		"""REQ-025: Expired particles are replaced by live ones and gravity pulls the rest."""
+		particles = ParticleSystem()
+		particles.emit("debris", 200, 200, count=3)
+		particles.emit("sparkle", 200, 200, count=3)
+		for i in range(3):
+			particles.life[i] = 0.01
+		particles.vy[3] = 0.0
+
+		particles.update(0.05)
+
+		assert particles.count == 3
+		assert all(particles.sprite[i] == particles.effects["sparkle"][0] for i in range(3))
+		assert all(particles.life[i] > 0 for i in range(3))
+		assert all(particles.gravity[i] == 0 for i in range(3))
+
+		particles.update(1.0)
+		assert particles.count == 0
+
+	def testDraw_scaledTarget_batchedAtScaledPositions(self):
+		"""REQ-025: Particles are drawn with sprites and positions scaled to the target."""
+		display = pg.Surface((400, 300))
+		target = RenderTarget(display, (800, 600), scale=0.5)
+		particles = ParticleSystem()
+		particles.emit("debris", 400, 300, count=1)
+		particles.x[0], particles.y[0] = 400.0, 300.0
+		particles.life[0] = 10.0
+
+		queue = RenderQueue()
+		particles.draw(queue, target)
+		queue.flush(target.surface)
+
+		size = target.toRenderSize(PARTICLE_EFFECTS["debris"][2])
+		assert len(particles.scaled_sprites) == len(PARTICLE_EFFECTS) * PARTICLE_FADE_STEPS
+		debris_sprite = particles.scaled_sprites[particles.effects["debris"][0]]
+		assert debris_sprite.get_width() == size
+		assert target.surface.get_at((200 + size // 2, 150 + size // 2))[:3] != (0, 0, 0)
+
+	def testGame_flapScoreAndCrash_emitEffects(self):
+		"""REQ-025: Flaps, passed obstacles and game over start bursts; restart clears them."""
+		game = Game()
+		particles = game.particles
+
+		game.player.flap()
+		feathers = particles.count
+		obstacle = Obstacle(game.player.x - 200, game.screen_height, tuning=game.tuning)
+		obstacle.gap_top, obstacle.gap_bottom = 0, game.screen_height
+		game.obstacles = [obstacle]
+		game.next_spawn_time = float("inf")
+		game.update(1.0 / 60)
+		sparkles = particles.count - feathers
+		game.player.y = game.screen_height
+		game.update(1.0 / 60)
+
+		assert feathers == PARTICLE_EFFECTS["feather"][0]
+		assert sparkles == PARTICLE_EFFECTS["sparkle"][0]
+		assert game.game_over
+		assert particles.count == feathers + sparkles + PARTICLE_EFFECTS["debris"][0]
+
+		game.restart()
+		assert particles.count == 0
@@ -0,0 +1,111 @@
+"""
+Tests for local racing and ghost replays.
+REQ-017: Racers share one obstacle stream, collide and score independently,
+and a ghost replays the previous run over the same obstacles.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pygame as pg
+from game import Game, Obstacle
+from racing import findCollisions
+from telemetry import CAUSE_TOP_PIPE
+
+
+def twoRacerGame(monkeypatch):
+	"""Game with two racers and no pending spawns."""
+	monkeypatch.setenv("EMOJI_FLAPPY_RACERS", "2")
+	game = Game()
+	game.next_spawn_time = float("inf")
+	return game
+
+
+class TestRacing:
+	"""Test shared-obstacle racing."""
+	
+	def testUpdate_topPipeHitsOneRacer_otherKeepsRacing(self, monkeypatch):
+		"""REQ-017: A collision only takes out the racer that hit the obstacle."""
+		game = twoRacerGame(monkeypatch)
+		first, second = game.players
+		obstacle = Obstacle(first.x - 10, game.screen_height)
+		obstacle.gap_top, obstacle.gap_bottom = first.y + 10, second.y + 60
+		game.obstacles = [obstacle]
+		
+		game.update(0.001)
+		
+		assert first.alive is False
+		assert first.death_cause == CAUSE_TOP_PIPE
+		assert second.alive is True
+		assert game.game_over is False
+	
+	def testUpdate_allRacersOut_gameOverOnce(self, monkeypatch):
+		"""REQ-017: The run only ends when the last racer is out."""
+		game = twoRacerGame(monkeypatch)
+		for player in game.players:
+			player.y = game.screen_height + 100
+		
+		game.update(0.001)
+		
+		assert game.game_over is True
+		assert game.score_store.stats["runs"] == 1
+	
+	def testUpdate_passingObstacle_scoresLiveRacersOnly(self, monkeypatch):
+		"""REQ-005, REQ-017: Each live racer scores when the shared obstacle is passed."""
+		game = twoRacerGame(monkeypatch)
+		first, second = game.players
+		second.alive = False
+		obstacle = Obstacle(first.x - 200, game.screen_height)
+		game.obstacles = [obstacle]
+		
+		game.update(0.001)
+		
+		assert first.score == 1
+		assert second.score == 0
+		assert game.score == 1
+	
+	def testFindCollisions_obstaclesOutsideColumn_neverTestedPerRacer(self, monkeypatch):
+		"""REQ-017: Obstacles clear of the racers' column skip per-racer checks."""
+		game = twoRacerGame(monkeypatch)
+		checked = []
+		
+		class CountingObstacle(Obstacle):
+			def getCollisionCause(self, player_rect):
+				checked.append(self.x)
+				return super().getCollisionCause(player_rect)
+		
+		far = [CountingObstacle(x, game.screen_height) for x in (500, 600, 700)]
+		near = CountingObstacle(game.player.x, game.screen_height)
+		near.gap_top, near.gap_bottom = 0, game.screen_height
+		
+		hits = findCollisions(far + [near], game.players)
+		
+		assert hits == []
+		assert checked == [near.x, near.x]
+	
+	def testRestart_ghostRacing_replaysSeedAndTrajectory(self, monkeypatch):
+		"""REQ-017: A ghost replays the last run and the obstacle stream repeats."""
+		clock = [0]
+		monkeypatch.setattr(pg.time, "get_ticks", lambda: clock[0])
+		game = Game()
+		game.ghost_racing = True
+		seed = game.obstacle_seed
+		game.next_spawn_time = 0
+		game.spawnObstacle()
+		first_gap = game.obstacles[0].gap_top
+		for _ in range(5):
+			game.update(1.0 / 60)
+		recorded = list(game.trajectory)
+		
+		game.restart()
+		game.next_spawn_time = 0
+		game.spawnObstacle()
+		
+		assert game.obstacle_seed == seed
+		assert game.obstacles[0].gap_top == first_gap
+		ghost = game.ghosts[0]
+		for y in recorded:
+			ghost.update()
+			assert abs(ghost.rect.centery - y) <= 1
+		assert ghost.alive is False
@@ -0,0 +1,92 @@
+"""
+Tests for obstacle reachability.
+REQ-011: Validate the reach envelope against brute-force simulation and confirm
+impossible layouts are rejected by the spawner.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import itertools
+import random
+import pytest
+from game import Player, Obstacle, Game
+from reachability import ReachabilityEnvelope, generateGap
+from tuning import GAP_EDGE_MARGIN
+from config import EMOJI_SIZE, SCREEN_HEIGHT
+
+
+def bruteForceDisplacements(ticks, dt):
+	"""Final displacement of a real Player for every flap sequence of length ticks."""
+	player = Player(100, 300)
+	displacements = []
+	for flaps in itertools.product((False, True), repeat=ticks):
+		player.y = 300.0
+		player.velocity = 0.0
+		for flap in flaps:
+			if flap:
+				player.flap()
+			player.update(dt)
+		displacements.append(player.y - 300.0)
+	return displacements
+
+
+class TestReachability:
+	"""Test reachability envelope and solvable spawning."""
+
+	def testEnvelope_bruteForceSimulation_boundsMatchExtremes(self):
+		"""REQ-011: Table extremes equal the extremes of every flap sequence."""
+		envelope = ReachabilityEnvelope(margin=1.0)
+
+		for ticks in (1, 4, 8, 11):
+			displacements = bruteForceDisplacements(ticks, envelope.dt)
+
+			assert abs(-min(displacements) - envelope.max_rise[ticks]) < 1e-6
+			assert abs(max(displacements) - envelope.max_drop[ticks]) < 1e-6
+
+	def testEnvelope_longerDistance_reachNeverShrinks(self):
+		"""REQ-011: More horizontal distance can only widen the envelope."""
+		envelope = ReachabilityEnvelope()
+
+		for i in range(1, envelope.max_ticks + 1):
+			assert envelope.max_rise[i] >= envelope.max_rise[i - 1]
+			assert envelope.max_drop[i] >= envelope.max_drop[i - 1]
+
+	def testIsReachable_farApartGapsAtMinimumSpacing_rejected(self):
+		"""REQ-011: Bottom gap followed closely by a top gap is impossible."""
+		envelope = ReachabilityEnvelope()
+		previous = Obstacle(100, 600)
+		previous.gap_top, previous.gap_bottom = 410, 550
+		obstacle = Obstacle(100 + 2 * EMOJI_SIZE + 10, 600)
+		obstacle.gap_top, obstacle.gap_bottom = 50, 190
+
+		assert envelope.isReachable(previous, obstacle) is False
+
+	def testIsReachable_alignedGaps_accepted(self):
+		"""REQ-011: Gaps at the same height are always reachable."""
+		envelope = ReachabilityEnvelope()
+		previous = Obstacle(100, 600)
+		obstacle = Obstacle(420, 600)
+		obstacle.gap_top, obstacle.gap_bottom = previous.gap_top, previous.gap_bottom
+
+		assert envelope.isReachable(previous, obstacle) is True
+
+	def testGenerateGap_reachAboveMargin_nearestGapUsed(self):
+		"""REQ-011: A reach no in-bounds gap can cover gets the closest gap, not a random one."""
+		gaps = [generateGap(SCREEN_HEIGHT, reach=(0, 5), rng=random.Random(seed))
+				for seed in range(50)]
+
+		assert {top for top, _ in gaps} == {GAP_EDGE_MARGIN}
+
+	def testSpawnObstacle_manySpawns_everyLayoutReachable(self):
+		"""REQ-011: The spawner only produces reachable successive gaps."""
+		game = Game()
+
+		for _ in range(200):
+			game.obstacles = [Obstacle(game.screen_width - 330, game.screen_height)]
+			game.next_spawn_time = 0
+			game.spawnObstacle()
+
+			previous, obstacle = game.obstacles
+			assert game.reachability.isReachable(previous, obstacle)
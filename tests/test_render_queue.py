@@ -0,0 +1,84 @@
+"""
+Tests for the batched draw list.
+REQ-026: Entities queue their blits by layer, each layer is drawn in one pass
+bottom first and the per-layer command counts of the last frame are kept.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pygame as pg
+from game import Game, Obstacle
+from render import RenderQueue, LAYER_OBSTACLES, LAYER_PLAYERS, LAYER_HUD
+
+
+def solid(colour, size=(10, 10)):
+	surface = pg.Surface(size)
+	surface.fill(colour)
+	return surface
+
+
+class TestRenderQueue:
+	"""Test layer ordering, counts and what the game queues per frame."""
+
+	def testFlush_layersSubmittedOutOfOrder_bottomLayerDrawnFirst(self):
+		"""REQ-026: A higher layer covers a lower one regardless of submission order."""
+		queue = RenderQueue()
+		screen = pg.Surface((20, 20))
+
+		queue.submit(LAYER_HUD, solid((255, 0, 0)), (0, 0))
+		queue.submit(LAYER_OBSTACLES, solid((0, 255, 0)), (5, 5))
+		queue.flush(screen)
+
+		assert screen.get_at((7, 7))[:3] == (255, 0, 0)
+		assert screen.get_at((12, 12))[:3] == (0, 255, 0)
+
+	def testFlush_twice_queueEmptiedAndCountsReset(self):
+		"""REQ-026: Counts describe the last flush only."""
+		queue = RenderQueue()
+		screen = pg.Surface((20, 20))
+		queue.extend(LAYER_OBSTACLES, [(solid((0, 0, 255)), (0, 0))] * 3)
+		queue.submit(LAYER_PLAYERS, solid((0, 0, 255)), (0, 0))
+
+		queue.flush(screen)
+		first = queue.getCounts()
+		queue.flush(screen)
+
+		assert first["obstacles"] == 3 and first["players"] == 1
+		assert queue.getTotal() == 0
+
+	def testObstacleDraw_gap_tilesOnlyOutsideGap(self):
+		"""REQ-026: Queued tiles match the obstacle's top and bottom halves."""
+		game = Game()
+		obstacle = Obstacle(300, game.screen_height, tuning=game.tuning)
+		obstacle.gap_top, obstacle.gap_bottom = 200, 380
+		queue = RenderQueue()
+
+		obstacle.draw(queue)
+		tiles = queue.layers[LAYER_OBSTACLES]
+
+		assert tiles
+		assert all(y < 200 or 380 <= y < game.screen_height for _, (x, y) in tiles)
+		assert any(y < 200 for _, (x, y) in tiles) and any(y >= 380 for _, (x, y) in tiles)
+
+	def testGameDraw_gameOver_countsPerLayer(self):
+		"""REQ-026: The game queues every entity and HUD line and exposes the counts."""
+		game = Game()
+		obstacle = Obstacle(300, game.screen_height, tuning=game.tuning)
+		obstacle.gap_top, obstacle.gap_bottom = 200, 380
+		game.obstacles = [obstacle]
+		queue = RenderQueue()
+		obstacle.draw(queue)
+		tiles = len(queue.layers[LAYER_OBSTACLES])
+
+		game.draw()
+		playing = game.render_queue.getCounts()
+		game.game_over = True
+		game.draw()
+		over = game.render_queue.getCounts()
+
+		assert playing["obstacles"] == tiles
+		assert playing["players"] == 1 and playing["hud"] == 1
+		assert playing["overlay"] == 0 and playing["menu"] == 0
+		assert over["overlay"] == 1 and over["menu"] == 5
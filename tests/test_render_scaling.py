@@ -0,0 +1,71 @@
+"""
+Tests for resolution scaling.
+REQ-014: The game renders to an internal target and scales it to the window
+without changing gameplay coordinates.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pytest
+import pygame as pg
+import game as game_module
+from game import Game, Obstacle
+from render import RenderTarget
+
+
+pg.init()
+
+
+class TestRenderScaling:
+	"""Test internal render target and window scaling."""
+	
+	def testRenderTarget_defaultScale_drawsToDisplay(self):
+		"""REQ-014: At scale 1.0 no intermediate surface is used."""
+		game = Game()
+		
+		assert game.render_target.surface is game.screen
+		assert game.render_target.toRender((123, 45)) == (123, 45)
+	
+	def testRenderTarget_halfScale_lowResSurfaceFullWindow(self, monkeypatch):
+		"""REQ-014: Half scale renders at 400x300 into an 800x600 window."""
+		monkeypatch.setattr(game_module, "RENDER_SCALE", 0.5)
+		game = Game()
+		
+		assert game.render_target.surface.get_size() == (400, 300)
+		assert game.screen.get_size() == (game.screen_width, game.screen_height)
+		assert game.render_target.toRender((800, 600)) == (400, 300)
+	
+	def testGameplayCoordinates_halfScale_unchanged(self, monkeypatch):
+		"""REQ-014: Player and obstacle coordinates do not depend on render scale."""
+		monkeypatch.setattr(game_module, "RENDER_SCALE", 0.5)
+		game = Game()
+		
+		assert game.player.x == game.screen_width // 4
+		assert game.player.y == game.screen_height // 2
+		assert game.screen_height == 600
+	
+	def testDraw_halfScale_spriteScaledAndCached(self, monkeypatch):
+		"""REQ-014: Sprites are scaled once and reused across frames."""
+		monkeypatch.setattr(game_module, "RENDER_SCALE", 0.5)
+		game = Game()
+		game.obstacles.append(Obstacle(400, game.screen_height))
+		
+		game.draw()
+		scaled = game.render_target.sprite(game.player.surface)
+		game.game_over = True
+		game.draw()
+		
+		assert game.render_target.sprite(game.player.surface) is scaled
+		assert scaled.get_width() == round(game.player.surface.get_width() * 0.5)
+	
+	def testPresent_upscaledWindow_fillsDisplay(self):
+		"""REQ-014: The render target is stretched to cover the whole window."""
+		display = pg.display.set_mode((160, 120))
+		target = RenderTarget(display, (80, 60), scale=1.0)
+		target.surface.fill((255, 0, 0))
+		
+		target.present()
+		
+		assert display.get_at((159, 119))[:3] == (255, 0, 0)
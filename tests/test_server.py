@@ -0,0 +1,156 @@
+"""
+Tests for the headless game server.
+REQ-018: Sessions reproduce the game rules without a display and the server
+answers stand-in client jobs, inline or sharded across worker processes.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import asyncio
+import random
+from game import Game
+from autopilot import Autopilot
+from server import Session, GameServer, makeJob, runClient, simulateJobs, stepSessions
+from tuning import Tuning
+from config import PHYSICS_TICK_RATE
+
+
+def serveJobs(jobs, **kwargs):
+	"""Start a server on a free port, send jobs from the stand-in client, stop."""
+	async def roundTrip():
+		server = GameServer(**kwargs)
+		port = await server.start("127.0.0.1", 0)
+		try:
+			return await runClient("127.0.0.1", port, jobs), server
+		finally:
+			await server.stop()
+	return asyncio.run(roundTrip())
+
+
+class TestServer:
+	"""Test headless sessions and the session server."""
+
+	def testSession_sameSeedAndFlaps_matchesGameRun(self):
+		"""REQ-018: A session replays a Game run to the same obstacles and score."""
+		# Wide gaps keep the bot alive; both sides draw gaps through generateGap
+		game = Game()
+		game.applyTuning(Tuning({"GAP_SIZE_RANGE": [190, 220]}))
+		game.autopilot = Autopilot(game)
+		spawned = []
+		# The bot plays so the run meets several obstacles
+		while not game.game_over and game.tick < 15 * PHYSICS_TICK_RATE:
+			game.update(1.0 / PHYSICS_TICK_RATE)
+			spawned.extend(o for o in game.obstacles if o not in spawned)
+		ticks = game.tick
+
+		session = Session(game.obstacle_seed, game.flap_log, max_ticks=ticks, tuning=game.tuning)
+		session_spawned = []
+		while not session.done:
+			session.step()
+			session_spawned.extend(o for o in session.obstacles if o not in session_spawned)
+
+		assert game.score >= 3
+		assert ([(o.gap_top, o.gap_bottom) for o in session_spawned]
+				== [(o.gap_top, o.gap_bottom) for o in spawned])
+		assert session.score == game.score
+		assert session.tick == ticks
+		assert session.cause == game.player.death_cause
+
+	def testStepSessions_mixedLengths_returnsOnlyLiveSessions(self):
+		"""REQ-018: Batched stepping drops finished sessions from the batch."""
+		short = Session(1, max_ticks=5)
+		long = Session(1, flaps=range(0, 600, 18), max_ticks=100)
+
+		live = stepSessions([short, long], 10)
+
+		assert live == [long]
+		assert short.done and short.tick == 5
+		assert long.tick == 10
+
+	def testServer_standInClient_resultsMatchDirectSimulation(self):
+		"""REQ-018: Every job is answered with the result of re-simulating it."""
+		rng = random.Random(7)
+		jobs = [makeJob(rng, i, ticks=600) for i in range(200)]
+
+		results, server = serveJobs(jobs, slice_ticks=30)
+
+		expected = simulateJobs(jobs)
+		assert [results[i] for i in range(200)] == expected
+		assert server.sessions_done == 200
+		assert "sessions/s" in server.getReport()
+
+	def testServer_malformedJob_answeredWithError(self):
+		"""REQ-018: A bad job gets an error reply without affecting the others."""
+		jobs = [{"id": "bad", "flaps": [1, 2]}, {"id": "good", "seed": 3, "ticks": 60}]
+
+		results, _ = serveJobs(jobs)
+
+		assert "error" in results["bad"]
+		assert results["good"]["ticks"] > 0
+
+	def testServer_nonFiniteJobThenLaterClient_bothAnswered(self):
+		"""REQ-018: Infinity or NaN in a job is an error reply; the batch loop keeps serving."""
+		bad = [{"id": "inf", "seed": 1, "ticks": float("inf")},
+			   {"id": "nan", "seed": float("nan")},
+			   {"id": "good", "seed": 3, "ticks": 60}]
+
+		async def twoClients():
+			server = GameServer(workers=0)
+			port = await server.start("127.0.0.1", 0)
+			try:
+				first = await asyncio.wait_for(runClient("127.0.0.1", port, bad), 5)
+				later = await asyncio.wait_for(
+					runClient("127.0.0.1", port, [{"id": "later", "seed": 4, "ticks": 60}]), 5
+				)
+				return first, later
+			finally:
+				await server.stop()
+		first, later = asyncio.run(twoClients())
+
+		assert "error" in first["inf"] and "error" in first["nan"]
+		assert first["good"]["ticks"] > 0
+		assert later["later"]["ticks"] > 0
+
+	def testServer_batchRaises_errorRepliesAndLoopSurvives(self, monkeypatch):
+		"""REQ-018: An unexpected failure answers the whole batch instead of hanging it."""
+		import server
+		calls = []
+		real_step = server.stepSessions
+
+		def failOnce(sessions, ticks):
+			calls.append(ticks)
+			if len(calls) == 1:
+				raise RuntimeError("boom")
+			return real_step(sessions, ticks)
+		monkeypatch.setattr(server, "stepSessions", failOnce)
+
+		async def twoClients():
+			instance = GameServer(workers=0)
+			port = await instance.start("127.0.0.1", 0)
+			try:
+				first = await asyncio.wait_for(
+					runClient("127.0.0.1", port, [{"id": "a", "seed": 1, "ticks": 60}]), 5
+				)
+				later = await asyncio.wait_for(
+					runClient("127.0.0.1", port, [{"id": "b", "seed": 2, "ticks": 60}]), 5
+				)
+				return first, later
+			finally:
+				await instance.stop()
+		first, later = asyncio.run(twoClients())
+
+		assert "boom" in first["a"]["error"]
+		assert later["b"]["ticks"] > 0
+
+	def testServer_workerProcesses_shardedResultsMatchInline(self):
+		"""REQ-018: Sharding across worker processes does not change any result."""
+		rng = random.Random(11)
+		jobs = [makeJob(rng, i, ticks=300) for i in range(40)]
+
+		inline, _ = serveJobs(jobs)
+		sharded, server = serveJobs(jobs, workers=2)
+
+		assert sharded == inline
+		assert server.sessions_done == 40
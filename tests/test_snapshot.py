@@ -0,0 +1,157 @@
+"""
+Tests for snapshots and rewind.
+REQ-028: Restoring a snapshot reproduces the run, snapshots survive JSON, the
+ring keeps recent snapshots for rewinding, rewound runs are practice and save
+states round-trip through a file.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import json
+from snapshot import GameSnapshot, SnapshotRing, takeSnapshot, restoreSnapshot
+from config import SNAPSHOT_INTERVAL_TICKS
+from conftest import seededGame, play
+
+
+def fallingFast(game):
+	"""Flap whenever the bird falls fast; a policy that depends only on the state."""
+	return game.player.velocity > 250
+
+
+def simulationState(game):
+	return (game.tick, game.player.y, game.player.velocity, game.score, game.game_over,
+			[(o.x, o.gap_top, o.gap_bottom, o.passed) for o in game.obstacles],
+			list(game.flap_log), game.rng.getstate(), game.next_spawn_time)
+
+
+class TestSnapshot:
+	"""Test snapshot restore, serialisation, the rewind ring and practice runs."""
+
+	def testRestore_replaySameInputs_identicalState(self):
+		"""REQ-028: A restored game carries on exactly as it did the first time."""
+		game = seededGame()
+		play(game, 150, fallingFast)
+		snapshot = takeSnapshot(game)
+		play(game, 200, fallingFast)
+		first = simulationState(game)
+
+		restoreSnapshot(game, snapshot)
+		restored_tick = game.tick
+		play(game, 200, fallingFast)
+
+		assert restored_tick == snapshot.tick
+		assert game.obstacles
+		assert simulationState(game) == first
+
+	def testToDict_jsonRoundTrip_sameSnapshot(self):
+		"""REQ-028: Snapshots convert to JSON and back without loss."""
+		game = seededGame()
+		play(game, 200, fallingFast)
+		snapshot = takeSnapshot(game)
+
+		loaded = GameSnapshot.fromDict(json.loads(json.dumps(snapshot.toDict())))
+
+		assert loaded.toDict() == snapshot.toDict()
+		assert loaded.rng_state == snapshot.rng_state
+
+	def testRing_rewind_stepsBackAtLeastOneInterval(self):
+		"""REQ-028: The ring keeps the newest snapshots and rewinds a full interval back."""
+		game = seededGame()
+		ring = SnapshotRing(size=3)
+		for _ in range(SNAPSHOT_INTERVAL_TICKS * 5 + 5):
+			ring.record(game)
+			game.tick += 1
+
+		ticks = [snapshot.tick for snapshot in ring.snapshots]
+		first = ring.rewind(game.tick)
+		second = ring.rewind(first.tick)
+
+		assert ticks == [SNAPSHOT_INTERVAL_TICKS * n for n in (3, 4, 5)]
+		assert first.tick == SNAPSHOT_INTERVAL_TICKS * 4
+		assert second.tick == SNAPSHOT_INTERVAL_TICKS * 3
+		assert ring.rewind(second.tick) is None
+
+	def testRewind_afterCrash_practiceRunNotRecorded(self):
+		"""REQ-028: Rewinding revives the run as practice; restart reuses the racers."""
+		game = seededGame()
+		play(game, 100, fallingFast)
+		while not game.game_over:
+			game.update(1.0 / 60)
+		player = game.player
+		crashed_tick = game.tick
+
+		rewound = game.rewind()
+		rewound_tick = game.tick
+		flaps = list(game.flap_log)
+		while not game.game_over:
+			game.update(1.0 / 60)
+		game.restart()
+
+		assert rewound is True
+		assert crashed_tick - rewound_tick >= SNAPSHOT_INTERVAL_TICKS
+		assert all(tick < rewound_tick for tick in flaps)
+		assert game.last_submission is None
+		assert len(game.score_store.pending) == 1  # only the crash before the rewind
+		assert game.practice is False and game.player is player
+
+	def testSaveAndLoadState_file_restoresTick(self, tmp_path, monkeypatch, capsys):
+		"""REQ-028: Save states round-trip through a file; a bad file is reported, not raised."""
+		path = tmp_path / "state.json"
+		monkeypatch.setenv("EMOJI_FLAPPY_SAVESTATE", str(path))
+		game = seededGame()
+		play(game, 90, fallingFast)
+		saved = simulationState(game)
+		game.saveState()
+		play(game, 60, fallingFast)
+
+		game.loadState()
+		loaded = simulationState(game)
+		path.write_text("{}")
+		game.loadState()
+
+		assert loaded == saved
+		assert game.practice is True
+		assert "[WARNING] Could not load state" in capsys.readouterr().out
+
+	def testLoadState_malformedShapes_reportedAndGameUntouched(self, tmp_path, monkeypatch, capsys):
+		"""REQ-028: A save state with bad shapes or types is rejected before the game changes."""
+		path = tmp_path / "state.json"
+		monkeypatch.setenv("EMOJI_FLAPPY_SAVESTATE", str(path))
+		game = seededGame()
+		play(game, 120, fallingFast)  # past the longest first spawn interval
+		game.saveState()
+		good = json.loads(path.read_text())
+		player, obstacle = good["players"][0], good["obstacles"][0]
+		version, internal, gauss = good["rng_state"]
+		broken = [
+			{"rng_state": [version, internal[:10], gauss]},
+			{"rng_state": [version, internal]},
+			{"rng_state": "seeded"},
+			{"players": [player] * 3},
+			{"players": []},
+			{"players": [player[:5]]},
+			{"players": [["high"] + player[1:]]},
+			{"players": [[float("inf")] + player[1:]]},
+			{"players": [[1e10] + player[1:]]},
+			{"players": [player[:1] + [-1e12] + player[2:]]},
+			{"players": [player[:4] + ["lava"] + player[5:]]},
+			{"obstacles": [obstacle + [0]]},
+			{"obstacles": [[obstacle[0], "top", obstacle[2], obstacle[3]]]},
+			{"obstacles": [[obstacle[0], obstacle[2], obstacle[1], obstacle[3]]]},
+			{"obstacles": [[1e10] + obstacle[1:]]},
+			{"ghosts": [-1]},
+			{"tick": -5},
+			{"game_over": "no"},
+		]
+		play(game, 60, fallingFast)
+		before = simulationState(game)
+
+		for change in broken:
+			path.write_text(json.dumps(dict(good, **change)))
+			game.loadState()
+			assert simulationState(game) == before, change
+			assert game.practice is False
+
+		assert capsys.readouterr().out.count("[WARNING] Could not load state") == len(broken)
@@ -0,0 +1,50 @@
+"""
+Tests for startup.
+REQ-022: Only display and font start up front, optional modules load on first
+use, and the first frame reports the boot time.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import asyncio
+import subprocess
+import pygame as pg
+import main
+from config import init_subsystems
+
+SRC_PATH = os.path.join(os.path.dirname(__file__), '..', 'src')
+
+
+class TestStartup:
+	"""Test lazy subsystem initialisation and the first-frame report."""
+
+	def testInitSubsystems_freshStart_onlyDisplayAndFont(self):
+		"""REQ-022: Mixer and joystick are not brought up before the first frame."""
+		pg.quit()
+
+		init_subsystems()
+
+		assert pg.display.get_init() and pg.font.get_init()
+		assert not pg.mixer.get_init()
+		assert not pg.joystick.get_init()
+
+	def testImportGame_optionalModules_notLoaded(self):
+		"""REQ-022: HTTP export and allocation tracing are only imported when used."""
+		code = ("import sys, game; "
+				"print(sorted({'urllib.request', 'tracemalloc', 'memtrack'} & set(sys.modules)))")
+		env = dict(os.environ, SDL_VIDEODRIVER="dummy")
+
+		output = subprocess.run([sys.executable, "-c", code], cwd=SRC_PATH, env=env,
+								capture_output=True, text=True, timeout=60).stdout
+
+		assert output.strip().splitlines()[-1] == "[]"
+
+	def testMain_bootBench_reportsFirstFrameAndQuits(self, monkeypatch, capsys):
+		"""REQ-022: The entry point reports time to first frame and stops after it."""
+		monkeypatch.setenv("EMOJI_FLAPPY_BOOTBENCH", "1")
+
+		asyncio.run(main.main())
+
+		assert "[BOOT] First frame after" in capsys.readouterr().out
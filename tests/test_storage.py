@@ -0,0 +1,108 @@
+"""
+Tests for score persistence.
+REQ-012: High score survives relaunch; writes are batched; corrupt files recover.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import asyncio
+import json
+import pytest
+from game import Game
+from storage import ScoreStore
+
+
+class TestStorage:
+	"""Test persistent high score store."""
+	
+	def testRecordRun_beforeFlush_nothingWritten(self, tmp_path):
+		"""REQ-012: Recording a run only queues it."""
+		path = tmp_path / "scores.jsonl"
+		store = ScoreStore(path=str(path))
+		
+		store.recordRun(7, 3.5)
+		
+		assert store.high_score == 7
+		assert store.hasPending() is True
+		assert not path.exists()
+	
+	def testFlush_relaunch_highScoreAndStatsRestored(self, tmp_path):
+		"""REQ-012: Flushed runs are loaded by a new store."""
+		path = str(tmp_path / "scores.jsonl")
+		store = ScoreStore(path=path)
+		store.recordRun(12, 10.0)
+		store.recordRun(5, 4.0)
+		store.flush()
+		
+		reloaded = ScoreStore(path=path)
+		
+		assert reloaded.high_score == 12
+		assert reloaded.stats["runs"] == 2
+		assert reloaded.stats["total_score"] == 17
+		assert store.hasPending() is False
+	
+	def testLoad_corruptAndPartialLines_validRecordsKept(self, tmp_path):
+		"""REQ-012: Garbage and a half-written last line are skipped safely."""
+		path = tmp_path / "scores.jsonl"
+		path.write_text(
+			json.dumps({"type": "run", "score": 9, "duration": 2.0}) + "\n"
+			+ "not json at all\n"
+			+ '{"type": "run", "sco'
+		)
+		
+		store = ScoreStore(path=str(path))
+		store.recordRun(3, 1.0)
+		store.flush()
+		reloaded = ScoreStore(path=str(path))
+		
+		assert reloaded.high_score == 9
+		assert reloaded.stats["runs"] == 2
+	
+	def testFlush_manyRuns_compactedToSummary(self, tmp_path, monkeypatch):
+		"""REQ-012: Long files are compacted without losing stats."""
+		import storage
+		monkeypatch.setattr(storage, "SCORE_COMPACT_LINES", 5)
+		path = tmp_path / "scores.jsonl"
+		store = ScoreStore(path=str(path))
+		
+		for score in range(8):
+			store.recordRun(score, 1.0)
+			store.flush()
+		reloaded = ScoreStore(path=str(path))
+		
+		assert len(path.read_text().splitlines()) <= 5
+		assert reloaded.high_score == 7
+		assert reloaded.stats["runs"] == 8
+	
+	def testGameOver_scheduledFlush_highScorePersisted(self):
+		"""REQ-012: A finished run is saved off the frame path and reloaded."""
+		game = Game()
+		game.score = 4
+		game.game_over = True
+		game.onGameOver()
+		
+		async def flushInBackground():
+			game.score_store.scheduleFlush()
+			await game.score_store.flush_task
+		asyncio.run(flushInBackground())
+		
+		assert Game().high_score == 4
+	
+	def testClose_flushInFlight_awaitedThenRemainderWritten(self, tmp_path):
+		"""REQ-012: Closing waits for the background flush before the final write."""
+		path = str(tmp_path / "scores.jsonl")
+		store = ScoreStore(path=path)
+		
+		async def quit():
+			store.recordRun(3, 1.0)
+			store.scheduleFlush()
+			task = store.flush_task
+			store.recordRun(8, 1.0)
+			await store.close()
+			return task.done()
+		
+		assert asyncio.run(quit()) is True
+		assert store.hasPending() is False
+		assert ScoreStore(path=path).stats["runs"] == 2
@@ -0,0 +1,184 @@
+"""
+Tests for gameplay telemetry.
+REQ-013: Death causes are recorded, the ring buffer stays bounded and batches export.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import pytest
+from game import Game, Obstacle
+from telemetry import (
+	Telemetry, RingBuffer, FileExporter, HttpExporter,
+	CAUSE_CEILING, CAUSE_FLOOR, CAUSE_TOP_PIPE, CAUSE_BOTTOM_PIPE
+)
+
+
+def lastDeath(game):
+	"""Drain telemetry and return the most recent death event."""
+	deaths = [e for e in game.telemetry.drainEvents() if e["event"] == "death"]
+	return deaths[-1]
+
+
+class TestTelemetry:
+	"""Test telemetry recording and export."""
+	
+	def testRingBuffer_overCapacity_oldestDropped(self):
+		"""REQ-013: The buffer never grows past its capacity."""
+		buffer = RingBuffer(4)
+		
+		for i in range(10):
+			buffer.push(i)
+		
+		assert len(buffer) == 4
+		assert buffer.dropped == 6
+		assert buffer.drain() == [6, 7, 8, 9]
+		assert len(buffer) == 0
+	
+	def testDeathCause_boundaries_ceilingAndFloor(self):
+		"""REQ-013: Boundary deaths report ceiling or floor."""
+		game = Game()
+		game.player.y = -10
+		game.update(0.016)
+		assert lastDeath(game)["cause"] == CAUSE_CEILING
+		
+		game.restart()
+		game.player.y = game.screen_height + 100
+		game.update(0.016)
+		assert lastDeath(game)["cause"] == CAUSE_FLOOR
+	
+	def testDeathCause_obstacles_topAndBottomPipe(self):
+		"""REQ-013: Obstacle deaths report which pipe was hit."""
+		game = Game()
+		obstacle = Obstacle(game.player.x, game.screen_height)
+		obstacle.gap_top = game.player.y + 100
+		obstacle.gap_bottom = game.player.y + 300
+		game.obstacles.append(obstacle)
+		game.update(0.016)
+		assert lastDeath(game)["cause"] == CAUSE_TOP_PIPE
+		
+		game.restart()
+		obstacle.gap_top = 0
+		obstacle.gap_bottom = game.player.y - 100
+		game.obstacles.append(obstacle)
+		game.update(0.016)
+		assert lastDeath(game)["cause"] == CAUSE_BOTTOM_PIPE
+	
+	def testExport_fileTarget_batchedNdjson(self, tmp_path):
+		"""REQ-013: Events export as NDJSON in batch-sized writes."""
+		path = tmp_path / "events.ndjson"
+		writes = []
+		
+		class CountingExporter(FileExporter):
+			def send(self, lines):
+				writes.append(lines)
+				super().send(lines)
+		
+		telemetry = Telemetry(exporter=CountingExporter(str(path)), batch_size=2)
+		telemetry.recordFrame(0.016)
+		telemetry.recordFrame(0.050)
+		telemetry.recordDeath(CAUSE_FLOOR, 3, 1.5)
+		telemetry.recordRestart(3)
+		telemetry.recordDeath(CAUSE_TOP_PIPE, 1, 0.5)
+		
+		telemetry.export()
+		events = [json.loads(line) for line in path.read_text().splitlines()]
+		
+		assert len(writes) == 2
+		assert [e["event"] for e in events] == ["death", "restart", "death"]
+		assert events[0]["frames"] == 2
+		assert events[0]["max_frame_ms"] == 50.0
+		assert events[0]["slow_frames"] == 1
+		assert events[2]["frames"] == 0
+		assert len(telemetry.buffer) == 0
+	
+	def testExport_failedSend_remainderRetriedNextExport(self, capsys):
+		"""REQ-013: Batches left by a failed export are sent first by the next one."""
+		sent = []
+		
+		class FlakyExporter:
+			fail = True
+			
+			def send(self, lines):
+				if self.fail:
+					self.fail = False
+					raise OSError("collector down")
+				sent.append(lines)
+		
+		telemetry = Telemetry(exporter=FlakyExporter(), batch_size=1)
+		telemetry.recordDeath(CAUSE_FLOOR, 1, 1.0)
+		telemetry.recordDeath(CAUSE_FLOOR, 2, 1.0)
+		telemetry.export()
+		kept = len(telemetry.unsent)
+		telemetry.recordDeath(CAUSE_FLOOR, 3, 1.0)
+		telemetry.export()
+		
+		assert kept == 2
+		assert [json.loads(lines)["score"] for lines in sent] == [1, 2, 3]
+		assert telemetry.hasUnexported() is False
+		assert "2 batches kept" in capsys.readouterr().out
+	
+	def testClose_exportInFlight_awaitedThenRemainderSent(self):
+		"""REQ-013: Closing waits for the background export, so retried events keep their order."""
+		sent = []
+		
+		class SlowFlakyExporter:
+			fail = True
+			
+			def send(self, lines):
+				if self.fail:
+					self.fail = False
+					time.sleep(0.05)
+					raise OSError("collector down")
+				sent.append(lines)
+		
+		telemetry = Telemetry(exporter=SlowFlakyExporter(), batch_size=1)
+		
+		async def quit():
+			telemetry.recordDeath(CAUSE_FLOOR, 1, 1.0)
+			telemetry.recordDeath(CAUSE_FLOOR, 2, 1.0)
+			telemetry.scheduleExport()
+			await asyncio.sleep(0)  # let the export drain the buffer
+			telemetry.recordDeath(CAUSE_FLOOR, 3, 1.0)
+			await telemetry.close()
+		
+		asyncio.run(quit())
+		
+		assert [json.loads(lines)["score"] for lines in sent] == [1, 2, 3]
+		assert telemetry.hasUnexported() is False
+	
+	def testExport_httpStandIn_eventsPosted(self):
+		"""REQ-013: Events can be posted to a local HTTP collector."""
+		received = []
+		
+		class Collector(BaseHTTPRequestHandler):
+			def do_POST(self):
+				length = int(self.headers["Content-Length"])
+				received.append(self.rfile.read(length).decode("utf-8"))
+				self.send_response(204)
+				self.end_headers()
+			
+			def log_message(self, *args):
+				pass
+		
+		server = HTTPServer(("127.0.0.1", 0), Collector)
+		thread = threading.Thread(target=server.handle_request)
+		thread.start()
+		try:
+			url = f"http://127.0.0.1:{server.server_port}/events"
+			telemetry = Telemetry(exporter=HttpExporter(url))
+			telemetry.recordDeath(CAUSE_BOTTOM_PIPE, 8, 12.0)
+			telemetry.export()
+			thread.join(timeout=5)
+		finally:
+			server.server_close()
+		
+		event = json.loads(received[0])
+		assert event["cause"] == CAUSE_BOTTOM_PIPE
+		assert event["score"] == 8
@@ -0,0 +1,120 @@
+"""
+Tests for hot-reloadable tuning.
+REQ-020: Tuning snapshots precompute derived values, invalid overrides are
+ignored and a changed tuning file is applied to a running game.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import json
+import random
+from game import Game, Obstacle
+from tuning import Tuning, TuningWatcher, DEFAULT_TUNING
+from difficulty import DifficultyCurve
+from render import RenderQueue, LAYER_OBSTACLES
+from config import (
+	PHYSICS_TICK_RATE, G, SCROLL_SPEED, GAP_SIZE_RANGE, SCREEN_HEIGHT, TUNING_MAX_SPEED
+)
+
+
+def writeTuning(path, overrides, mtime):
+	"""Write an overrides file with an explicit modification time."""
+	path.write_text(json.dumps(overrides), encoding="utf-8")
+	os.utime(path, (mtime, mtime))
+
+
+class TestTuning:
+	"""Test tuning snapshots and live reloads."""
+
+	def testTuning_defaults_matchConfigAndGapArithmetic(self):
+		"""REQ-020: The stock tuning equals config.py and its gap bounds equal REQ-003's."""
+		assert DEFAULT_TUNING.g == G
+		assert DEFAULT_TUNING.scroll_speed == SCROLL_SPEED
+		for gap_size in range(GAP_SIZE_RANGE[0], GAP_SIZE_RANGE[1] + 1):
+			expected = (gap_size // 2 + 50, SCREEN_HEIGHT - gap_size // 2 - 50)
+			assert DEFAULT_TUNING.getGapBounds(gap_size) == expected
+
+	def testTuning_invalidOverrides_raiseValueError(self):
+		"""REQ-020: Unknown keys, wrong types, non-finite, huge and impossible values fail."""
+		for overrides in ({"GRAVITY": 1}, {"G": "heavy"}, {"GAP_SIZE_RANGE": [300, 200]},
+						  {"GAP_SIZE_RANGE": [400, SCREEN_HEIGHT]}, {"V_MAX_UP": 10},
+						  {"G": float("inf")}, {"V_FLAP": float("nan")}, {"G": 10 ** 400},
+						  {"SCROLL_SPEED": 1e12}, {"SPAWN_INTERVAL_RANGE": [1000, 10 ** 9]},
+						  {"SPAWN_INTERVAL_RANGE": [1000, float("inf")]}):
+			try:
+				Tuning(overrides)
+			except ValueError:
+				continue
+			raise AssertionError(f"accepted {overrides}")
+
+	def testPollTuning_fileChanged_appliedToRunningGame(self, tmp_path):
+		"""REQ-020: Editing the tuning file changes the running game between frames."""
+		path = tmp_path / "tuning.json"
+		writeTuning(path, {"G": 1000}, 1000)
+		game = Game()
+		game.tuning_watcher = TuningWatcher(str(path), interval=0)
+
+		game.pollTuning()
+		first = game.tuning
+		game.pollTuning()  # unchanged file keeps the same snapshot
+		writeTuning(path, {"G": 3000}, 2000)
+		game.pollTuning()
+
+		assert first.g == 1000
+		assert game.tuning is not first
+		assert game.tuning.g == 3000
+		assert game.player.tuning is game.tuning
+
+	def testPollTuning_invalidFile_keepsCurrentTuning(self, tmp_path):
+		"""REQ-020: A broken edit is reported and the game keeps its tuning."""
+		path = tmp_path / "tuning.json"
+		path.write_text("{not json", encoding="utf-8")
+		game = Game()
+		game.tuning_watcher = TuningWatcher(str(path), interval=0)
+
+		game.pollTuning()
+
+		assert game.tuning is DEFAULT_TUNING
+
+	def testReload_nonFiniteOrHugeValues_ignored(self, tmp_path):
+		"""REQ-020: Infinity from the JSON decoder or out-of-range values never reach the game."""
+		path = tmp_path / "tuning.json"
+		watcher = TuningWatcher(str(path), interval=0)
+		for text in ('{"G": Infinity}', '{"G": 1e999}', '{"SCROLL_SPEED": 1e300}',
+					 '{"SPAWN_INTERVAL_RANGE": [1000, 1e999]}'):
+			path.write_text(text, encoding="utf-8")
+			assert watcher.reload() is None
+
+	def testDifficulty_baseAtSpeedLimit_everyTierBuilds(self):
+		"""REQ-020, REQ-021: The progression never scrolls faster than a valid tuning allows."""
+		curve = DifficultyCurve(Tuning({"SCROLL_SPEED": TUNING_MAX_SPEED}))
+
+		assert curve.tiers[-1].tuning.scroll_speed == TUNING_MAX_SPEED
+
+	def testApplyTuning_existingEntities_useNewValues(self):
+		"""REQ-020: Live obstacles and the reach envelope pick up a new tuning."""
+		game = Game()
+		obstacle = Obstacle(400, game.screen_height)
+		game.obstacles = [obstacle]
+
+		game.applyTuning(Tuning({"SCROLL_SPEED": SCROLL_SPEED * 2}))
+		obstacle.update(0.5)
+
+		assert obstacle.x == 400 - SCROLL_SPEED
+		assert game.reachability.step == SCROLL_SPEED * 2 / PHYSICS_TICK_RATE
+
+	def testObstacle_tallerScreen_gapAndTilesUseItsHeight(self):
+		"""REQ-003, REQ-020: An obstacle built for another screen height places and draws for it."""
+		rng = random.Random(3)
+		gaps = [Obstacle(400, 800, rng=rng).gap_bottom for _ in range(200)]
+		obstacle = Obstacle(400, 800)
+		obstacle.gap_top, obstacle.gap_bottom = 100, 300
+		queue = RenderQueue()
+
+		obstacle.draw(queue)
+
+		assert max(gaps) > SCREEN_HEIGHT - 50
+		assert max(gaps) <= 800 - 50
+		assert max(y for _, (_, y) in queue.layers[LAYER_OBSTACLES]) >= SCREEN_HEIGHT
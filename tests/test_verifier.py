@@ -0,0 +1,140 @@
+"""
+Tests for score verification.
+REQ-019: Submissions from real runs verify, tampered ones are rejected, long
+runs verify within milliseconds and batches verify in parallel.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import json
+import time
+import pytest
+import server
+from game import Game
+from autopilot import Autopilot
+from reachability import stepPhysics
+from verifier import (
+	verifySubmission, verifyBatch, REASON_BAD_FLAPS, REASON_LENGTH_MISMATCH,
+	REASON_MALFORMED, REASON_SCORE_MISMATCH
+)
+from tuning import Tuning
+from config import PHYSICS_TICK_RATE, SCREEN_HEIGHT, SERVER_MAX_TICKS, TUNING_MAX_SPAWN_INTERVAL
+from conftest import WIDE_GAPS, seededGame
+
+
+def playSubmission(seconds, tuning=None):
+	"""Let the bot play for up to seconds, then stop flapping until the run ends."""
+	game = seededGame(tuning=tuning)
+	game.autopilot = Autopilot(game)
+	while not game.game_over and game.tick < seconds * PHYSICS_TICK_RATE:
+		game.update(1.0 / PHYSICS_TICK_RATE)
+	game.autopilot = None
+	while not game.game_over:
+		game.update(1.0 / PHYSICS_TICK_RATE)
+	return game.last_submission
+
+
+@pytest.fixture
+def submission():
+	"""Submission from a bot-played game that scored before crashing."""
+	submission = playSubmission(8, tuning=WIDE_GAPS)
+	assert submission["score"] > 0
+	return submission
+
+
+def hoverFlaps(ticks):
+	"""Flap log that keeps the player near the middle of the screen for ticks ticks."""
+	y, velocity, flaps = SCREEN_HEIGHT / 2, 0.0, []
+	for tick in range(ticks):
+		flap = y > SCREEN_HEIGHT / 2 and velocity > 0
+		if flap:
+			flaps.append(tick)
+		y, velocity = stepPhysics(y, velocity, flap, 1.0 / PHYSICS_TICK_RATE)
+	return flaps
+
+
+class TestVerifier:
+	"""Test re-simulation based score verification."""
+
+	def testVerify_gameSubmission_valid(self, submission):
+		"""REQ-019: A genuine run verifies with the claimed score and length."""
+		result = verifySubmission(submission, WIDE_GAPS)
+
+		assert result["valid"] is True
+		assert result["score"] == submission["score"]
+		assert result["ticks"] == submission["ticks"]
+
+	def testVerify_tamperedSubmissions_rejected(self, submission):
+		"""REQ-019: Inflated scores, edited flap logs and junk are rejected."""
+		inflated = dict(submission, score=submission["score"] + 5)
+		edited = dict(submission, flaps=submission["flaps"][:-3])
+		reordered = dict(submission, flaps=list(reversed(submission["flaps"])))
+
+		assert verifySubmission(inflated, WIDE_GAPS)["reason"] == REASON_SCORE_MISMATCH
+		assert verifySubmission(edited, WIDE_GAPS)["reason"] == REASON_LENGTH_MISMATCH
+		assert verifySubmission(reordered, WIDE_GAPS)["reason"] == REASON_BAD_FLAPS
+		assert verifySubmission({"seed": 1})["reason"] == REASON_MALFORMED
+		assert verifySubmission(None)["reason"] == REASON_MALFORMED
+
+	def testVerify_nonFiniteNumbers_malformedNotRaised(self, submission):
+		"""REQ-019: Infinity or NaN from the JSON decoder is a malformed submission."""
+		decoded = json.loads('{"seed": 1e999, "flaps": [], "ticks": 60, "score": 0}')
+		submissions = [decoded, dict(submission, ticks=float("inf")),
+					   dict(submission, flaps=[float("nan")]),
+					   dict(submission, score=float("-inf"))]
+
+		results = verifyBatch(submissions, workers=1)
+
+		assert [result["reason"] for result in results] == [REASON_MALFORMED] * 4
+
+	def testGameOver_unreplayableRuns_notSubmitted(self, monkeypatch):
+		"""REQ-019: Racing runs and runs retuned part-way are not submitted."""
+		monkeypatch.setenv("EMOJI_FLAPPY_RACERS", "2")
+		racing = Game()
+		monkeypatch.delenv("EMOJI_FLAPPY_RACERS")
+		retuned = Game()
+		for game in (racing, retuned):
+			game.update(1.0 / PHYSICS_TICK_RATE)
+		retuned.applyTuning(WIDE_GAPS)
+		for game in (racing, retuned):
+			while not game.game_over:
+				game.update(1.0 / PHYSICS_TICK_RATE)
+
+		assert len(racing.players) == 2
+		assert racing.last_submission is None
+		assert retuned.last_submission is None
+
+		retuned.restart()
+		while not retuned.game_over:
+			retuned.update(1.0 / PHYSICS_TICK_RATE)
+		assert verifySubmission(retuned.last_submission, WIDE_GAPS)["valid"]
+
+	def testVerify_tenMinuteRun_withinMilliseconds(self):
+		"""REQ-019: The longest accepted run re-simulates in well under a second."""
+		no_obstacles = Tuning({"SPAWN_INTERVAL_RANGE": [TUNING_MAX_SPAWN_INTERVAL] * 2})
+		flaps = hoverFlaps(SERVER_MAX_TICKS - 2 * PHYSICS_TICK_RATE)
+		session = server.Session(1, flaps, tuning=no_obstacles)
+		session.advance(SERVER_MAX_TICKS)
+		claim = {"seed": 1, "flaps": flaps, "ticks": session.tick, "score": 0}
+
+		start = time.perf_counter()
+		result = verifySubmission(claim, no_obstacles)
+		elapsed = time.perf_counter() - start
+
+		assert result["valid"] is True
+		assert session.tick > 9 * 60 * PHYSICS_TICK_RATE
+		assert elapsed < 0.25
+
+	def testVerifyBatch_workerProcesses_matchInline(self):
+		"""REQ-019: Parallel batch verification returns the same results in order."""
+		# Worker processes load the stock config, so the run uses default gaps
+		submission = playSubmission(4)
+		batch = [submission, dict(submission, score=submission["score"] + 1), {"seed": 2}] * 4
+
+		inline = verifyBatch(batch, workers=1)
+		parallel = verifyBatch(batch, workers=2, chunk_size=2)
+
+		assert parallel == inline
+		assert [r["valid"] for r in inline[:3]] == [True, False, False]